@@ -1,17 +1,32 @@
 """Async utilities for subprocess management and resource cleanup."""
 
 import asyncio
+import atexit
 import logging
 import os
+import secrets
+import shutil
 import signal
+import sys
 import tempfile
 import threading
+from collections import deque
 from pathlib import Path
-from typing import Callable, Awaitable
+from typing import BinaryIO, Callable, Awaitable, TypeVar
 from urllib.parse import quote
 
+if sys.version_info >= (3, 11):
+    from asyncio import timeout as _timeout
+else:
+    from async_timeout import timeout as _timeout
+
 logger = logging.getLogger(__name__)
 
+# Amount of stderr kept by converters that only report it on failure.
+STDERR_TAIL_BYTES = 8192
+
+T = TypeVar("T")
+
 
 class ConcurrencyLimiter:
     """Semaphore-based concurrency control for conversions."""
@@ -19,6 +34,7 @@ class ConcurrencyLimiter:
     def __init__(self, max_concurrent: int = 4):
         self._max_concurrent = max_concurrent
         self._local = threading.local()
+        self._cached: tuple[asyncio.AbstractEventLoop, asyncio.Semaphore] | None = None
 
     async def acquire(self):
         """Acquire the semaphore."""
@@ -31,6 +47,13 @@ class ConcurrencyLimiter:
         sem = self._get_semaphore()
         sem.release()
 
+    async def gather(self, *coros: Awaitable[T]) -> list[T]:
+        """Run awaitables concurrently, at most max_concurrent at a time.
+
+        Results are returned in argument order, as with asyncio.gather.
+        """
+        return await _gather_limited(self._get_semaphore(), coros)
+
     async def __aenter__(self):
         """Async context manager entry."""
         await self.acquire()
@@ -41,20 +64,52 @@ class ConcurrencyLimiter:
         self.release()
 
     def _get_semaphore(self) -> asyncio.Semaphore:
-        """Get semaphore for current event loop."""
-        import threading
+        """Get semaphore for current event loop.
 
+        The semaphore of the most recently used loop is cached so the common
+        single-loop case skips the per-thread lookup entirely.
+        """
         try:
             loop = asyncio.get_running_loop()
-            loop_id = id(loop)
-            if not hasattr(self._local, "semaphores"):
-                self._local.semaphores = {}
-            if loop_id not in self._local.semaphores:
-                self._local.semaphores[loop_id] = asyncio.Semaphore(self._max_concurrent)
-            return self._local.semaphores[loop_id]
         except RuntimeError:
             return asyncio.Semaphore(self._max_concurrent)
 
+        cached = self._cached
+        if cached is not None and cached[0] is loop:
+            return cached[1]
+
+        loop_id = id(loop)
+        if not hasattr(self._local, "semaphores"):
+            self._local.semaphores = {}
+        if loop_id not in self._local.semaphores:
+            self._local.semaphores[loop_id] = asyncio.Semaphore(self._max_concurrent)
+        sem = self._local.semaphores[loop_id]
+        self._cached = (loop, sem)
+        return sem
+
+
+async def _gather_limited(sem: asyncio.Semaphore, coros: tuple[Awaitable[T], ...]) -> list[T]:
+    """Gather awaitables with each one holding sem while it runs."""
+
+    async def run(coro: Awaitable[T]) -> T:
+        async with sem:
+            return await coro
+
+    return await asyncio.gather(*(run(coro) for coro in coros))
+
+
+async def semaphore_gather(limit: int, *coros: Awaitable[T]) -> list[T]:
+    """Run awaitables concurrently through a single semaphore of size limit.
+
+    Args:
+        limit: Maximum number of awaitables running at once.
+        *coros: Awaitables to run.
+
+    Returns:
+        Results in argument order.
+    """
+    return await _gather_limited(asyncio.Semaphore(limit), coros)
+
 
 class SubprocessTimeoutError(RuntimeError):
     """Raised when a subprocess times out."""
@@ -78,13 +133,73 @@ class SubprocessError(RuntimeError):
         super().__init__(msg)
 
 
+async def _wait_for_exit(proc: asyncio.subprocess.Process, timeout: float) -> None:
+    """Wait for a process to exit without relying on the child watcher.
+
+    On Linux a pidfd becomes readable as soon as the child exits, so the
+    event loop is woken directly instead of going through SIGCHLD handling.
+    Falls back to ``proc.wait()`` where pidfds are unavailable. Reaping is
+    still left to asyncio; callers should ``await proc.wait()`` afterwards.
+
+    Raises:
+        asyncio.TimeoutError: If the process is still running after timeout.
+    """
+    pidfd_open = getattr(os, "pidfd_open", None)
+    if pidfd_open is None:
+        async with _timeout(timeout):
+            await proc.wait()
+        return
+
+    try:
+        pidfd = pidfd_open(proc.pid)
+    except ProcessLookupError:
+        return
+    except OSError:
+        async with _timeout(timeout):
+            await proc.wait()
+        return
+
+    loop = asyncio.get_running_loop()
+    exited = loop.create_future()
+
+    def _on_exit() -> None:
+        if not exited.done():
+            exited.set_result(None)
+
+    loop.add_reader(pidfd, _on_exit)
+    try:
+        async with _timeout(timeout):
+            await exited
+    finally:
+        loop.remove_reader(pidfd)
+        os.close(pidfd)
+
+
+async def _read_tail(stream: asyncio.StreamReader, limit: int) -> bytes:
+    """Read a stream to EOF, keeping only the last limit bytes (nothing if limit <= 0)."""
+    if limit <= 0:
+        # del tail[:-0] would be a no-op, so drain without buffering instead
+        while await stream.read(65536):
+            pass
+        return b""
+
+    tail = bytearray()
+    while chunk := await stream.read(65536):
+        tail += chunk
+        if len(tail) > limit:
+            del tail[:-limit]
+    return bytes(tail)
+
+
 async def safe_subprocess(
     cmd: list[str],
     timeout: int = 1800,
     progress_callback: Callable[[float], Awaitable[None]] | None = None,
     check_returncode: bool = True,
     capture_output: bool = True,
-) -> tuple[int, str, str]:
+    stderr_tail_bytes: int | None = None,
+    decode: bool = True,
+) -> tuple[int, str | bytes, str | bytes]:
     """Run subprocess with timeout and zombie prevention.
 
     Args:
@@ -92,7 +207,11 @@ async def safe_subprocess(
         timeout: Maximum time in seconds before the process is killed.
         progress_callback: Optional callback for progress updates (0.0 to 1.0).
         check_returncode: If True, raise SubprocessError on non-zero exit.
-        capture_output: If True, capture stdout and stderr.
+        capture_output: If True, capture stdout and stderr; otherwise discard them.
+        stderr_tail_bytes: If set, discard stdout and keep only the last
+            stderr_tail_bytes of stderr. For callers that only need stderr
+            for error messages.
+        decode: If False, return stdout and stderr as raw bytes.
 
     Returns:
         Tuple of (returncode, stdout, stderr).
@@ -101,33 +220,51 @@ async def safe_subprocess(
         SubprocessTimeoutError: If the process exceeds the timeout.
         SubprocessError: If check_returncode is True and process fails.
     """
-    if capture_output:
+    # Keep spawn arguments free of preexec_fn/user/group options: without them
+    # CPython (3.10+) starts the child with vfork() rather than fork(), so
+    # spawn cost does not grow with the size of this process.
+    if not capture_output:
+        # Never let the child write to our stdio: on the stdio transport that
+        # stream carries the MCP protocol.
         proc = await asyncio.create_subprocess_exec(
             *cmd,
-            stdout=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+    elif stderr_tail_bytes is not None:
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.DEVNULL,
             stderr=asyncio.subprocess.PIPE,
         )
     else:
-        proc = await asyncio.create_subprocess_exec(*cmd)
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
 
     try:
-        if capture_output:
-            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=timeout)
-            returncode = proc.returncode or 0
-            stdout_str = stdout.decode() if stdout else ""
-            stderr_str = stderr.decode() if stderr else ""
+        if capture_output and stderr_tail_bytes is not None:
+            async with _timeout(timeout):
+                stderr = await _read_tail(proc.stderr, stderr_tail_bytes)
+                await proc.wait()
+            stdout = b""
+        elif capture_output:
+            async with _timeout(timeout):
+                stdout, stderr = await proc.communicate()
         else:
-            await asyncio.wait_for(proc.wait(), timeout=timeout)
-            returncode = proc.returncode or 0
-            stdout_str = ""
-            stderr_str = ""
+            async with _timeout(timeout):
+                await proc.wait()
+            stdout = stderr = b""
+        returncode = proc.returncode or 0
     except asyncio.TimeoutError:
         try:
             proc.kill()
         except ProcessLookupError:
             pass
         try:
-            await asyncio.wait_for(proc.wait(), timeout=5.0)
+            await _wait_for_exit(proc, timeout=5.0)
         except asyncio.TimeoutError:
             logger.warning(f"Process {cmd[0]} did not terminate after kill, PID: {proc.pid}")
         raise SubprocessTimeoutError(cmd, timeout) from None
@@ -139,9 +276,11 @@ async def safe_subprocess(
                 logger.warning(f"Failed to wait for process {cmd[0]}: {e}")
 
     if check_returncode and returncode != 0:
-        raise SubprocessError(cmd, returncode, stderr_str)
+        raise SubprocessError(cmd, returncode, stderr.decode(errors="replace"))
 
-    return returncode, stdout_str, stderr_str
+    if not decode:
+        return returncode, stdout, stderr
+    return returncode, stdout.decode(), stderr.decode(errors="replace")
 
 
 class TempFileManager:
@@ -156,28 +295,52 @@ class TempFileManager:
         self._suffix = suffix
         self._prefix = prefix
         self._dir_path = Path(dir_path) if dir_path else None
-        self._temp_files: list[Path] = []
+        self._dir_str = str(self._dir_path) if self._dir_path else None
+        # Tracked as plain strings and removed with os.unlink, skipping pathlib per entry
+        self._temp_files: list[str] = []
         self._temp_dirs: list[Path] = []
+        self._anonymous_files: list[BinaryIO] = []
 
     def create_file(self) -> Path:
         """Create a new temp file and track it for cleanup."""
-        fd, path = tempfile.mkstemp(
-            suffix=self._suffix,
-            prefix=self._prefix,
-            dir=str(self._dir_path) if self._dir_path else None,
-        )
+        fd, path = tempfile.mkstemp(suffix=self._suffix, prefix=self._prefix, dir=self._dir_str)
         os.close(fd)
-        temp_path = Path(path)
-        self._temp_files.append(temp_path)
-        return temp_path
+        self._temp_files.append(path)
+        return Path(path)
+
+    def create_file_batch(self, count: int) -> list[Path]:
+        """Create several temp files at once and track them for cleanup.
+
+        Args:
+            count: Number of temp files to create.
+
+        Returns:
+            List of created temp file paths.
+        """
+        paths = []
+        for _ in range(count):
+            fd, path = tempfile.mkstemp(suffix=self._suffix, prefix=self._prefix, dir=self._dir_str)
+            # Track each file at once, so a failure partway through still cleans it up
+            self._temp_files.append(path)
+            os.close(fd)
+            paths.append(Path(path))
+        return paths
+
+    def create_anonymous_file(self) -> BinaryIO:
+        """Open a scratch file that has no directory entry and track it for cleanup.
+
+        On Linux the file is created with O_TMPFILE, so no name is ever linked
+        into the directory and closing it is the whole cleanup; elsewhere it is
+        unlinked right after creation. Use create_file() instead when a tool
+        needs a path or an extension to detect the format.
+        """
+        handle = tempfile.TemporaryFile(dir=self._dir_str)
+        self._anonymous_files.append(handle)
+        return handle
 
     def create_dir(self) -> Path:
         """Create a new temp directory and track it for cleanup."""
-        path = tempfile.mkdtemp(
-            prefix=self._prefix,
-            dir=str(self._dir_path) if self._dir_path else None,
-        )
-        temp_path = Path(path)
+        temp_path = Path(tempfile.mkdtemp(prefix=self._prefix, dir=self._dir_str))
         self._temp_dirs.append(temp_path)
         return temp_path
 
@@ -185,24 +348,22 @@ class TempFileManager:
         """Clean up all tracked temp files and directories."""
         for path in self._temp_files:
             try:
-                if path.exists():
-                    path.unlink()
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
             except Exception as e:
                 logger.warning(f"Failed to cleanup file {path}: {e}")
         self._temp_files.clear()
 
+        for handle in self._anonymous_files:
+            handle.close()
+        self._anonymous_files.clear()
+
         for path in self._temp_dirs:
             try:
-                if path.exists():
-                    for item in path.iterdir():
-                        if item.is_file():
-                            item.unlink()
-                        elif item.is_dir():
-                            for sub_item in item.rglob("*"):
-                                if sub_item.is_file():
-                                    sub_item.unlink()
-                            item.rmdir()
-                    path.rmdir()
+                shutil.rmtree(path)
+            except FileNotFoundError:
+                pass
             except Exception as e:
                 logger.warning(f"Failed to cleanup dir {path}: {e}")
         self._temp_dirs.clear()
@@ -248,8 +409,8 @@ async def cleanup_orphaned_processes(pattern: str = "ffmpeg|ebook-convert"):
         cmd = ["pkill", "-f", pattern]
         proc = await asyncio.create_subprocess_exec(
             *cmd,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.DEVNULL,
         )
         await proc.wait()
         if proc.returncode == 0:
@@ -260,10 +421,54 @@ async def cleanup_orphaned_processes(pattern: str = "ffmpeg|ebook-convert"):
         logger.warning(f"Failed to cleanup orphaned processes: {e}")
 
 
-import os as _os
+DEFAULT_MAX_CONCURRENT = min(4, os.cpu_count() or 4)
+concurrency_limiter = ConcurrencyLimiter(DEFAULT_MAX_CONCURRENT)
+
+# Empty symlink directories kept around for reuse by SafePathHandler.
+_SAFE_DIR_POOL_MAX = 4
+_safe_dir_pool: deque[Path] = deque()
+_safe_dir_pool_lock = threading.Lock()
+
 
-_default_concurrent = min(4, _os.cpu_count() or 4)
-concurrency_limiter = ConcurrencyLimiter(_default_concurrent)
+def _rent_safe_dir() -> Path:
+    """Take a symlink directory from the pool, creating one if none is available."""
+    with _safe_dir_pool_lock:
+        while _safe_dir_pool:
+            path = _safe_dir_pool.pop()
+            if path.is_dir():
+                return path
+    return Path(tempfile.mkdtemp(prefix="safe_path_"))
+
+
+def _return_safe_dir(path: Path) -> bool:
+    """Give an empty symlink directory back to the pool.
+
+    Returns:
+        True if the directory was pooled, False if the pool is full.
+    """
+    with _safe_dir_pool_lock:
+        if len(_safe_dir_pool) >= _SAFE_DIR_POOL_MAX:
+            return False
+        _safe_dir_pool.append(path)
+        return True
+
+
+def _is_dir_empty(path: Path) -> bool:
+    """Check whether a directory has no entries, stopping at the first one."""
+    with os.scandir(path) as entries:
+        return next(entries, None) is None
+
+
+@atexit.register
+def _drain_safe_dir_pool():
+    """Remove all pooled symlink directories."""
+    with _safe_dir_pool_lock:
+        while _safe_dir_pool:
+            path = _safe_dir_pool.popleft()
+            try:
+                path.rmdir()
+            except OSError as e:
+                logger.debug(f"Failed to remove pooled temp directory {path}: {e}")
 
 
 class SafePathHandler:
@@ -274,10 +479,17 @@ class SafePathHandler:
 
         Args:
             temp_dir: Optional temporary directory for symlinks.
-                      If None, uses system temp directory.
+                      If None, a pooled directory in the system temp directory
+                      is used and handed back to the pool on cleanup.
         """
-        self.temp_dir = Path(temp_dir) if temp_dir else Path(tempfile.mkdtemp(prefix="safe_path_"))
-        self.temp_dir.mkdir(parents=True, exist_ok=True)
+        if temp_dir:
+            self.temp_dir = Path(temp_dir)
+            self.temp_dir.mkdir(parents=True, exist_ok=True)
+            self._pooled = False
+        else:
+            self.temp_dir = _rent_safe_dir()
+            self._pooled = True
+        self._released = False
         self._created_symlinks: list[Path] = []
 
     def create_safe_symlink(self, original_path: Path | str) -> Path:
@@ -297,14 +509,13 @@ class SafePathHandler:
         if not original.exists():
             raise FileNotFoundError(f"Original file not found: {original}")
 
-        safe_name = quote(original.name, safe="")
+        # A random prefix keeps names unique without a pre-check, while
+        # preserving the extension that tools use to detect the format.
+        safe_name = f"{secrets.token_hex(4)}_{quote(original.name, safe='')}"
         symlink_path = self.temp_dir / safe_name
 
-        if symlink_path.exists():
-            symlink_path.unlink()
-
         try:
-            symlink_path.symlink_to(original)
+            os.symlink(original, symlink_path)
             self._created_symlinks.append(symlink_path)
             logger.debug(f"Created safe symlink: {original} -> {symlink_path}")
             return symlink_path
@@ -316,18 +527,28 @@ class SafePathHandler:
         """Clean up all created symlinks and temp directory."""
         for symlink in self._created_symlinks:
             try:
-                if symlink.is_symlink():
-                    symlink.unlink()
-                    logger.debug(f"Removed symlink: {symlink}")
+                symlink.unlink()
+                logger.debug(f"Removed symlink: {symlink}")
+            except FileNotFoundError:
+                pass
             except Exception as e:
                 logger.warning(f"Failed to remove symlink {symlink}: {e}")
 
         self._created_symlinks.clear()
 
+        if self._released:
+            return
+
         try:
-            if self.temp_dir.exists() and not any(self.temp_dir.iterdir()):
+            if _is_dir_empty(self.temp_dir):
+                if self._pooled and _return_safe_dir(self.temp_dir):
+                    self._released = True
+                    logger.debug(f"Returned temp directory to pool: {self.temp_dir}")
+                    return
                 self.temp_dir.rmdir()
                 logger.debug(f"Removed temp directory: {self.temp_dir}")
+        except FileNotFoundError:
+            pass
         except Exception as e:
             logger.warning(f"Failed to remove temp directory {self.temp_dir}: {e}")
 
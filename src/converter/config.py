@@ -1,16 +1,25 @@
 """Configuration management for the converter server."""
 
 import os
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
 
+from .async_utils import DEFAULT_MAX_CONCURRENT
+
+# Maps formats to field names rather than values, so timeouts changed after construction apply
+_FORMAT_TIMEOUT_FIELDS = {
+    **dict.fromkeys(("mp4", "avi", "mov", "webm", "mkv"), "video_timeout"),
+    **dict.fromkeys(("mp3", "wav", "flac", "aac", "ogg"), "audio_timeout"),
+    **dict.fromkeys(("epub", "pdf", "mobi", "azw3"), "ebook_timeout"),
+}
+
 
 @dataclass
 class ConverterConfig:
     """Configuration settings for the converter."""
 
-    max_concurrent: int = field(default_factory=lambda: min(4, os.cpu_count() or 4))
+    max_concurrent: int = DEFAULT_MAX_CONCURRENT
     default_output_dir: Optional[Path] = None
     min_disk_space_mb: int = 100
     default_quality: str = "medium"
@@ -41,9 +50,7 @@ class ConverterConfig:
     def from_env(cls) -> "ConverterConfig":
         """Load configuration from environment variables."""
         return cls(
-            max_concurrent=int(
-                os.environ.get("CONVERTER_MAX_CONCURRENT", min(4, os.cpu_count() or 4))
-            ),
+            max_concurrent=int(os.environ.get("CONVERTER_MAX_CONCURRENT", DEFAULT_MAX_CONCURRENT)),
             default_output_dir=Path(p) if (p := os.environ.get("CONVERTER_OUTPUT_DIR")) else None,
             min_disk_space_mb=int(os.environ.get("CONVERTER_MIN_DISK_SPACE_MB", 100)),
             default_quality=os.environ.get("CONVERTER_DEFAULT_QUALITY", "medium"),
@@ -57,16 +64,7 @@ class ConverterConfig:
 
     def get_timeout_for_format(self, format_name: str) -> int:
         """Get timeout for a specific format category."""
-        format_lower = format_name.lower()
-
-        if format_lower in ("mp4", "avi", "mov", "webm", "mkv"):
-            return self.video_timeout
-        elif format_lower in ("mp3", "wav", "flac", "aac", "ogg"):
-            return self.audio_timeout
-        elif format_lower in ("epub", "pdf", "mobi", "azw3"):
-            return self.ebook_timeout
-        else:
-            return self.image_timeout
+        return getattr(self, _FORMAT_TIMEOUT_FIELDS.get(format_name.lower(), "image_timeout"))
 
 
 config = ConverterConfig.from_env()
@@ -6,17 +6,29 @@ Supports conversions between common audio formats:
 """
 
 import asyncio
+import shutil
 from pathlib import Path
 from typing import Optional
 
-from ..async_utils import safe_subprocess, concurrency_limiter
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
+
+from ..async_utils import STDERR_TAIL_BYTES, safe_subprocess, concurrency_limiter
 from ..file_manager import FileManager
 from ..logging_config import ConversionError, FormatNotSupportedError, get_logger
 
 logger = get_logger("converters.audio")
 
-SUPPORTED_INPUT_FORMATS = {"mp3", "wav", "flac", "aac", "ogg", "m4a", "wma", "aiff"}
-SUPPORTED_OUTPUT_FORMATS = {"mp3", "wav", "flac", "aac", "ogg", "m4a"}
+# Resolved once so each spawn skips the PATH search.
+_FFMPEG = shutil.which("ffmpeg") or "ffmpeg"
+_FFPROBE = shutil.which("ffprobe") or "ffprobe"
+
+SUPPORTED_INPUT_FORMATS = frozenset({"mp3", "wav", "flac", "aac", "ogg", "m4a", "wma", "aiff"})
+SUPPORTED_OUTPUT_FORMATS = frozenset({"mp3", "wav", "flac", "aac", "ogg", "m4a"})
+# Listed in FormatNotSupportedError suggestions
+_OUTPUT_FORMATS_TEXT = ", ".join(sorted(SUPPORTED_OUTPUT_FORMATS))
 
 QUALITY_PRESETS = {
     "low": {"bitrate": "128k", "sample_rate": "44100"},
@@ -49,9 +61,9 @@ class AudioConverter:
         return format_lower in SUPPORTED_INPUT_FORMATS
 
     @staticmethod
-    def get_supported_formats() -> tuple[set, set]:
+    def get_supported_formats() -> tuple[frozenset, frozenset]:
         """Get supported input and output formats."""
-        return SUPPORTED_INPUT_FORMATS.copy(), SUPPORTED_OUTPUT_FORMATS.copy()
+        return SUPPORTED_INPUT_FORMATS, SUPPORTED_OUTPUT_FORMATS
 
     async def convert(
         self,
@@ -86,7 +98,7 @@ class AudioConverter:
         if not self.is_format_supported(target_format, for_output=True):
             raise FormatNotSupportedError(
                 f"Output format '{target_format}' is not supported",
-                suggestion=f"Supported formats: {', '.join(sorted(SUPPORTED_OUTPUT_FORMATS))}",
+                suggestion=f"Supported formats: {_OUTPUT_FORMATS_TEXT}",
             )
 
         if output_path is None:
@@ -104,12 +116,14 @@ class AudioConverter:
 
         async with concurrency_limiter:
             try:
-                returncode, stdout, stderr = await safe_subprocess(cmd, timeout=1800)
+                returncode, stdout, stderr = await safe_subprocess(
+                    cmd, timeout=1800, stderr_tail_bytes=STDERR_TAIL_BYTES, decode=False
+                )
 
                 if returncode != 0:
                     raise ConversionError(
                         f"Audio conversion failed",
-                        suggestion=f"Check if source file is valid. FFmpeg stderr: {stderr[-500:]}",
+                        suggestion=f"Check if source file is valid. FFmpeg stderr: {stderr[-500:].decode(errors='replace')}",
                     )
 
             except asyncio.TimeoutError:
@@ -130,8 +144,8 @@ class AudioConverter:
         target_format: str,
     ) -> list[str]:
         """Build FFmpeg command for audio conversion."""
-        cmd = [
-            "ffmpeg",
+        return [
+            _FFMPEG,
             "-y",
             "-i",
             str(source),
@@ -141,14 +155,10 @@ class AudioConverter:
             bitrate,
             "-ar",
             str(sample_rate),
+            *(("-id3v2_version", "3") if target_format == "mp3" else ()),
+            str(output),
         ]
 
-        if target_format == "mp3":
-            cmd.extend(["-id3v2_version", "3"])
-
-        cmd.append(str(output))
-        return cmd
-
     async def get_audio_info(self, source_path: str | Path) -> dict:
         """
         Get information about an audio file using ffprobe.
@@ -162,7 +172,7 @@ class AudioConverter:
         source = Path(source_path)
 
         cmd = [
-            "ffprobe",
+            _FFPROBE,
             "-v",
             "quiet",
             "-print_format",
@@ -172,11 +182,9 @@ class AudioConverter:
             str(source),
         ]
 
-        returncode, stdout, stderr = await safe_subprocess(cmd, timeout=30)
+        returncode, stdout, stderr = await safe_subprocess(cmd, timeout=30, decode=False)
 
         if returncode != 0:
-            raise ConversionError(f"Failed to get audio info: {stderr}")
-
-        import json
+            raise ConversionError(f"Failed to get audio info: {stderr.decode(errors='replace')}")
 
-        return json.loads(stdout)
+        return _json.loads(stdout)
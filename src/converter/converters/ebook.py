@@ -11,14 +11,27 @@ from pathlib import Path
 from typing import Optional
 from urllib.parse import quote
 
-from ..async_utils import safe_subprocess, concurrency_limiter, SafePathHandler
+from ..async_utils import (
+    STDERR_TAIL_BYTES,
+    safe_subprocess,
+    concurrency_limiter,
+    SafePathHandler,
+)
 from ..file_manager import FileManager
 from ..logging_config import ConversionError, FormatNotSupportedError, get_logger
 
 logger = get_logger("converters.ebook")
 
-SUPPORTED_INPUT_FORMATS = {"epub", "pdf", "mobi", "azw", "azw3", "txt", "rtf", "html", "docx"}
-SUPPORTED_OUTPUT_FORMATS = {"epub", "pdf", "mobi", "azw3", "txt"}
+# Resolved once so each spawn skips the PATH search.
+_EBOOK_CONVERT = shutil.which("ebook-convert") or "ebook-convert"
+_EBOOK_META = shutil.which("ebook-meta") or "ebook-meta"
+
+SUPPORTED_INPUT_FORMATS = frozenset(
+    {"epub", "pdf", "mobi", "azw", "azw3", "txt", "rtf", "html", "docx"}
+)
+SUPPORTED_OUTPUT_FORMATS = frozenset({"epub", "pdf", "mobi", "azw3", "txt"})
+# Listed in FormatNotSupportedError suggestions
+_OUTPUT_FORMATS_TEXT = ", ".join(sorted(SUPPORTED_OUTPUT_FORMATS))
 
 PAPER_SIZE_MAP = {
     "a4": "595x842",
@@ -89,9 +102,9 @@ class EbookConverter:
         return format_lower in SUPPORTED_INPUT_FORMATS
 
     @staticmethod
-    def get_supported_formats() -> tuple[set, set]:
+    def get_supported_formats() -> tuple[frozenset, frozenset]:
         """Get supported input and output formats."""
-        return SUPPORTED_INPUT_FORMATS.copy(), SUPPORTED_OUTPUT_FORMATS.copy()
+        return SUPPORTED_INPUT_FORMATS, SUPPORTED_OUTPUT_FORMATS
 
     async def convert(
         self,
@@ -128,7 +141,7 @@ class EbookConverter:
         if not self.is_format_supported(target_format, for_output=True):
             raise FormatNotSupportedError(
                 f"Output format '{target_format}' is not supported",
-                suggestion=f"Supported formats: {', '.join(sorted(SUPPORTED_OUTPUT_FORMATS))}",
+                suggestion=f"Supported formats: {_OUTPUT_FORMATS_TEXT}",
             )
 
         if output_path is None:
@@ -143,12 +156,14 @@ class EbookConverter:
         try:
             async with concurrency_limiter:
                 try:
-                    returncode, stdout, stderr = await safe_subprocess(cmd, timeout=600)
+                    returncode, stdout, stderr = await safe_subprocess(
+                        cmd, timeout=600, stderr_tail_bytes=STDERR_TAIL_BYTES, decode=False
+                    )
 
                     if returncode != 0:
                         raise ConversionError(
                             f"Ebook conversion failed",
-                            suggestion=f"Check if Calibre is installed and source file is valid. stderr: {stderr[-500:]}",
+                            suggestion=f"Check if Calibre is installed and source file is valid. stderr: {stderr[-500:].decode(errors='replace')}",
                         )
 
                 except asyncio.TimeoutError:
@@ -175,32 +190,43 @@ class EbookConverter:
         pdf_margin: Optional[str],
     ) -> list[str]:
         """Build Calibre ebook-convert command."""
+        # Skip cover generation and font rescaling unless the caller asked for
+        # metadata changes; both are a large share of Calibre's per-book work.
+        reduce_work = target_format in ("epub", "mobi", "azw3") and not (title or author)
+
         cmd = [
-            "ebook-convert",
+            _EBOOK_CONVERT,
             str(source),
             str(output),
+            *(("--title", title) if title else ()),
+            *(("--authors", author) if author else ()),
+            *(("--disable-font-rescaling",) if reduce_work else ()),
+            *(("--no-default-epub-cover",) if reduce_work and target_format == "epub" else ()),
         ]
 
-        if title:
-            cmd.extend(["--title", title])
-
-        if author:
-            cmd.extend(["--authors", author])
-
         if target_format == "pdf":
-            if paper_size:
-                cmd.extend(["--paper-size", paper_size])
-            else:
-                cmd.extend(["--paper-size", "a4"])
-
-            if pdf_margin:
-                cmd.extend(["--pdf-page-margin-left", pdf_margin])
-                cmd.extend(["--pdf-page-margin-right", pdf_margin])
-                cmd.extend(["--pdf-page-margin-top", pdf_margin])
-                cmd.extend(["--pdf-page-margin-bottom", pdf_margin])
-
-            cmd.extend(["--pdf-default-font-size", "12"])
-            cmd.extend(["--pdf-mono-font-size", "12"])
+            cmd += [
+                "--paper-size",
+                paper_size or "a4",
+                *(
+                    (
+                        "--pdf-page-margin-left",
+                        pdf_margin,
+                        "--pdf-page-margin-right",
+                        pdf_margin,
+                        "--pdf-page-margin-top",
+                        pdf_margin,
+                        "--pdf-page-margin-bottom",
+                        pdf_margin,
+                    )
+                    if pdf_margin
+                    else ()
+                ),
+                "--pdf-default-font-size",
+                "12",
+                "--pdf-mono-font-size",
+                "12",
+            ]
 
         return cmd
 
@@ -218,7 +244,7 @@ class EbookConverter:
         safe_source, symlink_created = self._ensure_safe_source(source)
 
         cmd = [
-            "ebook-meta",
+            _EBOOK_META,
             str(safe_source),
         ]
 
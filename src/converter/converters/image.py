@@ -1,5 +1,5 @@
 """
-Image converter using Pillow + CairoSVG.
+Image converter using Pillow + resvg/CairoSVG.
 
 Supports conversions between common image formats:
 - Input: JPEG, PNG, GIF, WebP, TIFF, BMP, SVG
@@ -9,17 +9,42 @@ SVG is input-only (raster to vector conversion not supported).
 """
 
 import asyncio
+import contextlib
+import functools
+import io
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Any, Callable, Optional, Tuple
 
-from ..async_utils import concurrency_limiter
+import PIL
+from PIL import Image, features
+
+from ..async_utils import DEFAULT_MAX_CONCURRENT, concurrency_limiter
 from ..file_manager import FileManager
 from ..logging_config import ConversionError, FormatNotSupportedError, get_logger
 
 logger = get_logger("converters.image")
 
-SUPPORTED_INPUT_FORMATS = {"jpg", "jpeg", "png", "gif", "webp", "tiff", "tif", "bmp", "svg"}
-SUPPORTED_OUTPUT_FORMATS = {"jpg", "jpeg", "png", "gif", "webp", "tiff", "bmp"}
+# SVG rasterizers are optional; resvg is preferred when both are installed.
+try:
+    import resvg_py
+except ImportError:
+    resvg_py = None
+
+try:
+    import cairosvg
+except (ImportError, OSError):
+    # cairosvg raises OSError when the Cairo system library is missing
+    cairosvg = None
+
+SUPPORTED_INPUT_FORMATS = frozenset(
+    {"jpg", "jpeg", "png", "gif", "webp", "tiff", "tif", "bmp", "svg"}
+)
+SUPPORTED_OUTPUT_FORMATS = frozenset({"jpg", "jpeg", "png", "gif", "webp", "tiff", "bmp"})
+# Listed in FormatNotSupportedError suggestions
+_OUTPUT_FORMATS_TEXT = ", ".join(sorted(SUPPORTED_OUTPUT_FORMATS))
 
 FORMAT_MIME_MAP = {
     "jpg": "JPEG",
@@ -38,6 +63,140 @@ QUALITY_PRESETS = {
     "medium": 85,
     "high": 95,
 }
+DEFAULT_QUALITY = QUALITY_PRESETS["medium"]
+
+# Images handed to a worker per call by ImageConverter.convert_batch.
+BATCH_CHUNK_SIZE = 32
+
+
+@functools.cache
+def _log_pillow_build() -> None:
+    """Log which Pillow build is in use, once per process.
+
+    Pillow-SIMD is a drop-in replacement that ships the same ``PIL`` package
+    with a ``.postN`` version suffix, so the version string is enough to tell
+    the two apart when comparing conversion timings. JPEG encode speed depends
+    on whether the build links libjpeg-turbo (the PyPI wheels do), so that is
+    logged alongside.
+    """
+    variant = "Pillow-SIMD" if ".post" in PIL.__version__ else "Pillow"
+    turbo = features.check_feature("libjpeg_turbo")
+    logger.debug(f"Image backend: {variant} {PIL.__version__} (libjpeg-turbo: {turbo})")
+    if turbo is False:
+        logger.debug("JPEG encoding uses reference libjpeg; rebuild Pillow against libjpeg-turbo")
+
+
+def _rasterize_svg(source: Path) -> bytes:
+    """
+    Rasterize an SVG file to PNG bytes.
+
+    resvg (tiny-skia) is preferred as it is considerably faster than Cairo on
+    complex documents; cairosvg remains supported as a fallback.
+    """
+    if resvg_py is not None:
+        return bytes(resvg_py.svg_to_bytes(svg_path=str(source), dpi=96))
+
+    if cairosvg is None:
+        raise ConversionError(
+            "SVG conversion requires resvg-py or cairosvg library",
+            suggestion="Install with: pip install resvg-py\n"
+            "Or: pip install cairosvg "
+            "(requires Cairo system library, libcairo2-dev on Ubuntu/Debian)",
+        )
+
+    return cairosvg.svg2png(url=str(source), dpi=96)
+
+
+def _flatten_to_rgb(img: Image.Image) -> Image.Image:
+    """
+    Convert an image to RGB for formats without alpha support.
+
+    Transparent areas are composited over white; a plain convert("RGB")
+    would drop the alpha channel and leave them black. Palette images without
+    a transparency key only need their palette applied.
+    """
+    if img.mode == "LA" or (img.mode == "P" and "transparency" in img.info):
+        img = img.convert("RGBA")
+
+    if img.mode != "RGBA":
+        return img.convert("RGB")
+
+    background = Image.new("RGB", img.size, (255, 255, 255))
+    background.paste(img, mask=img.getchannel("A"))
+    return background
+
+
+_image_pool: Optional[ProcessPoolExecutor] = None
+_image_pool_unavailable = False
+
+
+def _warm_pillow() -> None:
+    """
+    Worker initializer.
+
+    Unpickling this function imports the module, and with it Pillow, when
+    the worker starts rather than on its first job.
+    """
+
+
+def _get_image_pool() -> Optional[ProcessPoolExecutor]:
+    """
+    Get the shared process pool for Pillow work, creating it on first use.
+
+    Pillow holds the GIL in its Python wrappers and in parts of the encoders,
+    so CPU-bound conversions run in worker processes rather than threads. The
+    pool is sized like the concurrency limiter, which already caps how many
+    conversions run at once. Workers are spawned rather than forked because
+    the server process runs threads. Returns None (use the default thread
+    pool) on platforms without working multiprocessing support.
+    """
+    global _image_pool, _image_pool_unavailable
+
+    if _image_pool is None and not _image_pool_unavailable:
+        try:
+            _image_pool = ProcessPoolExecutor(
+                max_workers=DEFAULT_MAX_CONCURRENT,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_warm_pillow,
+            )
+        except (ImportError, NotImplementedError, OSError) as e:
+            logger.warning(f"Process pool unavailable, converting images in threads: {e}")
+            _image_pool_unavailable = True
+
+    return _image_pool
+
+
+def _discard_image_pool() -> None:
+    """Drop a broken pool so the next conversion starts a fresh one."""
+    global _image_pool
+
+    if _image_pool is not None:
+        _image_pool.shutdown(wait=False)
+        _image_pool = None
+
+
+def _convert_chunk(
+    chunk: list[tuple[Path, Path, str]],
+    quality: int,
+    resize: Optional[Tuple[int, int]],
+) -> list[Path]:
+    """Worker entry point for convert_batch: convert a list of images in one call."""
+    return [
+        ImageConverter._convert_sync(source, output, target_format, quality, resize)
+        for source, output, target_format in chunk
+    ]
+
+
+async def _run_in_image_pool(description: str, func: Callable[..., Any], *args: Any) -> Any:
+    """Run a function in the image pool, reporting a crashed worker as a ConversionError."""
+    try:
+        return await asyncio.get_running_loop().run_in_executor(_get_image_pool(), func, *args)
+    except BrokenProcessPool as e:
+        _discard_image_pool()
+        raise ConversionError(
+            f"Image worker process exited unexpectedly while converting {description}",
+            suggestion="The image may be corrupt or too large to decode",
+        ) from e
 
 
 class ImageConverter:
@@ -45,6 +204,7 @@ class ImageConverter:
 
     def __init__(self, file_manager: Optional[FileManager] = None):
         self.file_manager = file_manager or FileManager()
+        _log_pillow_build()
 
     @staticmethod
     def is_format_supported(format_name: str, for_output: bool = False) -> bool:
@@ -55,9 +215,9 @@ class ImageConverter:
         return format_lower in SUPPORTED_INPUT_FORMATS
 
     @staticmethod
-    def get_supported_formats() -> Tuple[set, set]:
+    def get_supported_formats() -> Tuple[frozenset, frozenset]:
         """Get supported input and output formats."""
-        return SUPPORTED_INPUT_FORMATS.copy(), SUPPORTED_OUTPUT_FORMATS.copy()
+        return SUPPORTED_INPUT_FORMATS, SUPPORTED_OUTPUT_FORMATS
 
     async def convert(
         self,
@@ -90,7 +250,7 @@ class ImageConverter:
         if not self.is_format_supported(target_format, for_output=True):
             raise FormatNotSupportedError(
                 f"Output format '{target_format}' is not supported",
-                suggestion=f"Supported formats: {', '.join(sorted(SUPPORTED_OUTPUT_FORMATS))}",
+                suggestion=f"Supported formats: {_OUTPUT_FORMATS_TEXT}",
             )
 
         if output_path is None:
@@ -99,11 +259,12 @@ class ImageConverter:
         quality_value = self._resolve_quality(quality)
 
         async with concurrency_limiter:
-            result = await asyncio.get_event_loop().run_in_executor(
-                None,
+            # Workers do not share our working directory, so paths go absolute.
+            result = await _run_in_image_pool(
+                str(source),
                 self._convert_sync,
-                source,
-                output_path,
+                source.absolute(),
+                Path(output_path).absolute(),
                 target_format,
                 quality_value,
                 resize,
@@ -112,14 +273,77 @@ class ImageConverter:
         logger.info(f"Converted {source} -> {output_path}")
         return result
 
+    async def convert_batch(
+        self,
+        jobs: list[tuple[str | Path, str, Optional[Path]]],
+        quality: str = "medium",
+        resize: Optional[Tuple[int, int]] = None,
+        chunk_size: int = BATCH_CHUNK_SIZE,
+    ) -> list[Path]:
+        """
+        Convert many images, handing them to the workers in chunks.
+
+        Each chunk is converted by a single worker call, so the scheduling and
+        pickling overhead is paid once per chunk rather than once per image.
+        Chunks still run under the concurrency limiter, in parallel.
+
+        Args:
+            jobs: (source_path, target_format, output_path or None) tuples
+            quality: Quality preset (low, medium, high) or numeric 1-100
+            resize: Optional tuple of (width, height) applied to every image
+            chunk_size: Number of images per worker call
+
+        Returns:
+            Paths to the converted images, in the order of ``jobs``
+
+        Raises:
+            FormatNotSupportedError: If any target format is not supported
+            ConversionError: If any conversion fails
+        """
+        quality_value = self._resolve_quality(quality)
+        claimed: set[Path] = set()
+        prepared = []
+
+        for source_path, target_format, output_path in jobs:
+            source = Path(source_path)
+            target_format = target_format.lower()
+
+            if not self.is_format_supported(target_format, for_output=True):
+                raise FormatNotSupportedError(
+                    f"Output format '{target_format}' is not supported",
+                    suggestion=f"Supported formats: {_OUTPUT_FORMATS_TEXT}",
+                )
+
+            if output_path is None:
+                output_path = self.file_manager.claim_output_path(source, target_format, claimed)
+            output = Path(output_path).absolute()
+            claimed.add(output)
+            prepared.append((source.absolute(), output, target_format))
+
+        async def run_chunk(chunk: list[tuple[Path, Path, str]]) -> list[Path]:
+            async with concurrency_limiter:
+                return await _run_in_image_pool(
+                    f"a batch starting with {chunk[0][0]}",
+                    _convert_chunk,
+                    chunk,
+                    quality_value,
+                    resize,
+                )
+
+        chunks = [prepared[i : i + chunk_size] for i in range(0, len(prepared), chunk_size)]
+        results = await asyncio.gather(*(run_chunk(chunk) for chunk in chunks))
+
+        logger.info(f"Converted batch of {len(prepared)} images in {len(chunks)} chunks")
+        return [path for chunk_result in results for path in chunk_result]
+
     def _resolve_quality(self, quality: str | int) -> int:
         """Resolve quality preset to numeric value."""
         if isinstance(quality, int):
             return max(1, min(100, quality))
-        return QUALITY_PRESETS.get(quality.lower(), QUALITY_PRESETS["medium"])
+        return QUALITY_PRESETS.get(quality.lower(), DEFAULT_QUALITY)
 
+    @staticmethod
     def _convert_sync(
-        self,
         source: Path,
         output: Path,
         target_format: str,
@@ -130,82 +354,83 @@ class ImageConverter:
         source_format = source.suffix.lower().lstrip(".")
 
         if source_format == "svg":
-            return self._convert_svg_to_raster(source, output, target_format, quality, resize)
+            return ImageConverter._convert_svg_to_raster(
+                source, output, target_format, quality, resize
+            )
 
-        return self._convert_pillow(source, output, target_format, quality, resize)
+        return ImageConverter._convert_pillow(source, output, target_format, quality, resize)
 
+    @staticmethod
     def _convert_pillow(
-        self,
-        source: Path,
+        source: Path | Image.Image,
         output: Path,
         target_format: str,
         quality: int,
         resize: Optional[Tuple[int, int]],
     ) -> Path:
-        """Convert raster images using Pillow."""
-        from PIL import Image
+        """Convert a raster image file, or an already decoded image, using Pillow."""
+        # Every supported output format has an entry, so no fallback is needed
+        pillow_format = FORMAT_MIME_MAP[target_format]
 
-        pillow_format = FORMAT_MIME_MAP.get(target_format, target_format.upper())
+        if isinstance(source, Image.Image):
+            opened = contextlib.nullcontext(source)
+        else:
+            opened = Image.open(source)
 
-        with Image.open(source) as img:
+        with opened as img:
             if resize:
-                img = img.resize(resize, Image.Resampling.LANCZOS)
+                # JPEG sources decode straight at a 1/2, 1/4 or 1/8 DCT scale
+                # no smaller than the target; other formats ignore this.
+                img.draft(None, tuple(resize))
 
             save_kwargs = {"format": pillow_format}
 
             if pillow_format == "JPEG":
                 save_kwargs["quality"] = quality
-                if img.mode in ("RGBA", "P"):
-                    img = img.convert("RGB")
+                # Flatten before resizing so the resampling runs over three
+                # channels instead of four (or a palette expanded to RGBA).
+                if img.mode in ("RGBA", "LA", "P"):
+                    img = _flatten_to_rgb(img)
             elif pillow_format == "WEBP":
                 save_kwargs["quality"] = quality
             elif pillow_format == "PNG":
-                save_kwargs["optimize"] = True
+                # PNG is lossless, so quality only trades encode time for size;
+                # the exhaustive optimize pass is reserved for the high preset.
+                if quality >= QUALITY_PRESETS["high"]:
+                    save_kwargs["optimize"] = True
+                elif quality <= QUALITY_PRESETS["low"]:
+                    save_kwargs["compress_level"] = 3
+                else:
+                    save_kwargs["compress_level"] = 6
+
+            if resize and tuple(resize) != img.size:
+                # Large downscales shrink with a cheap box reduce first, leaving
+                # LANCZOS to run over an image close to the target size.
+                reducing_gap = 3.0 if max(img.size) > 2 * max(resize) else None
+                img = img.resize(resize, Image.Resampling.LANCZOS, reducing_gap=reducing_gap)
 
             output.parent.mkdir(parents=True, exist_ok=True)
             img.save(output, **save_kwargs)
 
         return output
 
+    @staticmethod
     def _convert_svg_to_raster(
-        self,
         source: Path,
         output: Path,
         target_format: str,
         quality: int,
         resize: Optional[Tuple[int, int]],
     ) -> Path:
-        """Convert SVG to raster format using cairosvg + Pillow."""
-        import tempfile
-
+        """Convert SVG to raster format using resvg (or cairosvg) + Pillow."""
         try:
-            import cairosvg
-        except ImportError as e:
-            raise ConversionError(
-                "SVG conversion requires cairosvg library",
-                suggestion="Install with: pip install cairosvg\n"
-                "Note: cairosvg requires Cairo system library (libcairo2-dev on Ubuntu/Debian)",
-            ) from e
+            png_bytes = _rasterize_svg(source)
 
-        with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as tmp:
-            tmp_png = Path(tmp.name)
-
-        try:
-            cairosvg.svg2png(
-                url=str(source),
-                write_to=str(tmp_png),
-                dpi=96,
-            )
-
-            if resize:
-                from PIL import Image
-
-                with Image.open(tmp_png) as img:
-                    resized = img.resize(resize, Image.Resampling.LANCZOS)
-                    resized.save(tmp_png, format="PNG")
-
-            return self._convert_pillow(tmp_png, output, target_format, quality, None)
+            with Image.open(io.BytesIO(png_bytes)) as img:
+                return ImageConverter._convert_pillow(img, output, target_format, quality, resize)
 
+        except ConversionError:
+            raise
         except (ValueError, TypeError) as e:
             raise ConversionError(
                 f"Invalid SVG file: {source}",
@@ -213,9 +438,6 @@ class ImageConverter:
             ) from e
         except Exception as e:
             raise ConversionError(f"SVG conversion failed: {e}") from e
-        finally:
-            if tmp_png.exists():
-                tmp_png.unlink()
 
     async def get_image_info(self, source_path: str | Path) -> dict:
         """
@@ -230,8 +452,6 @@ class ImageConverter:
         source = Path(source_path)
 
         def _get_info():
-            from PIL import Image
-
             with Image.open(source) as img:
                 return {
                     "format": img.format,
@@ -241,4 +461,4 @@ class ImageConverter:
                     "height": img.height,
                 }
 
-        return await asyncio.get_event_loop().run_in_executor(None, _get_info)
+        return await asyncio.to_thread(_get_info)
@@ -5,7 +5,7 @@ Provides intelligent format detection and routes conversions
 to the appropriate converter.
 """
 
-import shutil
+import asyncio
 from pathlib import Path
 from typing import Optional, Tuple, Type
 
@@ -34,6 +34,28 @@ from ..logging_config import FormatNotSupportedError, get_logger
 
 logger = get_logger("converters.router")
 
+# Routing precedence: the first converter that accepts a (source, target) pair wins.
+_ROUTES = (
+    ("image", IMG_IN, IMG_OUT),
+    ("video", VID_IN, VID_OUT),
+    ("video", VID_IN, AUD_OUT),
+    ("audio", AUD_IN, AUD_OUT),
+    ("ebook", EBOOK_IN, EBOOK_OUT),
+)
+
+
+def _build_route_table() -> dict[tuple[str, str], str]:
+    """Flatten _ROUTES into a (source, target) -> converter type lookup."""
+    table: dict[tuple[str, str], str] = {}
+    for converter_type, inputs, outputs in _ROUTES:
+        for src in inputs:
+            for tgt in outputs:
+                table.setdefault((src, tgt), converter_type)
+    return table
+
+
+_ROUTE_TABLE = _build_route_table()
+
 
 class ConverterRouter:
     """Route conversion requests to appropriate converters."""
@@ -76,23 +98,9 @@ class ConverterRouter:
         Returns:
             'image', 'video', 'audio', 'ebook', or raises error
         """
-        src = source_format.lower()
-        tgt = target_format.lower()
-
-        if src in IMG_IN and tgt in IMG_OUT:
-            return "image"
-
-        if src in VID_IN and tgt in VID_OUT:
-            return "video"
-
-        if src in VID_IN and tgt in AUD_OUT:
-            return "video"
-
-        if src in AUD_IN and tgt in AUD_OUT:
-            return "audio"
-
-        if src in EBOOK_IN and tgt in EBOOK_OUT:
-            return "ebook"
+        converter_type = _ROUTE_TABLE.get((source_format.lower(), target_format.lower()))
+        if converter_type is not None:
+            return converter_type
 
         raise FormatNotSupportedError(
             f"Conversion from '{source_format}' to '{target_format}' is not supported",
@@ -150,14 +158,16 @@ class ConverterRouter:
             Path to converted file
         """
         source = Path(source_path)
-        source_format = source.suffix.lstrip(".")
+        # Path.suffix is either empty or starts with a single dot
+        source_format = source.suffix[1:]
+        target_lower = target_format.lower()
 
-        converter_type = self.get_converter_type(source_format, target_format)
+        converter_type = self.get_converter_type(source_format, target_lower)
 
         if converter_type == "image":
             return await self.image.convert(source, target_format, output_path, quality, **kwargs)
         elif converter_type == "video":
-            if target_format.lower() in AUD_OUT:
+            if target_lower in AUD_OUT:
                 return await self.video.extract_audio(source, output_path, target_format, **kwargs)
             return await self.video.convert(source, target_format, output_path, quality, **kwargs)
         elif converter_type == "audio":
@@ -167,5 +177,49 @@ class ConverterRouter:
         else:
             raise FormatNotSupportedError(f"Unknown converter type: {converter_type}")
 
+    async def convert_batch(
+        self,
+        sources: list[str | Path],
+        target_format: str,
+        quality: str = "medium",
+        **kwargs,
+    ) -> list[Path]:
+        """
+        Convert several files to the same target format.
+
+        Batches made only of images go through ImageConverter.convert_batch,
+        which converts them in chunks per worker call; mixed batches are
+        converted file by file, concurrently. Output paths are claimed for the
+        whole batch up front, so sources sharing a stem never race for one file.
+
+        Returns:
+            Paths to the converted files, in the order of ``sources``
+        """
+        paths = [Path(source) for source in sources]
+        converter_types = [
+            self.get_converter_type(path.suffix[1:], target_format) for path in paths
+        ]
+
+        if set(converter_types) == {"image"}:
+            jobs = [(path, target_format, None) for path in paths]
+            return await self.image.convert_batch(jobs, quality, **kwargs)
+
+        target_lower = target_format.lower()
+        claimed: set[Path] = set()
+        outputs = []
+        for path, converter_type in zip(paths, converter_types, strict=True):
+            file_manager = getattr(self, converter_type).file_manager
+            output = file_manager.claim_output_path(path, target_lower, claimed).absolute()
+            claimed.add(output)
+            outputs.append(output)
+
+        results = await asyncio.gather(
+            *(
+                self.convert(path, target_format, output, quality=quality, **kwargs)
+                for path, output in zip(paths, outputs, strict=True)
+            )
+        )
+        return list(results)
+
 
 router = ConverterRouter()
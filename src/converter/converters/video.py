@@ -6,20 +6,33 @@ Supports conversions between common video formats:
 """
 
 import asyncio
-import re
+import os
 import shutil
+import sys
+from collections import OrderedDict, deque
 from pathlib import Path
 from typing import Callable, Optional, Any
 
-from ..async_utils import safe_subprocess, concurrency_limiter
+from ..async_utils import (
+    STDERR_TAIL_BYTES,
+    SubprocessTimeoutError,
+    safe_subprocess,
+    concurrency_limiter,
+)
 from ..file_manager import FileManager
 from ..logging_config import ConversionError, FormatNotSupportedError, get_logger
 from ..progress import ProgressReporter, ProgressStage, get_progress_reporter
 
 logger = get_logger("converters.video")
 
-SUPPORTED_INPUT_FORMATS = {"mp4", "avi", "mov", "webm", "mkv", "wmv", "flv", "m4v"}
-SUPPORTED_OUTPUT_FORMATS = {"mp4", "avi", "mov", "webm", "mkv"}
+# Resolved once so each spawn skips the PATH search.
+_FFMPEG = shutil.which("ffmpeg") or "ffmpeg"
+_FFPROBE = shutil.which("ffprobe") or "ffprobe"
+
+SUPPORTED_INPUT_FORMATS = frozenset({"mp4", "avi", "mov", "webm", "mkv", "wmv", "flv", "m4v"})
+SUPPORTED_OUTPUT_FORMATS = frozenset({"mp4", "avi", "mov", "webm", "mkv"})
+# Listed in FormatNotSupportedError suggestions
+_OUTPUT_FORMATS_TEXT = ", ".join(sorted(SUPPORTED_OUTPUT_FORMATS))
 
 QUALITY_PRESETS = {
     "low": {"crf": "28", "preset": "faster"},
@@ -35,8 +48,190 @@ CODEC_MAP = {
     "mkv": {"video": "libx264", "audio": "aac"},
 }
 
-_DURATION_REGEX = re.compile(r"Duration: (\d{2}):(\d{2}):(\d{2})\.(\d{2})")
-_TIME_REGEX = re.compile(r"time=(\d{2}):(\d{2}):(\d{2})\.(\d{2})")
+# Hardware H.264 encoders, most preferred first. Each is only used when FFmpeg
+# was built with it and the device it drives is present.
+_HW_H264_ENCODERS = ("h264_nvenc", "h264_vaapi", "h264_videotoolbox")
+_VAAPI_DEVICE = "/dev/dri/renderD128"
+_NVENC_PRESETS = {"faster": "p2", "medium": "p4", "slow": "p6"}
+
+# FFmpeg stderr fragments (lowercased) reporting that a hardware encoder or its
+# device could not be opened. Only these failures are retried in software; any
+# other error (a corrupt input, a full disk) would fail the same way again.
+_HW_INIT_ERRORS = (
+    "error while opening encoder",
+    "error initializing output stream",
+    "could not open encoder",
+    "device creation failed",
+    "no capable devices found",
+    "no nvenc capable devices found",
+    "openencodesessionex failed",
+    "cannot load libcuda",
+    "cannot load libnvidia-encode",
+    "failed to initialise vaapi connection",
+    "cannot create compression session",
+)
+
+# libvpx and SVT-AV1 take numeric speed settings instead of x264 preset names.
+_VP9_CPU_USED = {"faster": "4", "medium": "2", "slow": "1"}
+_SVTAV1_PRESETS = {"faster": "10", "medium": "8", "slow": "6"}
+
+# libvpx-vp9 encodes a single tile on one thread unless told otherwise.
+_VP9_THREAD_ARGS = (
+    "-row-mt",
+    "1",
+    "-tile-columns",
+    "2",
+    "-threads",
+    str(os.cpu_count() or 1),
+)
+
+_ffmpeg_encoders: Optional[frozenset] = None
+
+# Lines of FFmpeg stderr kept for error messages when monitoring progress.
+_STDERR_TAIL_LINES = 200
+
+# How long FFmpeg gets to exit after SIGTERM before it is killed.
+_TERMINATE_GRACE_SECONDS = 5.0
+
+# Probed durations keyed by (resolved path, mtime_ns), least recently used first.
+_DURATION_CACHE: "OrderedDict[tuple[Path, int], Optional[float]]" = OrderedDict()
+_DURATION_CACHE_SIZE = 128
+
+
+async def _probe_duration(source: Path) -> Optional[float]:
+    """
+    Get the duration of a media file in seconds using ffprobe.
+
+    Results are cached per file version, so converting the same source again
+    skips the probe. Returns None if the duration cannot be determined.
+    """
+    try:
+        key = (source.resolve(), source.stat().st_mtime_ns)
+    except OSError:
+        return None
+
+    if key in _DURATION_CACHE:
+        _DURATION_CACHE.move_to_end(key)
+        return _DURATION_CACHE[key]
+
+    cmd = [
+        _FFPROBE,
+        "-v",
+        "error",
+        "-show_entries",
+        "format=duration",
+        "-of",
+        "csv=p=0",
+        str(source),
+    ]
+
+    try:
+        returncode, stdout, _ = await safe_subprocess(
+            cmd, timeout=15, check_returncode=False, decode=False
+        )
+        duration = float(stdout) if returncode == 0 else None
+    except (SubprocessTimeoutError, OSError, ValueError):
+        # ValueError covers "N/A" for streams without a known duration
+        duration = None
+
+    if duration is not None and duration <= 0:
+        duration = None
+
+    _DURATION_CACHE[key] = duration
+    if len(_DURATION_CACHE) > _DURATION_CACHE_SIZE:
+        _DURATION_CACHE.popitem(last=False)
+    return duration
+
+
+async def _get_ffmpeg_encoders() -> frozenset:
+    """Get the names of the encoders FFmpeg was built with, probed once."""
+    global _ffmpeg_encoders
+
+    if _ffmpeg_encoders is None:
+        try:
+            returncode, stdout, _ = await safe_subprocess(
+                [_FFMPEG, "-hide_banner", "-encoders"], timeout=15, check_returncode=False
+            )
+        except (SubprocessTimeoutError, OSError):
+            returncode, stdout = 1, ""
+
+        names = set()
+        if returncode == 0:
+            for line in stdout.splitlines():
+                # " V....D h264_nvenc           NVIDIA NVENC H.264 encoder"
+                parts = line.split()
+                if len(parts) >= 2 and len(parts[0]) == 6 and parts[0][0] in "VAS":
+                    names.add(parts[1])
+        _ffmpeg_encoders = frozenset(names)
+
+    return _ffmpeg_encoders
+
+
+def _hw_device_present(encoder: str) -> bool:
+    """Check that the device behind a hardware encoder is available."""
+    if encoder.endswith("_nvenc"):
+        return sys.platform == "win32" or Path("/dev/nvidiactl").exists()
+    if encoder.endswith("_vaapi"):
+        return Path(_VAAPI_DEVICE).exists()
+    if encoder.endswith("_videotoolbox"):
+        return sys.platform == "darwin"
+    return False
+
+
+def _hw_init_failed(stderr: str) -> bool:
+    """Check whether FFmpeg failed because the hardware encoder would not open."""
+    stderr = stderr.lower()
+    return any(error in stderr for error in _HW_INIT_ERRORS)
+
+
+async def _select_hw_encoder(video_codec: str) -> Optional[str]:
+    """Pick a usable hardware replacement for a software video encoder."""
+    if video_codec != "libx264":
+        return None
+
+    available = await _get_ffmpeg_encoders()
+    for encoder in _HW_H264_ENCODERS:
+        if encoder in available and _hw_device_present(encoder):
+            return encoder
+    return None
+
+
+def _encoder_args(video_codec: str, preset: dict) -> list[str]:
+    """Translate a quality preset into the rate-control flags of an encoder."""
+    crf = preset["crf"]
+    if video_codec.endswith("_nvenc"):
+        # As with VP9, -b:v 0 makes -cq the quality target rather than a cap on the default bitrate
+        return [
+            "-rc",
+            "vbr",
+            "-cq",
+            crf,
+            "-b:v",
+            "0",
+            "-preset",
+            _NVENC_PRESETS.get(preset["preset"], "p4"),
+        ]
+    if video_codec.endswith("_vaapi"):
+        return ["-vf", "format=nv12,hwupload", "-qp", crf]
+    if video_codec.endswith("_videotoolbox"):
+        # -q:v runs 1-100, higher is better; CRF 18/23/28 maps to 74/64/54
+        return ["-q:v", str(max(1, min(100, 110 - 2 * int(crf))))]
+    if video_codec == "libvpx-vp9":
+        # -b:v 0 makes -crf constant quality rather than a quality cap
+        return [
+            "-crf",
+            crf,
+            "-b:v",
+            "0",
+            "-deadline",
+            "good",
+            "-cpu-used",
+            _VP9_CPU_USED.get(preset["preset"], "2"),
+            *_VP9_THREAD_ARGS,
+        ]
+    if video_codec == "libsvtav1":
+        return ["-crf", crf, "-preset", _SVTAV1_PRESETS.get(preset["preset"], "8")]
+    return ["-crf", crf, "-preset", preset["preset"]]
 
 
 class VideoConverter:
@@ -54,9 +249,9 @@ class VideoConverter:
         return format_lower in SUPPORTED_INPUT_FORMATS
 
     @staticmethod
-    def get_supported_formats() -> tuple[set, set]:
+    def get_supported_formats() -> tuple[frozenset, frozenset]:
         """Get supported input and output formats."""
-        return SUPPORTED_INPUT_FORMATS.copy(), SUPPORTED_OUTPUT_FORMATS.copy()
+        return SUPPORTED_INPUT_FORMATS, SUPPORTED_OUTPUT_FORMATS
 
     async def convert(
         self,
@@ -69,6 +264,7 @@ class VideoConverter:
         progress_callback: Optional[Callable[[float], Any]] = None,
         progress_reporter: Optional[ProgressReporter] = None,
         job_id: Optional[str] = None,
+        hw: bool = True,
     ) -> Path:
         """
         Convert a video to the target format.
@@ -83,6 +279,9 @@ class VideoConverter:
             progress_callback: Optional callback(percent) for progress updates
             progress_reporter: Optional ProgressReporter for detailed progress
             job_id: Optional job ID for progress tracking
+            hw: Use a hardware H.264 encoder (NVENC, VAAPI, VideoToolbox) when
+                available, falling back to software if it fails. Ignored when
+                ``codec`` is given.
 
         Returns:
             Path to the converted video
@@ -97,7 +296,7 @@ class VideoConverter:
         if not self.is_format_supported(target_format, for_output=True):
             raise FormatNotSupportedError(
                 f"Output format '{target_format}' is not supported",
-                suggestion=f"Supported formats: {', '.join(sorted(SUPPORTED_OUTPUT_FORMATS))}",
+                suggestion=f"Supported formats: {_OUTPUT_FORMATS_TEXT}",
             )
 
         if output_path is None:
@@ -108,11 +307,11 @@ class VideoConverter:
 
         video_codec = codec or default_codecs["video"]
         audio = audio_codec or default_codecs["audio"]
-
-        cmd = self._build_ffmpeg_command(source, output_path, video_codec, audio, preset)
+        hw_codec = await _select_hw_encoder(video_codec) if hw and codec is None else None
 
         # Initialize progress tracking
         use_progress = progress_callback is not None or progress_reporter is not None
+
         if use_progress and progress_reporter and job_id:
             await progress_reporter.start_job(
                 job_id,
@@ -124,16 +323,28 @@ class VideoConverter:
 
         async with concurrency_limiter:
             try:
-                # Use progress monitoring version if callback provided
-                if use_progress:
-                    returncode, stdout, stderr = await self._run_with_progress(
-                        cmd,
-                        progress_callback=progress_callback,
-                        progress_reporter=progress_reporter,
-                        job_id=job_id,
+                returncode = None
+                retry = False
+                if hw_codec:
+                    cmd = self._build_ffmpeg_command(
+                        source, output_path, hw_codec, audio, preset, progress=use_progress
+                    )
+                    returncode, stderr = await self._run_ffmpeg(
+                        cmd, source, use_progress, progress_callback, progress_reporter, job_id
+                    )
+                    retry = returncode != 0 and _hw_init_failed(stderr)
+                    if retry:
+                        logger.warning(
+                            f"Hardware encoder {hw_codec} failed, retrying with {video_codec}"
+                        )
+
+                if returncode is None or retry:
+                    cmd = self._build_ffmpeg_command(
+                        source, output_path, video_codec, audio, preset, progress=use_progress
+                    )
+                    returncode, stderr = await self._run_ffmpeg(
+                        cmd, source, use_progress, progress_callback, progress_reporter, job_id
                     )
-                else:
-                    returncode, stdout, stderr = await safe_subprocess(cmd, timeout=3600)
 
                 if returncode != 0:
                     if progress_reporter and job_id:
@@ -166,6 +377,31 @@ class VideoConverter:
         logger.info(f"Converted {source} -> {output_path}")
         return output_path
 
+    async def _run_ffmpeg(
+        self,
+        cmd: list[str],
+        source: Path,
+        use_progress: bool,
+        progress_callback: Optional[Callable[[float], Any]],
+        progress_reporter: Optional[ProgressReporter],
+        job_id: Optional[str],
+    ) -> tuple[int, str]:
+        """Run an FFmpeg conversion command, returning (returncode, stderr tail)."""
+        # Use progress monitoring version if callback provided
+        if use_progress:
+            returncode, _, stderr = await self._run_with_progress(
+                cmd,
+                total_duration=await _probe_duration(source),
+                progress_callback=progress_callback,
+                progress_reporter=progress_reporter,
+                job_id=job_id,
+            )
+        else:
+            returncode, _, stderr = await safe_subprocess(
+                cmd, timeout=3600, check_returncode=False, stderr_tail_bytes=STDERR_TAIL_BYTES
+            )
+        return returncode, stderr
+
     def _build_ffmpeg_command(
         self,
         source: Path,
@@ -173,19 +409,24 @@ class VideoConverter:
         video_codec: str,
         audio_codec: str,
         preset: dict,
+        progress: bool = False,
     ) -> list[str]:
-        """Build FFmpeg command for conversion."""
+        """
+        Build FFmpeg command for conversion.
+
+        With ``progress`` set, FFmpeg reports machine-readable progress on
+        stdout and the interactive stats line on stderr is turned off.
+        """
         cmd = [
-            "ffmpeg",
+            _FFMPEG,
             "-y",
+            *(("-progress", "pipe:1", "-nostats") if progress else ()),
+            *(("-vaapi_device", _VAAPI_DEVICE) if video_codec.endswith("_vaapi") else ()),
             "-i",
             str(source),
             "-c:v",
             video_codec,
-            "-crf",
-            preset["crf"],
-            "-preset",
-            preset["preset"],
+            *_encoder_args(video_codec, preset),
             "-c:a",
             audio_codec,
             str(output),
@@ -199,20 +440,22 @@ class VideoConverter:
         progress_reporter: Optional[ProgressReporter] = None,
         job_id: Optional[str] = None,
         timeout: int = 3600,
+        total_duration: Optional[float] = None,
     ) -> tuple[int, str, str]:
         """
-        Run FFmpeg with progress monitoring via stderr parsing.
+        Run FFmpeg with progress monitoring.
 
-        Parses FFmpeg stderr output to extract duration and current time,
-        calculating percentage complete for progress reporting.
+        Expects a command built with ``progress=True``, so FFmpeg writes
+        ``key=value`` progress lines to stdout (``-progress pipe:1``) while
+        stderr only carries the banner, stream info and errors.
 
-        FFmpeg outputs progress to stderr in format:
-        frame=  123 fps= 45 q=28.0 size=    1234kB time=00:00:05.00 bitrate= 2000.0kbits/s speed=2.00x
+        Both pipes are read line by line as FFmpeg produces them. The current
+        position comes from ``out_time_us=`` on stdout and the percentage is
+        (current_time / total_duration) * 100, so nothing is reported when the
+        duration is unknown.
 
-        Progress calculation:
-        1. Extract total duration from "Duration: HH:MM:SS.ms" pattern
-        2. Extract current time from "time=HH:MM:SS.ms" pattern
-        3. Calculate percentage: (current_time / total_duration) * 100
+        Lines are matched as raw bytes; only the last stderr lines are kept,
+        and decoded once at the end for error diagnostics.
 
         Args:
             cmd: FFmpeg command list to execute
@@ -220,13 +463,13 @@ class VideoConverter:
             progress_reporter: Optional ProgressReporter for detailed progress
             job_id: Optional job ID for progress reporter
             timeout: Maximum execution time in seconds
+            total_duration: Source duration in seconds, from _probe_duration
 
         Returns:
-            Tuple of (returncode, stdout, stderr)
+            Tuple of (returncode, stdout, stderr); stdout is always empty
 
         Raises:
             asyncio.TimeoutError: If execution exceeds timeout
-            Exception: If FFmpeg process fails
         """
         process = await asyncio.create_subprocess_exec(
             *cmd,
@@ -234,65 +477,65 @@ class VideoConverter:
             stderr=asyncio.subprocess.PIPE,
         )
 
-        stdout_chunks = []
-        stderr_chunks = []
-        total_duration = None
+        stderr_tail: deque[bytes] = deque(maxlen=_STDERR_TAIL_LINES)
 
-        try:
-            while True:
+        async def read_stderr() -> None:
+            async for line in process.stderr:
+                stderr_tail.append(line)
+
+        async def read_progress() -> None:
+            async for line in process.stdout:
+                if not total_duration or not line.startswith(b"out_time_us="):
+                    continue
                 try:
-                    stdout_data, stderr_data = await asyncio.wait_for(
-                        process.communicate(), timeout=timeout
-                    )
+                    # int() accepts ASCII bytes and ignores the trailing newline
+                    current_time = int(line[12:]) / 1_000_000
+                except ValueError:
+                    # "N/A" until the first frame is written
+                    continue
 
-                    if stdout_data:
-                        stdout_chunks.append(stdout_data)
-                    if stderr_data:
-                        stderr_text = stderr_data.decode("utf-8", errors="replace")
-                        stderr_chunks.append(stderr_data)
-
-                        if total_duration is None:
-                            duration_match = _DURATION_REGEX.search(stderr_text)
-                            if duration_match:
-                                h, m, s, ms = map(int, duration_match.groups())
-                                total_duration = h * 3600 + m * 60 + s + ms / 100
-
-                        time_match = _TIME_REGEX.search(stderr_text)
-                        if time_match and total_duration:
-                            h, m, s, ms = map(int, time_match.groups())
-                            current_time = h * 3600 + m * 60 + s + ms / 100
-                            percent = min(100.0, (current_time / total_duration) * 100.0)
-
-                            if progress_callback:
-                                try:
-                                    result = progress_callback(percent)
-                                    if asyncio.iscoroutine(result):
-                                        await result
-                                except Exception as e:
-                                    logger.debug(f"Progress callback error: {e}")
-
-                            if progress_reporter and job_id:
-                                await progress_reporter.update_progress(
-                                    job_id, progress=percent, message=f"Processing: {percent:.1f}%"
-                                )
-
-                    if process.returncode is not None:
-                        break
+                percent = min(100.0, (current_time / total_duration) * 100.0)
+                await self._report_progress(percent, progress_callback, progress_reporter, job_id)
 
+        try:
+            await asyncio.wait_for(
+                asyncio.gather(read_stderr(), read_progress(), process.wait()),
+                timeout=timeout,
+            )
+        except BaseException:
+            if process.returncode is None:
+                # SIGTERM lets FFmpeg finalize the container before exiting;
+                # only force it if it does not stop in time.
+                process.terminate()
+                try:
+                    await asyncio.wait_for(process.wait(), timeout=_TERMINATE_GRACE_SECONDS)
                 except asyncio.TimeoutError:
                     process.kill()
                     await process.wait()
-                    raise
-
-        except Exception:
-            process.kill()
-            await process.wait()
             raise
 
-        stdout = b"".join(stdout_chunks).decode("utf-8", errors="replace")
-        stderr = b"".join(stderr_chunks).decode("utf-8", errors="replace")
+        return process.returncode, "", b"".join(stderr_tail).decode("utf-8", errors="replace")
 
-        return process.returncode or 0, stdout, stderr
+    @staticmethod
+    async def _report_progress(
+        percent: float,
+        progress_callback: Optional[Callable[[float], Any]],
+        progress_reporter: Optional[ProgressReporter],
+        job_id: Optional[str],
+    ) -> None:
+        """Forward a progress percentage to the callback and/or reporter."""
+        if progress_callback:
+            try:
+                result = progress_callback(percent)
+                if asyncio.iscoroutine(result):
+                    await result
+            except Exception as e:
+                logger.debug(f"Progress callback error: {e}")
+
+        if progress_reporter and job_id:
+            await progress_reporter.update_progress(
+                job_id, progress=percent, message=f"Processing: {percent:.1f}%"
+            )
 
     async def extract_audio(
         self,
@@ -319,7 +562,7 @@ class VideoConverter:
             output_path = self.file_manager.resolve_output_path(source, audio_format)
 
         cmd = [
-            "ffmpeg",
+            _FFMPEG,
             "-y",
             "-i",
             str(source),
@@ -332,10 +575,14 @@ class VideoConverter:
         ]
 
         async with concurrency_limiter:
-            returncode, stdout, stderr = await safe_subprocess(cmd, timeout=1800)
+            returncode, stdout, stderr = await safe_subprocess(
+                cmd, timeout=1800, stderr_tail_bytes=STDERR_TAIL_BYTES, decode=False
+            )
 
             if returncode != 0:
-                raise ConversionError(f"Audio extraction failed: {stderr[-200:]}")
+                raise ConversionError(
+                    f"Audio extraction failed: {stderr[-200:].decode(errors='replace')}"
+                )
 
         logger.info(f"Extracted audio from {source} -> {output_path}")
         return output_path
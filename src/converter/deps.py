@@ -5,10 +5,16 @@ and available for the conversion operations.
 """
 
 import asyncio
+import json
+import os
 import shutil
+import subprocess
 import sys
+import tempfile
+import threading
+from collections.abc import Awaitable, Callable
 from pathlib import Path
-from typing import Dict, Tuple
+from typing import Dict, Optional, Tuple
 
 
 class DependencyError(RuntimeError):
@@ -17,13 +23,160 @@ class DependencyError(RuntimeError):
     pass
 
 
+# Probe results as (binary mtime, result), reused until the binary changes on disk;
+# see reset_dependency_cache().
+_ffmpeg_cache: Optional[Tuple[Optional[int], Tuple[bool, str]]] = None
+_calibre_cache: Optional[Tuple[Optional[int], Tuple[bool, str]]] = None
+_which_cache: Dict[str, Optional[str]] = {}
+
+# Seconds a --version probe may take before the binary is reported as unusable
+_PROBE_TIMEOUT = 5
+
+# Guards read-modify-write of DEPS_CACHE_PATH by probes running in worker threads
+_persist_lock = threading.Lock()
+
+# Successful probes from earlier processes, keyed by binary path and mtime, so a
+# server restart can skip the --version subprocesses when nothing was upgraded
+DEPS_CACHE_PATH = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "converter-mcp" / "deps.json"
+)
+
+
+def reset_dependency_cache() -> None:
+    """Forget memoized dependency probes so the next check runs them again."""
+    global _ffmpeg_cache, _calibre_cache
+    _ffmpeg_cache = None
+    _calibre_cache = None
+    _which_cache.clear()
+
+
+def _cached_which(name: str) -> Optional[str]:
+    """Resolve an executable on PATH, scanning PATH only once per name once found.
+
+    Misses are not cached, so a tool installed while the server runs is picked up.
+    """
+    path = _which_cache.get(name)
+    if path is None:
+        path = shutil.which(name)
+        if path is not None:
+            _which_cache[name] = path
+    return path
+
+
+def _binary_stamp(name: str) -> Optional[int]:
+    """Return the mtime of an executable on PATH, or None if it cannot be found."""
+    path = _cached_which(name)
+    if path is None:
+        return None
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        # Removed since it was cached; let the next lookup rescan PATH
+        _which_cache.pop(name, None)
+        return None
+
+
+async def _run_version_probe(cmd: list[str]) -> Tuple[Optional[bytes], str]:
+    """Run a short version command.
+
+    A blocking subprocess.run in a worker thread is cheaper here than an asyncio
+    subprocess, which needs a child watcher and pipe transports for a one-shot read.
+
+    Returns:
+        Tuple of (stdout, problem): stdout is None when the binary timed out or
+        could not be run, and problem then says why.
+    """
+    try:
+        result = await asyncio.to_thread(
+            subprocess.run, cmd, capture_output=True, timeout=_PROBE_TIMEOUT
+        )
+    except subprocess.TimeoutExpired:
+        return None, f"did not answer {cmd[1]} within {_PROBE_TIMEOUT}s"
+    except OSError as e:
+        # E.g. removed or made non-executable between the PATH lookup and the run
+        return None, f"could not be run: {e.strerror or e}"
+    return result.stdout, ""
+
+
+def _load_persisted_probes() -> dict:
+    """Read the on-disk probe cache, ignoring it if unreadable or from another platform."""
+    try:
+        with open(DEPS_CACHE_PATH, encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("platform") != sys.platform:
+        return {}
+    return data
+
+
+def _persist_probe(name: str, path: str, stamp: int, message: str) -> None:
+    """Record a successful probe in the on-disk cache, replacing the file atomically."""
+    # Concurrent probes each read-modify-write the file; serialize them so none is lost
+    with _persist_lock:
+        _write_persisted_probe(name, path, stamp, message)
+
+
+def _write_persisted_probe(name: str, path: str, stamp: int, message: str) -> None:
+    """Merge one probe into the on-disk cache; callers hold _persist_lock."""
+    data = _load_persisted_probes() or {"platform": sys.platform}
+    data[name] = {"path": path, "mtime_ns": stamp, "message": message}
+    try:
+        DEPS_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=DEPS_CACHE_PATH.parent, prefix=".deps-", suffix=".json")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp, DEPS_CACHE_PATH)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+    except OSError:
+        # The cache only saves time; an unwritable cache directory is not an error
+        pass
+
+
+async def _probe_with_persisted_cache(
+    name: str, stamp: Optional[int], probe: Callable[[], Awaitable[Tuple[bool, str]]]
+) -> Tuple[bool, str]:
+    """Run a probe unless an earlier process already verified this exact binary."""
+    if stamp is None:
+        return await probe()
+
+    # The cache file is read and written off the event loop, like the probe itself
+    path = _cached_which(name)
+    entry = (await asyncio.to_thread(_load_persisted_probes)).get(name)
+    if isinstance(entry, dict) and entry.get("path") == path and entry.get("mtime_ns") == stamp:
+        return True, entry["message"]
+
+    result = await probe()
+    if result[0]:
+        await asyncio.to_thread(_persist_probe, name, path, stamp, result[1])
+    return result
+
+
 async def check_ffmpeg() -> Tuple[bool, str]:
     """Check if FFmpeg is installed and return version information.
 
+    The result is memoized until the ffmpeg binary's mtime changes, so an upgrade
+    under a long-running server is picked up with a stat instead of a new process.
+    Successful probes are also kept in DEPS_CACHE_PATH, so later server starts
+    skip the subprocess while the binary is unchanged.
+
     Returns:
         Tuple of (is_installed: bool, message: str)
     """
-    if not shutil.which("ffmpeg"):
+    global _ffmpeg_cache
+    stamp = _binary_stamp("ffmpeg")
+    if _ffmpeg_cache is None or _ffmpeg_cache[0] != stamp:
+        _ffmpeg_cache = (stamp, await _probe_with_persisted_cache("ffmpeg", stamp, _probe_ffmpeg))
+    return _ffmpeg_cache[1]
+
+
+async def _probe_ffmpeg() -> Tuple[bool, str]:
+    """Run the FFmpeg availability check without caching."""
+    ffmpeg = _cached_which("ffmpeg")
+    if not ffmpeg:
         return False, (
             "FFmpeg not found. Install with:\n"
             "  Ubuntu/Debian: sudo apt install ffmpeg\n"
@@ -33,16 +186,12 @@ async def check_ffmpeg() -> Tuple[bool, str]:
         )
 
     # Run ffmpeg -version and parse version information
-    proc = await asyncio.create_subprocess_exec(
-        "ffmpeg",
-        "-version",
-        stdout=asyncio.subprocess.PIPE,
-        stderr=asyncio.subprocess.PIPE,
-    )
-    stdout, _ = await proc.communicate()
+    stdout, problem = await _run_version_probe([ffmpeg, "-version"])
+    if stdout is None:
+        return False, f"FFmpeg at {ffmpeg} {problem}"
 
-    # Get the first line which contains the version info
-    version_line = stdout.decode().split("\n")[0]
+    # Get the first line which contains the version info; the rest is build config
+    version_line = stdout.partition(b"\n")[0].decode(errors="replace")
 
     return True, version_line
 
@@ -50,10 +199,25 @@ async def check_ffmpeg() -> Tuple[bool, str]:
 async def check_calibre() -> Tuple[bool, str]:
     """Check if Calibre ebook-convert is available.
 
+    The result is memoized until the ebook-convert binary's mtime changes.
+
     Returns:
         Tuple of (is_installed: bool, message: str)
     """
-    if not shutil.which("ebook-convert"):
+    global _calibre_cache
+    stamp = _binary_stamp("ebook-convert")
+    if _calibre_cache is None or _calibre_cache[0] != stamp:
+        _calibre_cache = (
+            stamp,
+            await _probe_with_persisted_cache("ebook-convert", stamp, _probe_calibre),
+        )
+    return _calibre_cache[1]
+
+
+async def _probe_calibre() -> Tuple[bool, str]:
+    """Run the Calibre availability check without caching."""
+    ebook_convert = _cached_which("ebook-convert")
+    if not ebook_convert:
         return False, (
             "Calibre not found. Install from:\n"
             "  https://calibre-ebook.com/download_linux\n"
@@ -63,25 +227,26 @@ async def check_calibre() -> Tuple[bool, str]:
         )
 
     # Check version by running ebook-convert --version
-    proc = await asyncio.create_subprocess_exec(
-        "ebook-convert",
-        "--version",
-        stdout=asyncio.subprocess.PIPE,
-        stderr=asyncio.subprocess.PIPE,
-    )
-    stdout, _ = await proc.communicate()
+    stdout, problem = await _run_version_probe([ebook_convert, "--version"])
+    if stdout is None:
+        return False, f"Calibre at {ebook_convert} {problem}"
 
-    return True, stdout.decode().strip()
+    # The first line names the version; the second is the author credit
+    return True, stdout.partition(b"\n")[0].strip().decode(errors="replace")
 
 
-async def check_python_version() -> Tuple[bool, str]:
+async def check_python_version(version_info: Optional[tuple] = None) -> Tuple[bool, str]:
     """Check if Python version meets requirements.
 
+    Args:
+        version_info: Version to check, as a sys.version_info-style tuple.
+            Defaults to the running interpreter's version.
+
     Returns:
         Tuple of (is_compatible: bool, message: str)
     """
-    py_version = sys.version_info
-    py_ok = py_version >= (3, 9)
+    py_version = sys.version_info if version_info is None else version_info
+    py_ok = py_version >= (3, 10)
 
     # Handle both NamedTuple and tuple formats
     if hasattr(py_version, "major"):
@@ -90,7 +255,7 @@ async def check_python_version() -> Tuple[bool, str]:
         message = f"Python {py_version[0]}.{py_version[1]}.{py_version[2]}"
 
     if not py_ok:
-        message += f" - Requires Python 3.9+"
+        message += f" - Requires Python 3.10+"
 
     return py_ok, message
 
@@ -109,16 +274,13 @@ async def verify_dependencies() -> Dict[str, Dict]:
     """
     results = {}
 
-    # Check FFmpeg
-    ffmpeg_ok, ffmpeg_msg = await check_ffmpeg()
-    results["ffmpeg"] = {"installed": ffmpeg_ok, "message": ffmpeg_msg}
+    # Probe FFmpeg and Calibre concurrently so the two subprocess spawns overlap
+    (ffmpeg_ok, ffmpeg_msg), (calibre_ok, calibre_msg), (py_ok, py_msg) = await asyncio.gather(
+        check_ffmpeg(), check_calibre(), check_python_version()
+    )
 
-    # Check Calibre
-    calibre_ok, calibre_msg = await check_calibre()
+    results["ffmpeg"] = {"installed": ffmpeg_ok, "message": ffmpeg_msg}
     results["calibre"] = {"installed": calibre_ok, "message": calibre_msg}
-
-    # Check Python version
-    py_ok, py_msg = await check_python_version()
     results["python"] = {"compatible": py_ok, "message": py_msg}
 
     # Raise error if any critical dependency missing
@@ -8,11 +8,20 @@ and atomic file operations.
 import logging
 import os
 import shutil
+import stat
+import time
 from pathlib import Path
 from typing import Optional
 
 logger = logging.getLogger(__name__)
 
+# Seconds a disk usage reading is reused for the same directory
+DISK_USAGE_TTL = 1.0
+
+_MB = 1024 * 1024
+
+_disk_usage_cache: dict = {}
+
 
 class FileOperationError(RuntimeError):
     """Raised when a file operation fails."""
@@ -20,6 +29,34 @@ class FileOperationError(RuntimeError):
     pass
 
 
+def _require_regular_file(source: Path) -> None:
+    """Check that a source path is an existing regular file, with a single stat.
+
+    Raises:
+        FileOperationError: If the path does not exist or is not a regular file.
+    """
+    try:
+        st = os.stat(source)
+    except (FileNotFoundError, NotADirectoryError):
+        raise FileOperationError(f"Source file does not exist: {source}") from None
+
+    if not stat.S_ISREG(st.st_mode):
+        raise FileOperationError(f"Source path is not a file: {source}")
+
+
+def _disk_usage(directory: Path):
+    """Return shutil.disk_usage for a directory, reusing readings younger than the TTL."""
+    key = str(directory)
+    now = time.monotonic()
+    cached = _disk_usage_cache.get(key)
+    if cached is not None and now - cached[0] < DISK_USAGE_TTL:
+        return cached[1]
+
+    usage = shutil.disk_usage(directory)
+    _disk_usage_cache[key] = (now, usage)
+    return usage
+
+
 class FileManager:
     """Handles file operations with collision handling and disk space checks."""
 
@@ -27,11 +64,23 @@ class FileManager:
         """Initialize FileManager.
 
         Args:
-            output_dir: Optional output directory. If None, uses source file's parent directory.
+            output_dir: Optional output directory, created if missing. If None, uses the
+                source file's parent directory.
             min_disk_space_mb: Minimum disk space required in MB (default: 100).
         """
-        self.output_dir = Path(output_dir) if output_dir else None
+        self.output_dir = None
+        if output_dir:
+            # Resolve and create the directory once so per-conversion calls skip both
+            self.output_dir = Path(output_dir).resolve()
+            try:
+                self.output_dir.mkdir(parents=True, exist_ok=True)
+            except OSError as e:
+                raise FileOperationError(
+                    f"Cannot create output directory {self.output_dir}: {e}"
+                ) from e
         self.min_disk_space_mb = min_disk_space_mb
+        # Names known to be taken per directory, filled on the first collision there
+        self._dir_names: dict[Path, set[str]] = {}
 
     def resolve_output_path(self, source_path: str | Path, target_format: str) -> Path:
         """Resolve output path with collision handling.
@@ -46,13 +95,8 @@ class FileManager:
         Raises:
             FileOperationError: If path validation fails or too many collisions.
         """
-        source = Path(source_path)
-
-        if not source.exists():
-            raise FileOperationError(f"Source file does not exist: {source}")
-
-        if not source.is_file():
-            raise FileOperationError(f"Source path is not a file: {source}")
+        source = source_path if isinstance(source_path, Path) else Path(source_path)
+        _require_regular_file(source)
 
         if self.output_dir:
             out_dir = self.output_dir
@@ -70,20 +114,49 @@ class FileManager:
         output_path = out_dir / output_name
 
         if output_path.exists():
+            existing = self._dir_names.get(out_dir)
+            if existing is None:
+                # List the directory once; later collisions in it reuse the listing
+                with os.scandir(out_dir) as entries:
+                    existing = self._dir_names[out_dir] = {entry.name for entry in entries}
+            existing.add(output_name)
+
             counter = 1
             while True:
                 output_name = f"{source.stem}_{counter}.{target_format}"
-                output_path = out_dir / output_name
-                if not output_path.exists():
-                    logger.debug(f"Collision detected, using renamed path: {output_path}")
-                    break
+                if output_name not in existing:
+                    output_path = out_dir / output_name
+                    # Confirm the pick, since others may have written since the listing
+                    if not output_path.exists():
+                        logger.debug("Collision detected, using renamed path: %s", output_path)
+                        break
+                    existing.add(output_name)
                 counter += 1
                 if counter > 1000:
                     raise FileOperationError(
                         f"Too many file collisions for {source}. Cannot find available output path."
                     )
 
-        logger.info(f"Resolved output path: {output_path}")
+        logger.info("Resolved output path: %s", output_path)
+        return output_path
+
+    def claim_output_path(self, source: Path, target_format: str, claimed: set[Path]) -> Path:
+        """Resolve an output path that is also unused by earlier jobs in a batch.
+
+        Args:
+            source: Path to the source file.
+            target_format: Target file format.
+            claimed: Absolute output paths already handed to other jobs in the batch.
+                Not modified; callers add the returned path themselves.
+
+        Returns:
+            Output Path that neither exists nor is in ``claimed``.
+        """
+        output_path = self.resolve_output_path(source, target_format)
+        counter = 1
+        while output_path.absolute() in claimed or output_path.exists():
+            output_path = output_path.with_name(f"{source.stem}_{counter}.{target_format}")
+            counter += 1
         return output_path
 
     def check_disk_space(self, path: str | Path, required_mb: int | None = None) -> bool:
@@ -99,27 +172,31 @@ class FileManager:
         Raises:
             FileOperationError: If insufficient disk space or path validation fails.
         """
-        check_path = Path(path)
+        check_path = path if isinstance(path, Path) else Path(path)
+
+        try:
+            mode = os.stat(check_path).st_mode
+        except (FileNotFoundError, NotADirectoryError):
+            mode = 0
 
-        if check_path.is_file():
+        if stat.S_ISREG(mode):
             check_path = check_path.parent
-        elif not check_path.is_dir():
+        elif not stat.S_ISDIR(mode):
             raise FileOperationError(f"Invalid path for disk space check: {path}")
 
         required = required_mb or self.min_disk_space_mb
 
         try:
-            usage = shutil.disk_usage(check_path)
-            free_mb = usage.free / (1024 * 1024)
+            usage = _disk_usage(check_path)
         except OSError as e:
             raise FileOperationError(f"Failed to check disk space for {check_path}: {e}") from e
 
-        if free_mb < required:
+        if usage.free < required * _MB:
             raise FileOperationError(
-                f"Insufficient disk space: {free_mb:.1f}MB free, {required}MB required"
+                f"Insufficient disk space: {usage.free / _MB:.1f}MB free, {required}MB required"
             )
 
-        logger.debug(f"Disk space check passed: {free_mb:.1f}MB free at {check_path}")
+        logger.debug("Disk space check passed: %.1fMB free at %s", usage.free / _MB, check_path)
         return True
 
     def atomic_move(self, source: Path, dest: Path) -> Path:
@@ -135,22 +212,38 @@ class FileManager:
         Raises:
             FileOperationError: If the move operation fails.
         """
-        if not source.exists():
-            raise FileOperationError(f"Source file does not exist: {source}")
-
-        if not source.is_file():
-            raise FileOperationError(f"Source path is not a file: {source}")
-
-        dest.parent.mkdir(parents=True, exist_ok=True)
+        # rename() would happily move a directory, so the source type is still checked
+        _require_regular_file(source)
 
         try:
-            os.replace(str(source), str(dest))
-            logger.info(f"Atomically moved {source} -> {dest}")
+            try:
+                os.replace(source, dest)
+            except FileNotFoundError:
+                # The source was just checked, so it is the destination directory that is missing
+                dest.parent.mkdir(parents=True, exist_ok=True)
+                os.replace(source, dest)
+            # The move consumed space, so the next check must re-read it
+            _disk_usage_cache.pop(str(dest.parent), None)
+            names = self._dir_names.get(dest.parent)
+            if names is not None:
+                names.add(dest.name)
+            logger.info("Atomically moved %s -> %s", source, dest)
         except OSError as e:
             raise FileOperationError(f"Failed to move file from {source} to {dest}: {e}") from e
 
         return dest
 
+    def invalidate(self, directory: Optional[Path] = None) -> None:
+        """Forget cached directory listings used for collision handling.
+
+        Args:
+            directory: Directory whose listing to drop. If None, all listings are dropped.
+        """
+        if directory is None:
+            self._dir_names.clear()
+        else:
+            self._dir_names.pop(Path(directory), None)
+
     def validate_path(self, path: str | Path, must_exist: bool = True) -> Path:
         """Validate a file path.
 
@@ -164,7 +257,8 @@ class FileManager:
         Raises:
             FileOperationError: If path validation fails.
         """
-        path = Path(path)
+        if not isinstance(path, Path):
+            path = Path(path)
 
         try:
             path = path.resolve()
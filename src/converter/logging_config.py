@@ -9,6 +9,8 @@ This module provides:
 
 import logging
 import sys
+import time
+import traceback
 from typing import Optional, Dict, Any, Iterator
 from contextlib import contextmanager
 from dataclasses import dataclass
@@ -119,45 +121,42 @@ class ProgressLogger:
         self.logger = logger
         self.total_steps = total_steps
         self.current_step = 0
+        self._started = time.monotonic()
+        # The step total never changes, so bake it into the line template once
+        self._template = (
+            f"[{{step}}/{total_steps or '?'}] {{name}} - Progress: {{progress:.1f}}%{{eta}}"
+        )
 
     def update(self, step_name: str, progress: float, message: Optional[str] = None) -> None:
         """Update progress for a step."""
         self.current_step += 1
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+
         if self.total_steps:
             progress = min(100, (self.current_step / self.total_steps) * 100)
 
-        eta = self._calculate_eta(progress)
-
         if progress >= 100:
             self.logger.info("✓ Conversion complete")
-        else:
-            eta_str = f" (ETA: ~{eta / 60:.1f}m)" if eta else ""
-            msg = f"[{self.current_step}/{self.total_steps or '?'}] {step_name} - Progress: {progress:.1f}%{eta_str}"
-            if message:
-                msg += f" - {message}"
-            self.logger.info(msg)
+            return
+
+        eta = self._calculate_eta(progress)
+        eta_str = f" (ETA: ~{eta / 60:.1f}m)" if eta else ""
+        msg = self._template.format(
+            step=self.current_step, name=step_name, progress=progress, eta=eta_str
+        )
+        if message:
+            msg += f" - {message}"
+        self.logger.info(msg)
 
     def _calculate_eta(self, progress: float) -> Optional[float]:
-        """Calculate estimated time remaining."""
-        if self.current_step == 0 or progress <= 0:
+        """Calculate estimated seconds remaining from wall-clock time elapsed so far."""
+        if progress <= 0:
             return None
         if progress >= 100:
             return 0.0
-
-        # Simple ETA calculation
-        elapsed = (self.current_step / self.total_steps) * progress if self.total_steps else 0
-        if elapsed <= 0:
-            return None
-
-        remaining_percent = 100 - progress
-        remaining_steps = (remaining_percent / progress) * self.current_step if progress > 0 else 0
-
-        if self.total_steps:
-            remaining = self.total_steps - self.current_step
-        else:
-            remaining = remaining_steps
-
-        return (remaining / self.current_step) * elapsed if self.current_step > 0 else None
+        elapsed = time.monotonic() - self._started
+        return elapsed * (100 - progress) / progress
 
 
 def setup_logging(
@@ -221,17 +220,15 @@ def log_conversion_error(
         error: Exception to log
         include_traceback: Whether to include stack trace
     """
-    logger.error(f"Error occurred: {error}")
+    logger.error("Error occurred: %s", error)
 
     if isinstance(error, ConverterError) and error.suggestion:
-        logger.info(f"Suggestion: {error.suggestion}")
+        logger.info("Suggestion: %s", error.suggestion)
 
     if isinstance(error, SystemError) and error.technical_details:
-        logger.debug(f"Technical details: {error.technical_details}")
-
-    if include_traceback:
-        import traceback
+        logger.debug("Technical details: %s", error.technical_details)
 
+    if include_traceback and logger.isEnabledFor(logging.DEBUG):
         logger.debug("\n".join(traceback.format_exception(type(error), error, error.__traceback__)))
 
 
@@ -249,10 +246,13 @@ def log_conversion_start(
         target_format: Target format
         **kwargs: Additional metadata
     """
+    if not logger.isEnabledFor(logging.INFO):
+        return
+
     logger.info("=" * 60)
-    logger.info(f"Starting conversion: {source_file} -> {target_format}")
+    logger.info("Starting conversion: %s -> %s", source_file, target_format)
     for key, value in kwargs.items():
-        logger.info(f"  {key}: {value}")
+        logger.info("  %s: %s", key, value)
     logger.info("=" * 60)
 
 
@@ -272,38 +272,19 @@ def log_conversion_complete(
         output_file: Path to output file (if success)
         **kwargs: Additional metadata
     """
+    if not logger.isEnabledFor(logging.INFO):
+        return
+
     status = "✓ SUCCESS" if success else "✗ FAILED"
     logger.info("=" * 60)
-    logger.info(f"{status} - Conversion completed in {duration_seconds:.2f}s")
+    logger.info("%s - Conversion completed in %.2fs", status, duration_seconds)
     if output_file:
-        logger.info(f"  Output: {output_file}")
+        logger.info("  Output: %s", output_file)
     for key, value in kwargs.items():
-        logger.info(f"  {key}: {value}")
+        logger.info("  %s: %s", key, value)
     logger.info("=" * 60)
 
 
-def capture_warnings() -> Iterator[list]:
-    """Context manager to capture logging warnings.
-
-    Yields:
-        List of captured warning messages.
-    """
-    captured = []
-
-    def warning_handler(msg, *args, **kwargs):
-        captured.append(str(msg))
-
-    logging.captureWarnings(True)
-    original_warning = logging.warn
-    logging.warn = warning_handler
-
-    try:
-        yield captured
-    finally:
-        logging.captureWarnings(False)
-        logging.warn = original_warning
-
-
 @contextmanager
 def capture_warnings() -> Iterator[list]:
     """Context manager to capture logging warnings.
@@ -327,67 +308,5 @@ def capture_warnings() -> Iterator[list]:
         logging.warn = original_warning
 
 
-def log_conversion_start(
-    logger: logging.Logger, source_file: str, target_format: str, **kwargs: Dict[str, Any]
-) -> None:
-    """Log the start of a conversion operation.
-
-    Args:
-        logger: Logger instance
-        source_file: Path to source file
-        target_format: Target format
-        **kwargs: Additional metadata
-    """
-    logger.info("=" * 60)
-    logger.info(f"Starting conversion: {source_file} -> {target_format}")
-    for key, value in kwargs.items():
-        logger.info(f"  {key}: {value}")
-    logger.info("=" * 60)
-
-
-def log_conversion_complete(
-    logger: logging.Logger,
-    success: bool,
-    duration_seconds: float,
-    output_file: Optional[str] = None,
-    **kwargs: Dict[str, Any],
-) -> None:
-    """Log the completion of a conversion operation.
-
-    Args:
-        logger: Logger instance
-        success: Whether conversion succeeded
-        duration_seconds: Duration in seconds
-        output_file: Path to output file (if success)
-        **kwargs: Additional metadata
-    """
-    status = "✓ SUCCESS" if success else "✗ FAILED"
-    logger.info("=" * 60)
-    logger.info(f"{status} - Conversion completed in {duration_seconds:.2f}s")
-    if output_file:
-        logger.info(f"  Output: {output_file}")
-    for key, value in kwargs.items():
-        logger.info(f"  {key}: {value}")
-    logger.info("=" * 60)
-
-
-def log_error(logger: logging.Logger, error: Exception, include_traceback: bool = True) -> None:
-    """Log an error with appropriate formatting.
-
-    Args:
-        logger: Logger instance
-        error: Exception to log
-        include_traceback: Whether to include stack trace
-    """
-    logger.error(f"Error occurred: {error}")
-
-    if isinstance(error, ConverterError) and error.suggestion:
-        logger.info(f"Suggestion: {error.suggestion}")
-
-    if isinstance(error, SystemError) and error.technical_details:
-        logger.debug(f"Technical details: {error.technical_details}")
-
-    if include_traceback:
-        import traceback
-
-        logger.debug("\n".join(traceback.format_exception(type(error), error, error.__traceback__)))
+# Older name kept for existing callers
+log_error = log_conversion_error
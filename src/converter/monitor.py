@@ -1,14 +1,27 @@
 """Resource monitoring and cleanup utilities."""
 
 import asyncio
+import fnmatch
+import functools
 import logging
 import os
-import psutil
+import shutil
 from pathlib import Path
 from typing import Optional
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of directory trees removed in parallel by cleanup_temp_files.
+RMTREE_CONCURRENCY = 8
+
+
+@functools.cache
+def _psutil():
+    """Import psutil on first use; it loads a C extension and reads /proc."""
+    import psutil
+
+    return psutil
+
 
 class ResourceMonitor:
     """Monitor system resources during conversions."""
@@ -16,12 +29,21 @@ class ResourceMonitor:
     def __init__(self, min_disk_space_mb: int = 100):
         self.min_disk_space_mb = min_disk_space_mb
 
+    @functools.cached_property
+    def _process(self):
+        # psutil caches /proc handles and static data on long-lived Process objects
+        return _psutil().Process()
+
+    @functools.cached_property
+    def _total_memory(self) -> int:
+        return _psutil().virtual_memory().total
+
     def get_disk_space(self, path: Path) -> dict:
         """Get disk space information for a path."""
         if path.is_file():
             path = path.parent
 
-        usage = psutil.disk_usage(str(path))
+        usage = _psutil().disk_usage(str(path))
         return {
             "total_gb": usage.total / (1024**3),
             "used_gb": usage.used / (1024**3),
@@ -43,22 +65,31 @@ class ResourceMonitor:
 
     def get_memory_usage(self) -> dict:
         """Get current memory usage."""
-        process = psutil.Process()
-        mem = process.memory_info()
+        mem = self._process.memory_info()
         return {
             "rss_mb": mem.rss / (1024**2),
             "vms_mb": mem.vms / (1024**2),
-            "percent": process.memory_percent(),
+            # Same as Process.memory_percent(), without reading memory_info twice
+            "percent": mem.rss / self._total_memory * 100,
         }
 
     def get_cpu_usage(self) -> float:
         """Get current CPU usage percentage."""
-        return psutil.cpu_percent(interval=0.1)
+        return _psutil().cpu_percent(interval=0.1)
 
     async def detect_zombies(self) -> list[int]:
-        """Detect zombie processes."""
+        """Detect zombie processes.
+
+        Walking the process table is blocking /proc I/O, so it runs in a thread.
+        """
+        return await asyncio.to_thread(self._scan_zombies)
+
+    @staticmethod
+    def _scan_zombies() -> list[int]:
+        """Return the PIDs of zombie processes, reading only pid and status."""
+        psutil = _psutil()
         zombies = []
-        for proc in psutil.process_iter(["pid", "status", "name"]):
+        for proc in psutil.process_iter(["pid", "status"]):
             try:
                 if proc.info["status"] == psutil.STATUS_ZOMBIE:
                     zombies.append(proc.info["pid"])
@@ -71,22 +102,38 @@ class ResourceMonitor:
         if not directory.exists():
             return 0
 
+        files = []
+        dirs = []
+        # DirEntry type checks use d_type from the listing, so no per-entry stat
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if fnmatch.fnmatch(entry.name, pattern):
+                    (dirs if entry.is_dir(follow_symlinks=False) else files).append(entry.path)
+
         cleaned = 0
-        for path in directory.glob(pattern):
+        for path in files:
             try:
-                if path.is_file():
-                    path.unlink()
-                    cleaned += 1
-                elif path.is_dir():
-                    import shutil
-
-                    shutil.rmtree(path)
-                    cleaned += 1
+                os.unlink(path)
+                cleaned += 1
             except Exception as e:
-                logger.warning(f"Failed to cleanup {path}: {e}")
+                logger.warning("Failed to cleanup %s: %s", path, e)
+
+        # Trees take one syscall per entry, so remove several at once in threads
+        limit = asyncio.Semaphore(RMTREE_CONCURRENCY)
+
+        async def remove_tree(path: str) -> bool:
+            async with limit:
+                try:
+                    await asyncio.to_thread(shutil.rmtree, path)
+                    return True
+                except Exception as e:
+                    logger.warning("Failed to cleanup %s: %s", path, e)
+                    return False
+
+        cleaned += sum(await asyncio.gather(*(remove_tree(path) for path in dirs)))
 
         if cleaned > 0:
-            logger.info(f"Cleaned up {cleaned} temp files")
+            logger.info("Cleaned up %d temp files", cleaned)
 
         return cleaned
 
@@ -6,11 +6,16 @@ reporting stages and MCP Context integration.
 """
 
 import asyncio
+import inspect
+import threading
 import time
+import weakref
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Callable, Optional, Any
-from weakref import WeakSet
+from typing import Any, Callable, Optional
 
 from .logging_config import get_logger
 
@@ -27,6 +32,7 @@ class ProgressStage(str, Enum):
     ERROR = "error"
 
 
+# Not slots=True: weakref_slot, needed for the weak-value completed-job map, is 3.11+ only
 @dataclass
 class ProgressInfo:
     """Progress information for a conversion operation."""
@@ -38,6 +44,8 @@ class ProgressInfo:
     message: str = ""
     start_time: float = field(default_factory=time.monotonic)
     metadata: dict = field(default_factory=dict)
+    # Time-independent part of to_dict(), keyed by the fields it is built from
+    _serialized: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
 
     @property
     def elapsed_seconds(self) -> float:
@@ -56,18 +64,29 @@ class ProgressInfo:
         """Check if operation is complete."""
         return self.stage in (ProgressStage.COMPLETE, ProgressStage.ERROR)
 
-    def to_dict(self) -> dict:
-        """Convert to dictionary for serialization."""
-        return {
-            "job_id": self.job_id,
-            "stage": self.stage.value,
-            "progress": self.progress,
-            "total": self.total,
-            "percent_complete": self.percent_complete,
-            "message": self.message,
-            "elapsed_seconds": round(self.elapsed_seconds, 2),
-            "metadata": self.metadata,
-        }
+    def to_dict(self, now: Optional[float] = None) -> dict:
+        """Convert to dictionary for serialization.
+
+        Args:
+            now: Optional time.monotonic() reading to compute elapsed time from, so
+                callers serializing many jobs at once can share one clock read
+        """
+        key = (self.stage, self.progress, self.total, self.message)
+        if self._serialized is None or self._serialized[0] != key:
+            self._serialized = (
+                key,
+                {
+                    "job_id": self.job_id,
+                    "stage": self.stage.value,
+                    "progress": self.progress,
+                    "total": self.total,
+                    "percent_complete": self.percent_complete,
+                    "message": self.message,
+                    "metadata": self.metadata,
+                },
+            )
+        elapsed = (time.monotonic() if now is None else now) - self.start_time
+        return {**self._serialized[1], "elapsed_seconds": round(elapsed, 2)}
 
 
 # Type alias for progress callbacks
@@ -86,6 +105,10 @@ class ProgressReporter:
     # Minimum duration (seconds) before progress reporting kicks in
     MIN_PROGRESS_THRESHOLD = 1.0
 
+    # Minimum spacing (seconds) between notifications for a job within one stage;
+    # faster updates are coalesced and the latest state is flushed on the next tick
+    MIN_UPDATE_INTERVAL = 0.1
+
     def __init__(
         self,
         callback: Optional[AsyncProgressCallback] = None,
@@ -99,9 +122,21 @@ class ProgressReporter:
             mcp_context: Optional MCP Context for report_progress() calls
         """
         self._callback = callback
+        # Decided once here rather than by inspecting every callback result
+        self._callback_is_async = inspect.iscoroutinefunction(callback)
         self._mcp_context = mcp_context
         self._active_jobs: dict[str, ProgressInfo] = {}
-        self._lock = asyncio.Lock()
+        # Finished jobs stay reachable by id for as long as anyone still holds them
+        self._recent_completed: weakref.WeakValueDictionary[str, ProgressInfo] = (
+            weakref.WeakValueDictionary()
+        )
+        # Guards only job creation and removal. Field updates are plain attribute
+        # writes, and notifications run unlocked, so concurrent jobs never queue
+        # behind each other's callbacks.
+        self._lock = threading.Lock()
+        self._last_notified: dict[str, tuple[float, ProgressStage]] = {}
+        self._pending: dict[str, ProgressInfo] = {}
+        self._flush_task: Optional[asyncio.Task] = None
 
     async def start_job(
         self,
@@ -120,18 +155,18 @@ class ProgressReporter:
         Returns:
             ProgressInfo for the new job
         """
-        async with self._lock:
-            info = ProgressInfo(
-                job_id=job_id,
-                stage=ProgressStage.INIT,
-                progress=0.0,
-                total=100.0,
-                message=message,
-                metadata=metadata or {},
-            )
+        info = ProgressInfo(
+            job_id=job_id,
+            stage=ProgressStage.INIT,
+            progress=0.0,
+            total=100.0,
+            message=message,
+            metadata=metadata or {},
+        )
+        with self._lock:
             self._active_jobs[job_id] = info
-            await self._notify(info)
-            return info
+        await self._notify(info)
+        return info
 
     async def update_progress(
         self,
@@ -154,23 +189,29 @@ class ProgressReporter:
         Returns:
             Updated ProgressInfo or None if job not found
         """
-        async with self._lock:
-            info = self._active_jobs.get(job_id)
-            if info is None:
-                logger.warning(f"Progress update for unknown job: {job_id}")
-                return None
-
-            info.progress = progress
-            if stage is not None:
-                info.stage = stage
-            if message is not None:
-                info.message = message
-            if metadata is not None:
-                info.metadata.update(metadata)
-
-            await self._notify(info)
+        info = self._active_jobs.get(job_id)
+        if info is None:
+            logger.warning(f"Progress update for unknown job: {job_id}")
+            return None
+
+        info.progress = progress
+        if stage is not None:
+            info.stage = stage
+        if message is not None:
+            info.message = message
+        if metadata is not None:
+            info.metadata.update(metadata)
+
+        # Young jobs are not reported yet, so skip creating the notification coroutine
+        if (
+            time.monotonic() - info.start_time < self.MIN_PROGRESS_THRESHOLD
+            and not info.is_complete
+        ):
             return info
 
+        await self._notify(info)
+        return info
+
     async def complete_job(
         self,
         job_id: str,
@@ -190,29 +231,30 @@ class ProgressReporter:
         Returns:
             Final ProgressInfo or None if job not found
         """
-        async with self._lock:
-            info = self._active_jobs.get(job_id)
-            if info is None:
-                logger.warning(f"Complete for unknown job: {job_id}")
-                return None
-
-            info.stage = ProgressStage.COMPLETE if success else ProgressStage.ERROR
-            info.progress = info.total
-            if message is not None:
-                info.message = message
-            elif success:
-                info.message = "Conversion complete"
-            else:
-                info.message = "Conversion failed"
-            if metadata is not None:
-                info.metadata.update(metadata)
-
-            await self._notify(info)
-
-            # Remove completed job after notification
-            final_info = info
-            del self._active_jobs[job_id]
-            return final_info
+        info = self._active_jobs.get(job_id)
+        if info is None:
+            logger.warning(f"Complete for unknown job: {job_id}")
+            return None
+
+        info.stage = ProgressStage.COMPLETE if success else ProgressStage.ERROR
+        info.progress = info.total
+        if message is not None:
+            info.message = message
+        elif success:
+            info.message = "Conversion complete"
+        else:
+            info.message = "Conversion failed"
+        if metadata is not None:
+            info.metadata.update(metadata)
+
+        await self._notify(info)
+
+        # Retire the job after notification, unless the id was reused meanwhile
+        with self._lock:
+            if self._active_jobs.get(job_id) is info:
+                del self._active_jobs[job_id]
+            self._recent_completed[job_id] = info
+        return info
 
     async def set_stage(
         self,
@@ -231,42 +273,88 @@ class ProgressReporter:
         Returns:
             Updated ProgressInfo or None if job not found
         """
-        async with self._lock:
-            info = self._active_jobs.get(job_id)
-            if info is None:
-                return None
+        info = self._active_jobs.get(job_id)
+        if info is None:
+            return None
 
-            info.stage = stage
-            if message is not None:
-                info.message = message
+        info.stage = stage
+        if message is not None:
+            info.message = message
 
-            await self._notify(info)
-            return info
+        await self._notify(info)
+        return info
 
     def get_job(self, job_id: str) -> Optional[ProgressInfo]:
         """Get current progress info for a job."""
         return self._active_jobs.get(job_id)
 
+    def get_completed_job(self, job_id: str) -> Optional[ProgressInfo]:
+        """Get final progress info for a finished job that is still referenced elsewhere."""
+        return self._recent_completed.get(job_id)
+
     def get_all_jobs(self) -> dict[str, ProgressInfo]:
         """Get all active jobs."""
-        return self._active_jobs.copy()
+        with self._lock:
+            return self._active_jobs.copy()
 
     async def _notify(self, info: ProgressInfo) -> None:
         """
         Notify callback and MCP context of progress update.
 
-        Internal method - must be called with lock held.
+        Internal method - called without the lock, so callbacks may re-enter.
+        Updates arriving faster than MIN_UPDATE_INTERVAL within the same stage are
+        deferred to the flush loop; stage changes and completion go out at once.
         """
+        now = time.monotonic()
+
         # Skip notification if operation is too fast
-        if info.elapsed_seconds < self.MIN_PROGRESS_THRESHOLD and not info.is_complete:
+        if now - info.start_time < self.MIN_PROGRESS_THRESHOLD and not info.is_complete:
             return
 
+        last = self._last_notified.get(info.job_id)
+        if (
+            not info.is_complete
+            and last is not None
+            and last[1] == info.stage
+            and now - last[0] < self.MIN_UPDATE_INTERVAL
+        ):
+            self._pending[info.job_id] = info
+            if self._flush_task is None or self._flush_task.done():
+                self._flush_task = asyncio.create_task(self._flush_pending())
+            return
+
+        self._pending.pop(info.job_id, None)
+        if info.is_complete:
+            self._last_notified.pop(info.job_id, None)
+        else:
+            self._last_notified[info.job_id] = (now, info.stage)
+        await self._deliver(info)
+
+    async def _flush_pending(self) -> None:
+        """Deliver coalesced updates for all jobs once per MIN_UPDATE_INTERVAL until none remain."""
+        while self._pending:
+            await asyncio.sleep(self.MIN_UPDATE_INTERVAL)
+            pending, self._pending = self._pending, {}
+            now = time.monotonic()
+            # A job that finished meanwhile has already sent its final update
+            ready = [info for info in pending.values() if not info.is_complete]
+            for info in ready:
+                self._last_notified[info.job_id] = (now, info.stage)
+            # Send the whole tick back-to-back instead of one round-trip after another
+            await asyncio.gather(*(self._deliver(info) for info in ready))
+
+    async def _deliver(self, info: ProgressInfo) -> None:
+        """Send one update to the callback and the MCP context."""
         # Call user callback
         if self._callback is not None:
             try:
-                result = self._callback(info)
-                if asyncio.iscoroutine(result):
-                    await result
+                if self._callback_is_async:
+                    await self._callback(info)
+                else:
+                    result = self._callback(info)
+                    # Objects with an async __call__ are not coroutine functions
+                    if result is not None and inspect.isawaitable(result):
+                        await result
             except Exception as e:
                 logger.error(f"Progress callback error: {e}")
 
@@ -398,15 +486,33 @@ def create_progress_callback(
 # Global progress reporter for simple use cases
 _global_reporter: Optional[ProgressReporter] = None
 
+# Per-context override, so a task (and the tasks it spawns) can use its own reporter
+_reporter_var: ContextVar[Optional[ProgressReporter]] = ContextVar(
+    "progress_reporter", default=None
+)
+
 
 def get_progress_reporter() -> ProgressReporter:
-    """Get the global progress reporter instance."""
+    """Get the reporter for the current context, falling back to the global instance."""
+    reporter = _reporter_var.get()
+    if reporter is not None:
+        return reporter
     global _global_reporter
     if _global_reporter is None:
         _global_reporter = ProgressReporter(callback=create_progress_callback())
     return _global_reporter
 
 
+@contextmanager
+def scoped_progress_reporter(reporter: ProgressReporter) -> Iterator[ProgressReporter]:
+    """Use a reporter for the current context only, restoring the previous one on exit."""
+    token = _reporter_var.set(reporter)
+    try:
+        yield reporter
+    finally:
+        _reporter_var.reset(token)
+
+
 def set_progress_reporter(reporter: ProgressReporter) -> None:
     """Set the global progress reporter instance."""
     global _global_reporter
@@ -1,13 +1,15 @@
 """Queue management for conversion operations."""
 
 import asyncio
+import functools
 import logging
+import time
 import uuid
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import Enum
 from pathlib import Path
-from typing import Optional, Callable, Awaitable
+from typing import Optional, Callable, Awaitable, ValuesView
 
 logger = logging.getLogger(__name__)
 
@@ -22,7 +24,17 @@ class JobStatus(str, Enum):
     CANCELLED = "cancelled"
 
 
-@dataclass
+_FINISHED_STATUSES = frozenset({JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED})
+
+
+def _isoformat(timestamp: Optional[float]) -> Optional[str]:
+    """Format a Unix timestamp as ISO 8601 UTC, or pass None through."""
+    if timestamp is None:
+        return None
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc).isoformat()
+
+
+@dataclass(slots=True)
 class ConversionJob:
     """Represents a conversion job in the queue."""
 
@@ -32,11 +44,44 @@ class ConversionJob:
     output_path: Optional[Path]
     quality: str
     status: JobStatus = JobStatus.QUEUED
-    created_at: datetime = field(default_factory=datetime.now)
-    started_at: Optional[datetime] = None
-    completed_at: Optional[datetime] = None
+    # Unix timestamps; datetime.now() goes through the libc local-time path on
+    # every job, so wall-clock values are only turned into datetimes in to_dict()
+    created_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    completed_at: Optional[float] = None
     error_message: Optional[str] = None
     progress: float = 0.0
+    # Set once the job reaches a finished status, so waiters need not poll
+    _done: asyncio.Event = field(
+        default_factory=asyncio.Event, init=False, repr=False, compare=False
+    )
+    # Called with (job, previous status) on every status change; set by the owning queue
+    _status_listener: Optional[Callable[["ConversionJob", JobStatus], None]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        if self.status in _FINISHED_STATUSES:
+            self._done.set()
+
+    def __setattr__(self, name: str, value) -> None:
+        # object.__setattr__ rather than super(): slots=True rebuilds the class, which
+        # leaves zero-argument super() pointing at the original one
+        if name != "status":
+            object.__setattr__(self, name, value)
+            return
+
+        # Status is assigned directly by whoever runs the job, so transitions are
+        # observed here: the queue re-indexes the job and waiters wake on finish.
+        # During __init__ the slots below may not be filled yet, hence getattr.
+        previous = getattr(self, "status", None)
+        object.__setattr__(self, name, value)
+        listener = getattr(self, "_status_listener", None)
+        if listener is not None and previous != value:
+            listener(self, previous)
+        done = getattr(self, "_done", None)
+        if done is not None and value in _FINISHED_STATUSES:
+            done.set()
 
     def to_dict(self) -> dict:
         """Convert job to dictionary for serialization."""
@@ -47,9 +92,9 @@ class ConversionJob:
             "output_path": str(self.output_path) if self.output_path else None,
             "quality": self.quality,
             "status": self.status.value,
-            "created_at": self.created_at.isoformat(),
-            "started_at": self.started_at.isoformat() if self.started_at else None,
-            "completed_at": self.completed_at.isoformat() if self.completed_at else None,
+            "created_at": _isoformat(self.created_at),
+            "started_at": _isoformat(self.started_at),
+            "completed_at": _isoformat(self.completed_at),
             "error_message": self.error_message,
             "progress": self.progress,
         }
@@ -59,11 +104,13 @@ class ConversionQueue:
     """Manages a queue of conversion jobs."""
 
     def __init__(self, max_concurrent: int = 4):
-        self._queue: asyncio.Queue[ConversionJob] = asyncio.Queue()
+        # Created on first use by _get_queue(), so building a queue never touches a loop
+        self._queue: Optional[asyncio.Queue[ConversionJob]] = None
         self._jobs: dict[str, ConversionJob] = {}
         self._max_concurrent = max_concurrent
         self._active_jobs: set[str] = set()
-        self._lock = asyncio.Lock()
+        self._ids_by_status: dict[JobStatus, set[str]] = {status: set() for status in JobStatus}
+        self._lock: Optional[asyncio.Lock] = None
         self._running = False
         self._worker_task: Optional[asyncio.Task] = None
 
@@ -83,20 +130,43 @@ class ConversionQueue:
             quality=quality,
         )
 
-        async with self._lock:
-            self._jobs[job.id] = job
-            await self._queue.put(job)
+        # No await between these steps, so no other task can observe a half-registered job
+        self._jobs[job.id] = job
+        self._ids_by_status[job.status].add(job.id)
+        job._status_listener = self._on_status_change
+        self._get_queue().put_nowait(job)
 
         logger.info(f"Job {job.id} submitted: {source} -> {target_format}")
         return job.id
 
+    def _get_queue(self) -> asyncio.Queue[ConversionJob]:
+        """Return the job queue, creating it and the lock inside the running loop."""
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+            self._lock = asyncio.Lock()
+        return self._queue
+
+    def _get_lock(self) -> asyncio.Lock:
+        """Return the lock guarding multi-step status transitions."""
+        self._get_queue()
+        return self._lock
+
     def get_job(self, job_id: str) -> Optional[ConversionJob]:
         """Get a job by ID."""
         return self._jobs.get(job_id)
 
-    def get_all_jobs(self) -> list[ConversionJob]:
-        """Get all jobs."""
-        return list(self._jobs.values())
+    def get_all_jobs(self) -> ValuesView[ConversionJob]:
+        """Get all jobs as a live read-only view, without copying."""
+        return self._jobs.values()
+
+    def get_jobs_by_status(self, status: JobStatus) -> list[ConversionJob]:
+        """Get the jobs currently in a status, in time proportional to their number."""
+        return [self._jobs[job_id] for job_id in self._ids_by_status[status]]
+
+    def _on_status_change(self, job: ConversionJob, previous: JobStatus) -> None:
+        """Move a job between the per-status indices."""
+        self._ids_by_status[previous].discard(job.id)
+        self._ids_by_status[job.status].add(job.id)
 
     def get_active_count(self) -> int:
         """Get number of active jobs."""
@@ -104,7 +174,7 @@ class ConversionQueue:
 
     async def cancel(self, job_id: str) -> bool:
         """Cancel a job."""
-        async with self._lock:
+        async with self._get_lock():
             job = self._jobs.get(job_id)
             if job and job.status == JobStatus.QUEUED:
                 job.status = JobStatus.CANCELLED
@@ -114,22 +184,19 @@ class ConversionQueue:
 
     async def wait_for_job(self, job_id: str, timeout: Optional[float] = None) -> ConversionJob:
         """Wait for a job to complete."""
-        start = datetime.now()
-
-        while True:
-            job = self._jobs.get(job_id)
-            if not job:
-                raise ValueError(f"Job {job_id} not found")
-
-            if job.status in (JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED):
-                return job
+        job = self._jobs.get(job_id)
+        if not job:
+            raise ValueError(f"Job {job_id} not found")
 
-            if timeout:
-                elapsed = (datetime.now() - start).total_seconds()
-                if elapsed >= timeout:
-                    raise asyncio.TimeoutError(f"Timeout waiting for job {job_id}")
+        try:
+            await asyncio.wait_for(job._done.wait(), timeout=timeout or None)
+        except asyncio.TimeoutError:
+            raise asyncio.TimeoutError(f"Timeout waiting for job {job_id}") from None
 
-            await asyncio.sleep(0.1)
+        return job
 
 
-queue = ConversionQueue()
+@functools.lru_cache(maxsize=1)
+def get_queue() -> ConversionQueue:
+    """Return the shared conversion queue, creating it on first use."""
+    return ConversionQueue()
@@ -5,16 +5,28 @@ supporting video, audio, images, and ebooks.
 """
 
 import asyncio
+import functools
 import logging
+import shutil
 import sys
 import tempfile
 from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import Any
 
+import anyio
 from mcp.server.fastmcp import FastMCP
 
+try:
+    import uvloop  # noqa: F401
+
+    _HAS_UVLOOP = True
+except ImportError:
+    _HAS_UVLOOP = False
+
+from .converters.router import router
 from .deps import DependencyError, verify_dependencies
+from .file_manager import FileManager
 
 
 logging.basicConfig(
@@ -31,9 +43,12 @@ logger = logging.getLogger(__name__)
 class GracefulShutdown:
     """Handle graceful shutdown of the MCP server."""
 
+    # Finished tasks are swept in bulk every this many registrations
+    TASK_SWEEP_INTERVAL = 64
+
     def __init__(self):
         self._shutdown = False
-        self._tasks: set[asyncio.Task] = set()
+        self._tasks: list[asyncio.Task] = []
 
     def is_shutting_down(self) -> bool:
         """Check if shutdown has been initiated."""
@@ -47,11 +62,17 @@ class GracefulShutdown:
 
     def register_task(self, task: asyncio.Task):
         """Register a task to be tracked during shutdown."""
-        self._tasks.add(task)
-        task.add_done_callback(lambda t: self._tasks.discard(t))
+        self._tasks.append(task)
+        if len(self._tasks) % self.TASK_SWEEP_INTERVAL == 0:
+            self._sweep_tasks()
+
+    def _sweep_tasks(self):
+        """Drop finished tasks from the registry."""
+        self._tasks = [t for t in self._tasks if not t.done()]
 
     async def wait_for_tasks(self, timeout: float = 10.0):
         """Wait for registered tasks to complete with timeout."""
+        self._sweep_tasks()
         if not self._tasks:
             return
 
@@ -63,11 +84,23 @@ class GracefulShutdown:
             logger.info("All tasks completed successfully")
         except asyncio.TimeoutError:
             logger.warning(f"Timeout waiting for tasks after {timeout}s")
+        finally:
+            self._sweep_tasks()
 
 
 shutdown_handler = GracefulShutdown()
 
 
+def _remove_temp_dir(temp_dir: Path) -> None:
+    """Remove a temp directory tree, logging instead of raising on failure."""
+    try:
+        if temp_dir.exists():
+            shutil.rmtree(temp_dir)
+            logger.info(f"Removed temp directory: {temp_dir}")
+    except Exception as e:
+        logger.warning(f"Failed to cleanup temp directory {temp_dir}: {e}")
+
+
 @asynccontextmanager
 async def server_lifespan(app: FastMCP):
     """Manage server startup and shutdown.
@@ -102,15 +135,7 @@ async def server_lifespan(app: FastMCP):
         await shutdown_handler.wait_for_tasks()
 
         logger.info("Cleaning up temporary files...")
-        import shutil
-
-        for temp_dir in temp_dirs:
-            try:
-                if temp_dir.exists():
-                    shutil.rmtree(temp_dir)
-                    logger.info(f"Removed temp directory: {temp_dir}")
-            except Exception as e:
-                logger.warning(f"Failed to cleanup temp directory {temp_dir}: {e}")
+        await asyncio.gather(*(asyncio.to_thread(_remove_temp_dir, d) for d in temp_dirs))
 
         logger.info("Server shutdown complete")
 
@@ -158,10 +183,6 @@ async def convert_file(
         ValueError: If source file doesn't exist or target format is invalid
         RuntimeError: If conversion fails
     """
-    from pathlib import Path
-    from .converters.router import router
-    from .file_manager import FileManager
-
     logger.info(f"Conversion requested: {source} -> {target_format}")
 
     if shutdown_handler.is_shutting_down():
@@ -226,14 +247,19 @@ async def list_supported_formats() -> dict[str, list[str]]:
             - image: List of image formats
             - ebook: List of ebook formats
     """
-    from .converters.router import router
+    # Fresh lists per call, so nothing downstream can mutate the cached tables
+    return {category: list(formats) for category, formats in _supported_formats().items()}
 
+
+@functools.lru_cache(maxsize=1)
+def _supported_formats() -> dict[str, tuple[str, ...]]:
+    """Build the supported-formats tables once; the format tables never change."""
     conversions = router.get_supported_conversions()
     return {
-        "image": conversions["image"]["input"],
-        "video": conversions["video"]["input"],
-        "audio": conversions["audio"]["input"],
-        "ebook": conversions["ebook"]["input"],
+        "image": tuple(conversions["image"]["input"]),
+        "video": tuple(conversions["video"]["input"]),
+        "audio": tuple(conversions["audio"]["input"]),
+        "ebook": tuple(conversions["ebook"]["input"]),
     }
 
 
@@ -252,11 +278,17 @@ async def get_conversion_info(source_format: str, target_format: str) -> dict[st
             - quality_options: Available quality presets
             - notes: Any notes about this conversion
     """
-    from .converters.router import router
+    info = _conversion_info(source_format.lower(), target_format.lower())
+    # Copy out of the cache, so callers cannot mutate later responses
+    return {**info, "quality_options": list(info["quality_options"])}
+
 
-    source_format = source_format.lower()
-    target_format = target_format.lower()
+@functools.lru_cache(maxsize=256)
+def _conversion_info(source_format: str, target_format: str) -> dict[str, Any]:
+    """Build the get_conversion_info response for a lowercased format pair.
 
+    The result is shared between calls; get_conversion_info copies it before returning.
+    """
     is_supported = router.is_conversion_supported(source_format, target_format)
 
     try:
@@ -267,7 +299,7 @@ async def get_conversion_info(source_format: str, target_format: str) -> dict[st
     return {
         "supported": is_supported,
         "category": category,
-        "quality_options": ["low", "medium", "high"] if is_supported else [],
+        "quality_options": ("low", "medium", "high") if is_supported else (),
         "notes": (
             f"Direct {category} conversion supported"
             if is_supported
@@ -279,12 +311,14 @@ async def get_conversion_info(source_format: str, target_format: str) -> dict[st
 def main():
     """Main entry point for the MCP server.
 
-    Note: mcp.run() manages its own event loop via anyio, so we call it
-    synchronously without wrapping in asyncio.run().
+    Note: the server manages its own event loop via anyio, so we call it
+    synchronously without wrapping in asyncio.run(). When uvloop is installed
+    (the ``fast`` extra) it drives the loop, which makes the ffmpeg and
+    ebook-convert subprocess spawns and waits cheaper.
     """
     try:
         logger.info("Starting server with stdio transport...")
-        mcp.run(transport="stdio")
+        anyio.run(mcp.run_stdio_async, backend_options={"use_uvloop": _HAS_UVLOOP})
     except KeyboardInterrupt:
         logger.info("Keyboard interrupt received")
         shutdown_handler.initiate_shutdown()
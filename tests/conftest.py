@@ -1,6 +1,5 @@
 """Pytest configuration and fixtures for converter tests."""
 
-import asyncio
 import tempfile
 from pathlib import Path
 from typing import Generator
@@ -11,14 +10,6 @@ import pytest
 pytest_plugins = ["pytest_asyncio"]
 
 
-@pytest.fixture(scope="session")
-def event_loop() -> Generator:
-    """Create event loop for the test session."""
-    loop = asyncio.new_event_loop()
-    yield loop
-    loop.close()
-
-
 @pytest.fixture
 def temp_dir() -> Generator[Path, None, None]:
     """Create a temporary directory for tests."""
@@ -85,17 +76,3 @@ def sample_mp4_file(temp_dir: Path) -> Path:
     # FFmpeg would normally create this, but we'll skip the dependency for setup.
     video_file = temp_dir / "sample.mp4"
     return video_file
-
-
-@pytest.fixture(autouse=True)
-def reset_imports():
-    """Reset Python import cache between tests to ensure clean state."""
-    import sys
-
-    for module in list(sys.modules.keys()):
-        if module.startswith("converter"):
-            del sys.modules[module]
-    yield
-    for module in list(sys.modules.keys()):
-        if module.startswith("converter"):
-            del sys.modules[module]
@@ -1,6 +1,8 @@
 """Unit tests for async utilities module."""
 
 import asyncio
+import errno
+import tempfile
 from unittest.mock import AsyncMock, patch
 
 import pytest
@@ -10,9 +12,11 @@ from src.converter.async_utils import (
     SubprocessError,
     SubprocessTimeoutError,
     TempFileManager,
+    _wait_for_exit,
     cleanup_orphaned_processes,
     kill_process_tree,
     safe_subprocess,
+    semaphore_gather,
 )
 
 
@@ -38,6 +42,44 @@ class TestConcurrencyLimiter:
 
         assert max_active <= 2
 
+    @pytest.mark.asyncio
+    async def test_semaphore_gather_limits_concurrency(self):
+        """Test that semaphore_gather caps concurrency and keeps result order."""
+        active_count = 0
+        max_active = 0
+
+        async def worker(i):
+            nonlocal active_count, max_active
+            active_count += 1
+            max_active = max(max_active, active_count)
+            await asyncio.sleep(0.01)
+            active_count -= 1
+            return i
+
+        results = await semaphore_gather(2, *[worker(i) for i in range(5)])
+
+        assert results == [0, 1, 2, 3, 4]
+        assert max_active == 2
+
+    @pytest.mark.asyncio
+    async def test_limiter_gather_shares_semaphore(self):
+        """Test that ConcurrencyLimiter.gather counts against the limiter's slots."""
+        limiter = ConcurrencyLimiter(max_concurrent=2)
+        active_count = 0
+        max_active = 0
+
+        async def worker():
+            nonlocal active_count, max_active
+            active_count += 1
+            max_active = max(max_active, active_count)
+            await asyncio.sleep(0.01)
+            active_count -= 1
+
+        async with limiter:
+            await limiter.gather(*[worker() for _ in range(3)])
+
+        assert max_active == 1
+
     @pytest.mark.asyncio
     async def test_acquire_and_release(self):
         """Test manual acquire and release."""
@@ -48,9 +90,69 @@ class TestConcurrencyLimiter:
         await limiter.acquire()
         limiter.release()
 
+    @pytest.mark.asyncio
+    async def test_semaphore_reused_within_loop(self):
+        """Test that the same semaphore is returned for the running loop."""
+        limiter = ConcurrencyLimiter(max_concurrent=2)
+
+        assert limiter._get_semaphore() is limiter._get_semaphore()
+
+
+def _mock_process(returncode: int, stdout: bytes = b"", stderr: bytes = b"") -> AsyncMock:
+    """Build a finished process stand-in for create_subprocess_exec."""
+    proc = AsyncMock()
+    proc.communicate = AsyncMock(return_value=(stdout, stderr))
+    proc.wait = AsyncMock(return_value=returncode)
+    proc.returncode = returncode
+    return proc
+
 
+class TestSafeSubprocessMocked:
+    """Test cases for safe_subprocess that do not spawn real processes."""
+
+    @pytest.mark.asyncio
+    async def test_successful_subprocess(self):
+        """Test that captured output is decoded and returned."""
+        with patch(
+            "asyncio.create_subprocess_exec", return_value=_mock_process(0, b"hello\n")
+        ) as mock_exec:
+            returncode, stdout, stderr = await safe_subprocess(["echo", "hello"], timeout=5)
+
+        assert (returncode, stdout, stderr) == (0, "hello\n", "")
+        assert mock_exec.call_args.args == ("echo", "hello")
+
+    @pytest.mark.asyncio
+    async def test_subprocess_with_nonzero_exit(self):
+        """Test that a non-zero exit raises SubprocessError carrying stderr."""
+        with patch("asyncio.create_subprocess_exec", return_value=_mock_process(1, b"", b"boom")):
+            with pytest.raises(SubprocessError) as exc_info:
+                await safe_subprocess(["false"], timeout=5)
+
+        assert exc_info.value.returncode == 1
+        assert exc_info.value.stderr == "boom"
+
+    @pytest.mark.asyncio
+    async def test_subprocess_ignore_nonzero_exit(self):
+        """Test that check_returncode=False returns the exit code instead of raising."""
+        with patch("asyncio.create_subprocess_exec", return_value=_mock_process(1)):
+            returncode, _, _ = await safe_subprocess(["false"], timeout=5, check_returncode=False)
+
+        assert returncode == 1
+
+    @pytest.mark.asyncio
+    async def test_no_output_capture(self):
+        """Test that uncaptured runs wait on the process without communicating."""
+        proc = _mock_process(0)
+        with patch("asyncio.create_subprocess_exec", return_value=proc):
+            result = await safe_subprocess(["true"], timeout=5, capture_output=False)
+
+        assert result == (0, "", "")
+        proc.communicate.assert_not_awaited()
+
+
+@pytest.mark.integration
 class TestSafeSubprocess:
-    """Test cases for safe_subprocess."""
+    """Test cases for safe_subprocess against real processes."""
 
     @pytest.mark.asyncio
     async def test_successful_subprocess(self):
@@ -96,6 +198,41 @@ class TestSafeSubprocess:
 
         assert "error" in stderr
 
+    @pytest.mark.asyncio
+    async def test_stderr_tail_only(self):
+        """Test that stderr_tail_bytes discards stdout and bounds stderr."""
+        returncode, stdout, stderr = await safe_subprocess(
+            ["sh", "-c", "echo out; printf 'x%.0s' $(seq 1 100) >&2; echo end >&2"],
+            timeout=5,
+            stderr_tail_bytes=16,
+        )
+
+        assert returncode == 0
+        assert stdout == ""
+        assert len(stderr) == 16
+        assert stderr.endswith("end\n")
+
+    @pytest.mark.asyncio
+    async def test_stderr_tail_zero_keeps_nothing(self):
+        """Test that stderr_tail_bytes=0 discards stderr instead of keeping all of it."""
+        returncode, stdout, stderr = await safe_subprocess(
+            ["sh", "-c", "echo noisy >&2"], timeout=5, stderr_tail_bytes=0
+        )
+
+        assert returncode == 0
+        assert stderr == ""
+
+    @pytest.mark.asyncio
+    async def test_raw_bytes_output(self):
+        """Test that decode=False returns stdout and stderr as bytes."""
+        returncode, stdout, stderr = await safe_subprocess(
+            ["echo", "hello"], timeout=5, decode=False
+        )
+
+        assert returncode == 0
+        assert stdout == b"hello\n"
+        assert stderr == b""
+
     @pytest.mark.asyncio
     async def test_no_output_capture(self):
         """Test subprocess without output capture."""
@@ -107,6 +244,42 @@ class TestSafeSubprocess:
         assert stdout == ""
         assert stderr == ""
 
+    @pytest.mark.asyncio
+    async def test_no_output_capture_discards_output(self, capfd):
+        """Test that uncaptured output does not reach the parent's stdio."""
+        await safe_subprocess(
+            ["sh", "-c", "echo out; echo err >&2"], timeout=5, capture_output=False
+        )
+
+        captured = capfd.readouterr()
+        assert captured.out == ""
+        assert captured.err == ""
+
+
+class TestWaitForExit:
+    """Test cases for _wait_for_exit."""
+
+    @pytest.mark.asyncio
+    async def test_wait_for_killed_process(self):
+        """Test that a killed process is detected as exited."""
+        proc = await asyncio.create_subprocess_exec("sleep", "10")
+        proc.kill()
+
+        await _wait_for_exit(proc, timeout=5.0)
+
+        assert await proc.wait() != 0
+
+    @pytest.mark.asyncio
+    async def test_wait_times_out_for_running_process(self):
+        """Test that a still-running process raises TimeoutError."""
+        proc = await asyncio.create_subprocess_exec("sleep", "10")
+        try:
+            with pytest.raises(asyncio.TimeoutError):
+                await _wait_for_exit(proc, timeout=0.1)
+        finally:
+            proc.kill()
+            await proc.wait()
+
 
 class TestTempFileManager:
     """Test cases for TempFileManager."""
@@ -136,6 +309,17 @@ class TestTempFileManager:
 
         assert not temp_dir.exists()
 
+    def test_cleanup_nested_directories(self):
+        """Test cleanup of temp directories with nested subdirectories."""
+        with TempFileManager() as manager:
+            temp_dir = manager.create_dir()
+            nested = temp_dir / "a" / "b" / "c"
+            nested.mkdir(parents=True)
+            (nested / "deep.txt").write_text("deep")
+            (temp_dir / "a" / "shallow.txt").write_text("shallow")
+
+        assert not temp_dir.exists()
+
     def test_multiple_temp_files(self):
         """Test multiple temp files in the same manager."""
         with TempFileManager() as manager:
@@ -146,6 +330,51 @@ class TestTempFileManager:
         for f in files:
             assert not f.exists()
 
+    def test_create_file_batch(self):
+        """Test batch temp file creation and cleanup."""
+        with TempFileManager(suffix=".part") as manager:
+            files = manager.create_file_batch(4)
+            assert len(set(files)) == 4
+            for f in files:
+                assert f.exists()
+                assert f.suffix == ".part"
+
+        for f in files:
+            assert not f.exists()
+
+    def test_anonymous_file_has_no_directory_entry(self, tmp_path):
+        """Test that anonymous scratch files never appear in the directory."""
+        with TempFileManager(dir_path=tmp_path) as manager:
+            handle = manager.create_anonymous_file()
+            handle.write(b"scratch")
+            handle.seek(0)
+
+            assert handle.read() == b"scratch"
+            assert list(tmp_path.iterdir()) == []
+
+        assert handle.closed
+
+    def test_create_file_batch_failure_keeps_created_files_tracked(self, tmp_path):
+        """Test that files made before a failed mkstemp are still cleaned up."""
+        real_mkstemp = tempfile.mkstemp
+        calls = 0
+
+        def flaky_mkstemp(*args, **kwargs):
+            nonlocal calls
+            calls += 1
+            if calls == 3:
+                raise OSError(errno.ENOSPC, "No space left on device")
+            return real_mkstemp(*args, **kwargs)
+
+        manager = TempFileManager(dir_path=tmp_path)
+        with patch("tempfile.mkstemp", side_effect=flaky_mkstemp):
+            with pytest.raises(OSError):
+                manager.create_file_batch(4)
+
+        assert len(list(tmp_path.iterdir())) == 2
+        manager.cleanup()
+        assert list(tmp_path.iterdir()) == []
+
     def test_custom_prefix_suffix(self):
         """Test custom prefix and suffix for temp files."""
         with TempFileManager(prefix="test_", suffix=".tmp") as manager:
@@ -45,7 +45,7 @@ class TestAudioConverter:
             "mp3",
         )
 
-        assert "ffmpeg" in cmd
+        assert Path(cmd[0]).name == "ffmpeg"
         assert "-i" in cmd
         assert "/tmp/test.wav" in cmd
         assert "/tmp/test.mp3" in cmd
@@ -60,3 +60,18 @@ class TestAudioConverter:
             await converter.convert("test.mp3", "mid")
 
         assert "not supported" in str(exc_info.value).lower()
+
+    @pytest.mark.asyncio
+    async def test_get_audio_info_parses_ffprobe_json(self):
+        """Test that raw ffprobe output is parsed as JSON."""
+        converter = AudioConverter()
+        ffprobe_output = b'{"format": {"duration": "1.5"}, "streams": []}'
+
+        with patch(
+            "src.converter.converters.audio.safe_subprocess",
+            AsyncMock(return_value=(0, ffprobe_output, b"")),
+        ):
+            info = await converter.get_audio_info("/tmp/test.mp3")
+
+        assert info["format"]["duration"] == "1.5"
+        assert info["streams"] == []
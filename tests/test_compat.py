@@ -0,0 +1,53 @@
+"""Tests that the stdlib-only modules import on the minimum supported Python."""
+
+import re
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Modules that only need the standard library, so the bare minimum interpreter can import them
+STDLIB_ONLY_MODULES = [
+    "src.converter.logging_config",
+    "src.converter.progress",
+    "src.converter.queue",
+]
+
+
+def _minimum_python() -> str:
+    """Return the lowest "major.minor" allowed by requires-python."""
+    pyproject = (ROOT / "pyproject.toml").read_text()
+    return re.search(r'requires-python\s*=\s*">=(\d+\.\d+)', pyproject).group(1)
+
+
+@pytest.fixture(scope="module")
+def minimum_interpreter() -> str:
+    """Locate an interpreter of the minimum supported version, or skip."""
+    version = _minimum_python()
+    exe = shutil.which(f"python{version}")
+    if exe is None:
+        pytest.skip(f"python{version} not installed")
+    probe = subprocess.run(
+        [exe, "-c", "import sys; print('%d.%d' % sys.version_info[:2])"],
+        capture_output=True,
+        text=True,
+    )
+    if probe.returncode != 0 or probe.stdout.strip() != version:
+        pytest.skip(f"python{version} is not runnable here")
+    return exe
+
+
+@pytest.mark.parametrize("module", STDLIB_ONLY_MODULES)
+def test_imports_on_minimum_python(minimum_interpreter, module):
+    """Test that the module imports under the oldest interpreter requires-python allows."""
+    result = subprocess.run(
+        [minimum_interpreter, "-c", f"import {module}"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+    )
+
+    assert result.returncode == 0, result.stderr
@@ -82,6 +82,13 @@ class TestConverterConfig:
         assert cfg.get_timeout_for_format("jpg") == 300
         assert cfg.get_timeout_for_format("png") == 300
 
+    def test_get_timeout_for_format_follows_updates(self):
+        """Test that timeouts changed after construction are picked up."""
+        cfg = ConverterConfig()
+        cfg.video_timeout = 42
+
+        assert cfg.get_timeout_for_format("MKV") == 42
+
     def test_global_config_instance(self):
         """Test global config instance exists."""
         assert config is not None
@@ -1,9 +1,11 @@
 """Unit tests for dependency verification module."""
 
-import asyncio
+import json
+import subprocess
 import sys
-from types import SimpleNamespace
-from unittest.mock import AsyncMock, patch
+import threading
+from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -13,10 +15,54 @@ from src.converter.deps import (
     check_ffmpeg,
     check_python_version,
     get_dependency_summary,
+    reset_dependency_cache,
     verify_dependencies,
 )
 
 
+def _completed(stdout: bytes) -> subprocess.CompletedProcess:
+    """Build the result of a version probe that printed stdout."""
+    return subprocess.CompletedProcess([], 0, stdout=stdout, stderr=b"")
+
+
+def _version_run(outputs: dict):
+    """Build a subprocess.run stand-in that answers each binary with its own output."""
+
+    def run(cmd, **kwargs):
+        return _completed(outputs[Path(cmd[0]).name])
+
+    return run
+
+
+@pytest.fixture(autouse=True)
+def fresh_dependency_cache(tmp_path, monkeypatch):
+    """Run every test against unmemoized probes and an empty on-disk cache."""
+    monkeypatch.setattr("src.converter.deps.DEPS_CACHE_PATH", tmp_path / "deps.json")
+    reset_dependency_cache()
+    yield
+    reset_dependency_cache()
+
+
+@pytest.fixture
+def mock_dep_subprocess(monkeypatch):
+    """Return a factory that fakes PATH lookups and version probes for both binaries."""
+
+    def make(
+        ffmpeg_out: bytes = b"ffmpeg version 6.0",
+        calibre_out: bytes = b"calibre 7.0.0",
+        calibre_missing: bool = False,
+    ) -> None:
+        monkeypatch.setattr(
+            "shutil.which",
+            lambda name: None if calibre_missing and name == "ebook-convert" else name,
+        )
+        monkeypatch.setattr(
+            "subprocess.run", _version_run({"ffmpeg": ffmpeg_out, "ebook-convert": calibre_out})
+        )
+
+    return make
+
+
 class TestCheckFFmpeg:
     """Test cases for FFmpeg dependency checking."""
 
@@ -26,14 +72,9 @@ class TestCheckFFmpeg:
         # Mock subprocess output with FFmpeg version
         mock_version_output = b"ffmpeg version 6.0 Copyright (c) 2000-2023 the FFmpeg developers"
 
-        # Create mock process
-        mock_proc = AsyncMock()
-        mock_proc.communicate = AsyncMock(return_value=(mock_version_output, b""))
-        mock_proc.wait = AsyncMock(return_value=0)
-
         with (
             patch("shutil.which", return_value="/usr/bin/ffmpeg"),
-            patch("asyncio.create_subprocess_exec", return_value=mock_proc),
+            patch("subprocess.run", return_value=_completed(mock_version_output)),
         ):
             is_installed, message = await check_ffmpeg()
 
@@ -41,6 +82,22 @@ class TestCheckFFmpeg:
             assert isinstance(message, str)
             assert "ffmpeg" in message.lower()
 
+    @pytest.mark.asyncio
+    async def test_ffmpeg_probe_timeout(self):
+        """Test that an ffmpeg binary that hangs on -version is reported as unusable."""
+        with (
+            patch("shutil.which", return_value="/usr/bin/ffmpeg"),
+            patch(
+                "subprocess.run",
+                side_effect=subprocess.TimeoutExpired(["/usr/bin/ffmpeg", "-version"], 5),
+            ) as mock_run,
+        ):
+            is_installed, message = await check_ffmpeg()
+
+        assert is_installed is False
+        assert "did not answer" in message
+        assert mock_run.call_args.kwargs["timeout"] == 5
+
     @pytest.mark.asyncio
     async def test_ffmpeg_not_found(self):
         """Test that missing FFmpeg is properly reported."""
@@ -51,6 +108,20 @@ class TestCheckFFmpeg:
             assert "not found" in message.lower()
             assert "install" in message.lower()
 
+    @pytest.mark.asyncio
+    async def test_ffmpeg_message_is_first_line(self):
+        """Test that only the version line of the -version output is reported."""
+        output = (
+            b"ffmpeg version 6.1.1 Copyright (c) 2000-2023\nbuilt with gcc 13\nconfiguration: ...\n"
+        )
+        with (
+            patch("shutil.which", return_value="/usr/bin/ffmpeg"),
+            patch("subprocess.run", return_value=_completed(output)),
+        ):
+            _, message = await check_ffmpeg()
+
+        assert message == "ffmpeg version 6.1.1 Copyright (c) 2000-2023"
+
 
 class TestCheckCalibre:
     """Test cases for Calibre dependency checking."""
@@ -61,14 +132,9 @@ class TestCheckCalibre:
         # Mock subprocess output with Calibre version
         mock_version_output = b"calibre 7.0.0  [Linux x86_64]"
 
-        # Create mock process
-        mock_proc = AsyncMock()
-        mock_proc.communicate = AsyncMock(return_value=(mock_version_output, b""))
-        mock_proc.wait = AsyncMock(return_value=0)
-
         with (
             patch("shutil.which", return_value="/usr/bin/ebook-convert"),
-            patch("asyncio.create_subprocess_exec", return_value=mock_proc),
+            patch("subprocess.run", return_value=_completed(mock_version_output)),
         ):
             is_installed, message = await check_calibre()
 
@@ -76,6 +142,18 @@ class TestCheckCalibre:
             assert isinstance(message, str)
             assert "calibre" in message.lower()
 
+    @pytest.mark.asyncio
+    async def test_calibre_message_is_first_line(self):
+        """Test that the author credit after the version line is dropped."""
+        output = b"ebook-convert (calibre 7.0.0)\nCreated by: Kovid Goyal\n"
+        with (
+            patch("shutil.which", return_value="/usr/bin/ebook-convert"),
+            patch("subprocess.run", return_value=_completed(output)),
+        ):
+            _, message = await check_calibre()
+
+        assert message == "ebook-convert (calibre 7.0.0)"
+
     @pytest.mark.asyncio
     async def test_calibre_not_found(self):
         """Test that missing Calibre is properly reported."""
@@ -87,12 +165,177 @@ class TestCheckCalibre:
             assert "install" in message.lower()
 
 
+class TestDependencyCache:
+    """Test cases for memoized dependency probes."""
+
+    @pytest.mark.asyncio
+    async def test_probe_runs_once(self):
+        """Test that repeated checks reuse the first probe result."""
+        with (
+            patch("shutil.which", return_value="/usr/bin/ffmpeg"),
+            patch("subprocess.run", return_value=_completed(b"ffmpeg version 6.0")) as mock_run,
+        ):
+            first = await check_ffmpeg()
+            second = await check_ffmpeg()
+
+        assert first == second
+        assert mock_run.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_probe_execs_resolved_path(self, tmp_path):
+        """Test that the probe runs the path found on PATH, without a second lookup."""
+        # A real file, so the mtime stamp does not treat the binary as removed
+        ffmpeg = tmp_path / "ffmpeg"
+        ffmpeg.touch()
+        with (
+            patch("shutil.which", return_value=str(ffmpeg)) as mock_which,
+            patch("subprocess.run", return_value=_completed(b"ffmpeg version 6.0")) as mock_run,
+        ):
+            await check_ffmpeg()
+
+        assert mock_run.call_args.args[0][0] == str(ffmpeg)
+        assert mock_which.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_repeated_verification_reuses_lookups(self, tmp_path):
+        """Test that repeated verify_dependencies calls neither rescan PATH nor reprobe."""
+        outputs = {"ffmpeg": b"ffmpeg version 6.0", "ebook-convert": b"calibre 7.0.0"}
+        for name in outputs:
+            (tmp_path / name).touch()
+
+        with (
+            patch("shutil.which", side_effect=lambda name: str(tmp_path / name)) as mock_which,
+            patch("subprocess.run", side_effect=_version_run(outputs)) as mock_run,
+        ):
+            await verify_dependencies()
+            await verify_dependencies()
+
+        assert sorted(c.args[0] for c in mock_which.call_args_list) == ["ebook-convert", "ffmpeg"]
+        assert mock_run.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_changed_binary_reprobed(self):
+        """Test that a new mtime on the binary invalidates the memoized result."""
+        mtimes = [1, 1, 2]
+
+        with (
+            patch("shutil.which", return_value="/usr/bin/ffmpeg"),
+            patch("src.converter.deps._binary_stamp", side_effect=mtimes),
+            patch("subprocess.run", return_value=_completed(b"ffmpeg version 6.0")) as mock_run,
+        ):
+            await check_ffmpeg()
+            await check_ffmpeg()
+            assert mock_run.call_count == 1
+
+            await check_ffmpeg()
+            assert mock_run.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_binary_installed_later_is_detected(self):
+        """Test that a missing binary is looked up again instead of cached as absent."""
+        with patch("shutil.which", return_value=None):
+            assert (await check_ffmpeg())[0] is False
+
+        with (
+            patch("shutil.which", return_value="/usr/bin/ffmpeg"),
+            patch("src.converter.deps._binary_stamp", return_value=1),
+            patch("subprocess.run", return_value=_completed(b"ffmpeg version 6.0")),
+        ):
+            assert await check_ffmpeg() == (True, "ffmpeg version 6.0")
+
+    @pytest.mark.asyncio
+    async def test_binary_removed_later_is_reported_missing(self, tmp_path, monkeypatch):
+        """Test that a binary deleted after a successful probe is reported, not raised."""
+        bin_dir = tmp_path / "bin"
+        bin_dir.mkdir()
+        ffmpeg = bin_dir / "ffmpeg"
+        ffmpeg.write_text("#!/bin/sh\necho 'ffmpeg version 9.9'\n")
+        ffmpeg.chmod(0o755)
+        monkeypatch.setenv("PATH", str(bin_dir))
+
+        assert await check_ffmpeg() == (True, "ffmpeg version 9.9")
+
+        ffmpeg.unlink()
+        is_installed, message = await check_ffmpeg()
+
+        assert is_installed is False
+        assert "not found" in message.lower()
+
+    @pytest.mark.asyncio
+    async def test_unrunnable_binary_is_reported(self):
+        """Test that an OSError from the version probe becomes a not-usable result."""
+        with (
+            patch("shutil.which", return_value="/usr/bin/ffmpeg"),
+            patch("subprocess.run", side_effect=PermissionError(13, "Permission denied")),
+        ):
+            is_installed, message = await check_ffmpeg()
+
+        assert is_installed is False
+        assert message == "FFmpeg at /usr/bin/ffmpeg could not be run: Permission denied"
+
+    @pytest.mark.asyncio
+    async def test_persisted_probe_skips_subprocess(self):
+        """Test that a later process reuses a probe recorded for the same binary."""
+        with (
+            patch("shutil.which", return_value="/usr/bin/ffmpeg"),
+            patch("src.converter.deps._binary_stamp", return_value=7),
+            patch("subprocess.run", return_value=_completed(b"ffmpeg version 6.0")) as mock_run,
+        ):
+            first = await check_ffmpeg()
+            reset_dependency_cache()
+            second = await check_ffmpeg()
+
+        assert first == second == (True, "ffmpeg version 6.0")
+        assert mock_run.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_probes_all_persisted(self, mock_dep_subprocess, tmp_path):
+        """Test that probes finishing together do not drop each other's cache entries."""
+        mock_dep_subprocess()
+
+        with patch("src.converter.deps._binary_stamp", return_value=1):
+            await verify_dependencies()
+
+        data = json.loads((tmp_path / "deps.json").read_text())
+        assert {"ffmpeg", "ebook-convert"} <= data.keys()
+
+    @pytest.mark.asyncio
+    async def test_persisted_probe_ignored_after_upgrade(self):
+        """Test that a recorded probe is not reused once the binary's mtime changes."""
+        mtimes = [7, 8]
+
+        with (
+            patch("shutil.which", return_value="/usr/bin/ffmpeg"),
+            patch("src.converter.deps._binary_stamp", side_effect=mtimes),
+            patch("subprocess.run", return_value=_completed(b"ffmpeg version 6.0")) as mock_run,
+        ):
+            await check_ffmpeg()
+            reset_dependency_cache()
+            await check_ffmpeg()
+
+        assert mock_run.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_reset_forces_new_probe(self):
+        """Test that reset_dependency_cache discards memoized results."""
+        with patch("shutil.which", return_value=None):
+            assert (await check_calibre())[0] is False
+
+        reset_dependency_cache()
+
+        with (
+            patch("shutil.which", return_value="/usr/bin/ebook-convert"),
+            patch("subprocess.run", return_value=_completed(b"calibre 7.0.0")),
+        ):
+            assert (await check_calibre())[0] is True
+
+
 class TestCheckPythonVersion:
     """Test cases for Python version checking."""
 
     @pytest.mark.asyncio
     async def test_python_version_compatible(self):
-        """Test Python version 3.9+ is accepted."""
+        """Test Python version 3.10+ is accepted."""
         # Use actual Python 3.10+ is already compatible
         is_compatible, message = await check_python_version()
 
@@ -101,63 +344,61 @@ class TestCheckPythonVersion:
 
     @pytest.mark.asyncio
     async def test_python_version_incompatible(self):
-        """Test Python version below 3.9 is rejected."""
-        # Temporarily replace sys.version_info for testing
-        original_version_info = sys.version_info
-        sys.version_info = (3, 8, 0, "final", 0)  # Actual tuple format
+        """Test Python version below 3.10 is rejected."""
+        is_compatible, message = await check_python_version((3, 9, 18, "final", 0))
+
+        assert is_compatible is False
+        assert "3.9.18" in message
+        assert "3.10+" in message
 
-        try:
-            is_compatible, message = await check_python_version()
+    @pytest.mark.asyncio
+    async def test_python_version_explicit_compatible(self):
+        """Test that an explicit supported version is accepted."""
+        is_compatible, message = await check_python_version((3, 10, 2, "final", 0))
 
-            assert is_compatible is False
-            assert "3.8" in message
-            assert "3.9" in message
-        finally:
-            sys.version_info = original_version_info
+        assert is_compatible is True
+        assert message == "Python 3.10.2"
 
 
 class TestVerifyDependencies:
     """Test cases for dependency verification function."""
 
     @pytest.mark.asyncio
-    async def test_all_dependencies_present(self):
+    async def test_all_dependencies_present(self, mock_dep_subprocess, monkeypatch):
         """Test successful verification when all dependencies are present."""
-        # Mock all dependencies as present
-        mock_ffmpeg_output = b"ffmpeg version 6.0 Copyright (c) 2000-2023 the FFmpeg developers"
-        mock_calibre_output = b"calibre 7.0.0 [Linux x86_64]"
-
-        # Track subprocess calls
-        call_count = [0]
-
-        def mock_subprocess_side_effect(*args, **kwargs):
-            proc = AsyncMock()
-            call_count[0] += 1
-
-            if call_count[0] == 1:  # First call is for ffmpeg
-                proc.communicate = AsyncMock(return_value=(mock_ffmpeg_output, b""))
-            else:  # Second call is for calibre
-                proc.communicate = AsyncMock(return_value=(mock_calibre_output, b""))
-
-            proc.wait = AsyncMock(return_value=0)
-            return proc
-
-        with patch("shutil.which", side_effect=lambda x: x):
-            with patch("asyncio.create_subprocess_exec", side_effect=mock_subprocess_side_effect):
-                # Temporarily replace sys.version_info for testing
-                original_version_info = sys.version_info
-                sys.version_info = (3, 10, 0, "final", 0)  # Actual tuple format
-
-                try:
-                    results = await verify_dependencies()
-
-                    assert "ffmpeg" in results
-                    assert results["ffmpeg"]["installed"] is True
-                    assert "calibre" in results
-                    assert results["calibre"]["installed"] is True
-                    assert "python" in results
-                    assert results["python"]["compatible"] is True
-                finally:
-                    sys.version_info = original_version_info
+        mock_dep_subprocess(
+            ffmpeg_out=b"ffmpeg version 6.0 Copyright (c) 2000-2023 the FFmpeg developers",
+            calibre_out=b"calibre 7.0.0 [Linux x86_64]",
+        )
+        monkeypatch.setattr(sys, "version_info", (3, 10, 0, "final", 0))
+
+        results = await verify_dependencies()
+
+        assert "ffmpeg" in results
+        assert results["ffmpeg"]["installed"] is True
+        assert "calibre" in results
+        assert results["calibre"]["installed"] is True
+        assert "python" in results
+        assert results["python"]["compatible"] is True
+
+    @pytest.mark.asyncio
+    async def test_probes_run_concurrently(self, mock_dep_subprocess, monkeypatch):
+        """Test that the FFmpeg and Calibre probes are in flight at the same time."""
+        mock_dep_subprocess()
+        probe = _version_run({"ffmpeg": b"ffmpeg version 6.0", "ebook-convert": b"calibre 7.0.0"})
+        # Each probe blocks until the other arrives, so serial probing breaks the barrier
+        both_running = threading.Barrier(2, timeout=2)
+
+        def run(cmd, **kwargs):
+            both_running.wait()
+            return probe(cmd, **kwargs)
+
+        monkeypatch.setattr("subprocess.run", run)
+
+        results = await verify_dependencies()
+
+        assert results["ffmpeg"]["installed"] is True
+        assert results["calibre"]["installed"] is True
 
     @pytest.mark.asyncio
     async def test_missing_ffmpeg_raises_error(self):
@@ -170,109 +411,50 @@ class TestVerifyDependencies:
             assert "required" in str(exc_info.value).lower()
 
     @pytest.mark.asyncio
-    async def test_missing_calibre_raises_error(self):
+    async def test_missing_calibre_raises_error(self, mock_dep_subprocess, monkeypatch):
         """Test that missing Calibre raises DependencyError."""
-        # Create mock processes for ffmpeg and calibre
-        call_count = [0]
-
-        def mock_subprocess_side_effect(*args, **kwargs):
-            call_count[0] += 1
-
-            mock_proc = AsyncMock()
-            if call_count[0] == 1:  # First call is for ffmpeg
-                mock_proc.communicate = AsyncMock(return_value=(b"ffmpeg version 6.0", b""))
-            else:  # Second call is for calibre (should fail)
-                # Return error message for calibre
-                mock_proc.communicate = AsyncMock(
-                    return_value=(b"", b"error: ebook-convert not found")
-                )
-
-            mock_proc.wait = AsyncMock(return_value=0)
-            return mock_proc
-
-        with patch("shutil.which", side_effect=lambda x: "ffmpeg" if x == "ffmpeg" else None):
-            with patch("asyncio.create_subprocess_exec", side_effect=mock_subprocess_side_effect):
-                # Temporarily replace sys.version_info for testing
-                original_version_info = sys.version_info
-                sys.version_info = (3, 10, 0, "final", 0)  # Actual tuple format
-
-                try:
-                    with pytest.raises(DependencyError) as exc_info:
-                        await verify_dependencies()
-
-                    assert "calibre" in str(exc_info.value).lower()
-                    assert "required" in str(exc_info.value).lower()
-                finally:
-                    sys.version_info = original_version_info
+        mock_dep_subprocess(calibre_missing=True)
+        monkeypatch.setattr(sys, "version_info", (3, 10, 0, "final", 0))
+
+        with pytest.raises(DependencyError) as exc_info:
+            await verify_dependencies()
+
+        assert "calibre" in str(exc_info.value).lower()
+        assert "required" in str(exc_info.value).lower()
 
     @pytest.mark.asyncio
-    async def test_incompatible_python_raises_error(self):
+    async def test_incompatible_python_raises_error(self, mock_dep_subprocess, monkeypatch):
         """Test that incompatible Python version raises DependencyError."""
-        # Create mock process for ffmpeg
-        mock_ffmpeg_proc = AsyncMock()
-        mock_ffmpeg_proc.communicate = AsyncMock(return_value=(b"ffmpeg version 6.0", b""))
-        mock_ffmpeg_proc.wait = AsyncMock(return_value=0)
-
-        with patch("shutil.which", side_effect=lambda x: x):
-            with patch("asyncio.create_subprocess_exec", return_value=mock_ffmpeg_proc):
-                # Temporarily replace sys.version_info for testing
-                original_version_info = sys.version_info
-                sys.version_info = (3, 8, 0, "final", 0)  # Actual tuple format
+        mock_dep_subprocess()
+        monkeypatch.setattr(sys, "version_info", (3, 8, 0, "final", 0))
 
-                try:
-                    with pytest.raises(DependencyError) as exc_info:
-                        await verify_dependencies()
+        with pytest.raises(DependencyError) as exc_info:
+            await verify_dependencies()
 
-                    assert "python" in str(exc_info.value).lower()
-                    assert "version too old" in str(exc_info.value).lower()
-                finally:
-                    sys.version_info = original_version_info
+        assert "python" in str(exc_info.value).lower()
+        assert "version too old" in str(exc_info.value).lower()
 
 
 class TestGetDependencySummary:
     """Test cases for dependency summary generation."""
 
     @pytest.mark.asyncio
-    async def test_summary_format(self):
+    async def test_summary_format(self, mock_dep_subprocess, monkeypatch):
         """Test that summary has correct format."""
-        mock_ffmpeg_output = b"ffmpeg version 6.0"
-        mock_calibre_output = b"calibre 7.0.0"
-
-        # Track subprocess calls
-        call_count = [0]
-
-        def mock_subprocess_side_effect(*args, **kwargs):
-            proc = AsyncMock()
-            call_count[0] += 1
-
-            if call_count[0] == 1:  # First call is for ffmpeg
-                proc.communicate = AsyncMock(return_value=(mock_ffmpeg_output, b""))
-            else:  # Second call is for calibre
-                proc.communicate = AsyncMock(return_value=(mock_calibre_output, b""))
-
-            proc.wait = AsyncMock(return_value=0)
-            return proc
-
-        with patch("shutil.which", side_effect=lambda x: x):
-            with patch("asyncio.create_subprocess_exec", side_effect=mock_subprocess_side_effect):
-                # Temporarily replace sys.version_info for testing
-                original_version_info = sys.version_info
-                sys.version_info = (3, 10, 0, "final", 0)  # Actual tuple format
-
-                try:
-                    summary = await get_dependency_summary()
-
-                    assert isinstance(summary, dict)
-                    assert "ffmpeg" in summary
-                    assert "calibre" in summary
-                    assert "python" in summary
-
-                    # Check that status values are strings with checkmarks
-                    for dep, status in summary.items():
-                        assert isinstance(status, str)
-                        assert len(status) > 0
-                finally:
-                    sys.version_info = original_version_info
+        mock_dep_subprocess()
+        monkeypatch.setattr(sys, "version_info", (3, 10, 0, "final", 0))
+
+        summary = await get_dependency_summary()
+
+        assert isinstance(summary, dict)
+        assert "ffmpeg" in summary
+        assert "calibre" in summary
+        assert "python" in summary
+
+        # Check that status values are strings with checkmarks
+        for dep, status in summary.items():
+            assert isinstance(status, str)
+            assert len(status) > 0
 
 
 class TestDependencyError:
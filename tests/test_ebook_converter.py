@@ -47,10 +47,29 @@ class TestEbookConverter:
             "36pt",
         )
 
-        assert "ebook-convert" in cmd
+        assert Path(cmd[0]).name == "ebook-convert"
         assert "/tmp/test.epub" in cmd
         assert "/tmp/test.pdf" in cmd
 
+    def test_build_calibre_command_reduced_work(self):
+        """Test that cover generation and font rescaling are skipped by default."""
+        converter = EbookConverter()
+        args = (Path("/tmp/test.pdf"), Path("/tmp/test.epub"), "epub")
+
+        cmd = converter._build_calibre_command(*args, None, None, None, None)
+        assert "--no-default-epub-cover" in cmd
+        assert "--disable-font-rescaling" in cmd
+
+        cmd = converter._build_calibre_command(*args, "Title", None, None, None)
+        assert "--no-default-epub-cover" not in cmd
+        assert "--disable-font-rescaling" not in cmd
+
+        cmd = converter._build_calibre_command(
+            Path("/tmp/test.epub"), Path("/tmp/test.mobi"), "mobi", None, None, None, None
+        )
+        assert "--no-default-epub-cover" not in cmd
+        assert "--disable-font-rescaling" in cmd
+
     @pytest.mark.asyncio
     async def test_convert_unsupported_format(self):
         """Test conversion with unsupported format raises error."""
@@ -142,3 +161,33 @@ class TestEbookConverter:
 
             # After context exit, symlink should be cleaned up
             assert not symlink.exists()
+
+    def test_safe_path_handler_reuses_temp_dir(self):
+        """Test that SafePathHandler temp directories are pooled."""
+        with SafePathHandler() as handler:
+            first_dir = handler.temp_dir
+
+        assert first_dir.is_dir()
+
+        with SafePathHandler() as handler:
+            assert handler.temp_dir == first_dir
+
+    def test_safe_symlinks_are_unique(self):
+        """Test that symlinks for same-named files do not collide."""
+        import tempfile
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            first = Path(tmpdir) / "a" / "My Book.epub"
+            second = Path(tmpdir) / "b" / "My Book.epub"
+            for path in (first, second):
+                path.parent.mkdir()
+                path.touch()
+
+            with SafePathHandler() as handler:
+                first_link = handler.create_safe_symlink(first)
+                second_link = handler.create_safe_symlink(second)
+
+                assert first_link != second_link
+                assert first_link.resolve() == first.resolve()
+                assert second_link.resolve() == second.resolve()
+                assert first_link.suffix == ".epub"
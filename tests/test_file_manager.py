@@ -1,6 +1,7 @@
 """Unit tests for file manager module."""
 
 import os
+import shutil
 import tempfile
 from pathlib import Path
 from unittest.mock import patch, MagicMock
@@ -23,11 +24,25 @@ class TestFileManager:
         assert manager.output_dir is None
         assert manager.min_disk_space_mb == 100
 
-    def test_init_with_output_dir(self):
+    def test_init_with_output_dir(self, tmp_path):
         """Test FileManager initialization with custom output directory."""
-        manager = FileManager(output_dir="/tmp/output")
+        output_dir = tmp_path / "output"
+        manager = FileManager(output_dir=str(output_dir))
+
+        assert manager.output_dir == output_dir.resolve()
+        assert output_dir.is_dir()
 
-        assert manager.output_dir == Path("/tmp/output")
+    def test_move_into_output_dir_skips_mkdir(self, tmp_path):
+        """Test that moves into an existing directory do not mkdir."""
+        source = tmp_path / "source.txt"
+        source.write_text("content")
+        manager = FileManager(output_dir=str(tmp_path / "output"))
+
+        with patch.object(Path, "mkdir") as mock_mkdir:
+            result = manager.atomic_move(source, manager.output_dir / "dest.txt")
+
+        mock_mkdir.assert_not_called()
+        assert result.read_text() == "content"
 
     def test_init_with_custom_min_disk_space(self):
         """Test FileManager initialization with custom min disk space."""
@@ -92,6 +107,37 @@ class TestResolveOutputPath:
 
         assert output_path.name == "source_3.pdf"
 
+    def test_resolve_collisions_reuse_directory_listing(self, tmp_path):
+        """Test that repeated collisions in one directory list it only once."""
+        source = tmp_path / "source.txt"
+        source.write_text("content")
+        (tmp_path / "source.pdf").write_text("existing")
+        manager = FileManager()
+
+        with patch("src.converter.file_manager.os.scandir", wraps=os.scandir) as mock_scandir:
+            first = manager.resolve_output_path(source, "pdf")
+            first.write_text("converted")
+            second = manager.resolve_output_path(source, "pdf")
+
+        mock_scandir.assert_called_once()
+        assert first.name == "source_1.pdf"
+        assert second.name == "source_2.pdf"
+
+    def test_resolve_collision_invalidate(self, tmp_path):
+        """Test that invalidate drops the cached listing for a directory."""
+        source = tmp_path / "source.txt"
+        source.write_text("content")
+        (tmp_path / "source.pdf").write_text("existing")
+        manager = FileManager()
+        manager.resolve_output_path(source, "pdf")
+
+        manager.invalidate(tmp_path)
+
+        with patch("src.converter.file_manager.os.scandir", wraps=os.scandir) as mock_scandir:
+            manager.resolve_output_path(source, "pdf")
+
+        mock_scandir.assert_called_once()
+
     def test_resolve_target_format_case_insensitive(self, tmp_path):
         """Test that target format is converted to lowercase."""
         source = tmp_path / "source.txt"
@@ -203,6 +249,35 @@ class TestCheckDiskSpace:
 
         assert manager.check_disk_space(test_file) is True
 
+    def test_check_disk_space_reuses_recent_reading(self, tmp_path):
+        """Test that repeated checks within the TTL read disk usage once."""
+        manager = FileManager(min_disk_space_mb=1)
+
+        with patch(
+            "src.converter.file_manager.shutil.disk_usage", wraps=shutil.disk_usage
+        ) as mock_usage:
+            manager.check_disk_space(tmp_path)
+            manager.check_disk_space(tmp_path)
+
+        mock_usage.assert_called_once()
+
+    def test_check_disk_space_rereads_after_move(self, tmp_path):
+        """Test that moving a file into a directory invalidates its cached reading."""
+        manager = FileManager(min_disk_space_mb=1)
+        source = tmp_path / "source.txt"
+        source.write_text("content")
+        out_dir = tmp_path / "out"
+        out_dir.mkdir()
+
+        with patch(
+            "src.converter.file_manager.shutil.disk_usage", wraps=shutil.disk_usage
+        ) as mock_usage:
+            manager.check_disk_space(out_dir)
+            manager.atomic_move(source, out_dir / "dest.txt")
+            manager.check_disk_space(out_dir)
+
+        assert mock_usage.call_count == 2
+
     def test_check_disk_space_invalid_path_raises_error(self):
         """Test that invalid path raises FileOperationError."""
         manager = FileManager()
@@ -2,16 +2,34 @@
 Tests for image converter.
 """
 
-import pytest
+import io
 from pathlib import Path
-from unittest.mock import patch, AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from PIL import Image
 
 from src.converter.converters.image import (
-    ImageConverter,
+    FORMAT_MIME_MAP,
     SUPPORTED_INPUT_FORMATS,
     SUPPORTED_OUTPUT_FORMATS,
+    ImageConverter,
+    _get_image_pool,
 )
 
+IMAGE_MODULE = "src.converter.converters.image"
+
+
+def _skip_without_svg_backend():
+    """Skip the calling test when neither SVG rasterizer is installed."""
+    for module in ("resvg_py", "cairosvg"):
+        try:
+            __import__(module)
+            return
+        except (ImportError, OSError):
+            continue
+    pytest.skip("no SVG backend (resvg-py or cairosvg) installed")
+
 
 class TestImageConverter:
     """Tests for ImageConverter class."""
@@ -60,11 +78,56 @@ class TestImageConverter:
         source = tmp_path / "test.png"
         output = tmp_path / "test.jpg"
 
-        with patch.object(converter, "_convert_sync", return_value=output):
-            result = await converter.convert(source, "jpg", output)
+        with patch("src.converter.converters.image._get_image_pool", return_value=None):
+            with patch.object(converter, "_convert_sync", return_value=output):
+                result = await converter.convert(source, "jpg", output)
 
         assert result == output
 
+    @pytest.mark.asyncio
+    async def test_convert_in_process_pool(self, sample_image_file, tmp_path):
+        """Test that conversion runs in the worker process pool."""
+        assert _get_image_pool() is not None
+
+        converter = ImageConverter()
+        output = tmp_path / "sample.jpg"
+
+        result = await converter.convert(sample_image_file, "jpg", output)
+
+        with Image.open(result) as img:
+            assert img.format == "JPEG"
+
+    def test_format_map_covers_outputs(self):
+        """Test that every output format maps to a Pillow format name."""
+        assert SUPPORTED_OUTPUT_FORMATS <= FORMAT_MIME_MAP.keys()
+
+    @pytest.mark.asyncio
+    async def test_convert_batch(self, tmp_path):
+        """Test batch conversion keeps job order and avoids output collisions."""
+        sources = []
+        for name in ("a.png", "b.png", "a.bmp"):
+            path = tmp_path / name
+            Image.new("RGB", (4, 4), "red").save(path)
+            sources.append(path)
+
+        converter = ImageConverter()
+        results = await converter.convert_batch(
+            [(source, "jpg", None) for source in sources], chunk_size=2
+        )
+
+        assert [path.name for path in results] == ["a.jpg", "b.jpg", "a_1.jpg"]
+        assert all(path.exists() for path in results)
+
+    @pytest.mark.asyncio
+    async def test_convert_batch_rejects_unsupported_format(self, tmp_path):
+        """Test that a bad target format fails the batch before converting."""
+        converter = ImageConverter()
+
+        with pytest.raises(Exception) as exc_info:
+            await converter.convert_batch([(tmp_path / "a.png", "svg", None)])
+
+        assert "not supported" in str(exc_info.value).lower()
+
     def test_svg_in_input_formats(self):
         """Test that SVG is in supported input formats."""
         assert "svg" in SUPPORTED_INPUT_FORMATS
@@ -91,10 +154,7 @@ class TestSVGConversion:
     @pytest.mark.asyncio
     async def test_svg_to_png_conversion(self, sample_svg, tmp_path):
         """Test converting SVG to PNG."""
-        try:
-            import cairosvg
-        except ImportError:
-            pytest.skip("cairosvg not installed")
+        _skip_without_svg_backend()
 
         converter = ImageConverter()
         output = tmp_path / "output.png"
@@ -108,10 +168,7 @@ class TestSVGConversion:
     @pytest.mark.asyncio
     async def test_svg_to_jpg_conversion(self, sample_svg, tmp_path):
         """Test converting SVG to JPG."""
-        try:
-            import cairosvg
-        except ImportError:
-            pytest.skip("cairosvg not installed")
+        _skip_without_svg_backend()
 
         converter = ImageConverter()
         output = tmp_path / "output.jpg"
@@ -124,10 +181,7 @@ class TestSVGConversion:
     @pytest.mark.asyncio
     async def test_svg_to_webp_conversion(self, sample_svg, tmp_path):
         """Test converting SVG to WebP."""
-        try:
-            import cairosvg
-        except ImportError:
-            pytest.skip("cairosvg not installed")
+        _skip_without_svg_backend()
 
         converter = ImageConverter()
         output = tmp_path / "output.webp"
@@ -140,10 +194,7 @@ class TestSVGConversion:
     @pytest.mark.asyncio
     async def test_svg_with_resize(self, sample_svg, tmp_path):
         """Test converting SVG with custom resize."""
-        try:
-            import cairosvg
-        except ImportError:
-            pytest.skip("cairosvg not installed")
+        _skip_without_svg_backend()
 
         converter = ImageConverter()
         output = tmp_path / "output.png"
@@ -152,6 +203,9 @@ class TestSVGConversion:
 
         assert result.exists()
 
+        with Image.open(result) as img:
+            assert img.size == (200, 200)
+
     @pytest.mark.asyncio
     async def test_svg_output_not_supported(self, tmp_path):
         """Test that converting TO SVG raises an error."""
@@ -166,26 +220,37 @@ class TestSVGConversion:
         assert "not supported" in str(exc_info.value).lower()
 
     def test_convert_svg_to_raster_missing_cairosvg(self, sample_svg, tmp_path):
-        """Test that missing cairosvg raises helpful error."""
+        """Test that missing SVG backends raise a helpful error."""
         converter = ImageConverter()
         output = tmp_path / "output.png"
 
-        with patch.dict("sys.modules", {"cairosvg": None}):
-            with patch(
-                "builtins.__import__", side_effect=ImportError("No module named 'cairosvg'")
-            ):
-                with pytest.raises(Exception) as exc_info:
-                    converter._convert_svg_to_raster(sample_svg, output, "png", 85, None)
+        with patch.multiple(IMAGE_MODULE, cairosvg=None, resvg_py=None):
+            with pytest.raises(Exception) as exc_info:
+                converter._convert_svg_to_raster(sample_svg, output, "png", 85, None)
 
-                assert "cairosvg" in str(exc_info.value).lower()
+            assert "cairosvg" in str(exc_info.value).lower()
+            assert "resvg" in str(exc_info.value).lower()
+
+    def test_convert_svg_falls_back_to_cairosvg(self, sample_svg, tmp_path):
+        """Test that cairosvg is used when resvg is not installed."""
+        buf = io.BytesIO()
+        Image.new("RGB", (10, 10), "red").save(buf, format="PNG")
+        fake_cairosvg = MagicMock()
+        fake_cairosvg.svg2png.return_value = buf.getvalue()
+
+        converter = ImageConverter()
+        output = tmp_path / "output.png"
+
+        with patch.multiple(IMAGE_MODULE, cairosvg=fake_cairosvg, resvg_py=None):
+            result = converter._convert_svg_to_raster(sample_svg, output, "png", 85, None)
+
+        fake_cairosvg.svg2png.assert_called_once()
+        assert result.exists()
 
     @pytest.mark.asyncio
     async def test_invalid_svg_file(self, tmp_path):
         """Test that invalid SVG raises conversion error."""
-        try:
-            import cairosvg
-        except ImportError:
-            pytest.skip("cairosvg not installed")
+        _skip_without_svg_backend()
 
         converter = ImageConverter()
 
@@ -196,3 +261,88 @@ class TestSVGConversion:
 
         with pytest.raises(Exception):
             await converter.convert(invalid_svg, "png", output_path=output)
+
+
+class TestConvertPillow:
+    """Tests for ImageConverter._convert_pillow encoding and resizing."""
+
+    def test_convert_pillow_accepts_decoded_image(self, tmp_path):
+        """Test that _convert_pillow can encode an in-memory image."""
+        converter = ImageConverter()
+        output = tmp_path / "output.jpg"
+
+        with Image.new("RGBA", (20, 10), (255, 0, 0, 128)) as img:
+            result = converter._convert_pillow(img, output, "jpg", 85, (10, 5))
+
+        with Image.open(result) as saved:
+            assert saved.format == "JPEG"
+            assert saved.size == (10, 5)
+        assert not list(tmp_path.glob("*.png"))
+
+    @pytest.mark.parametrize("mode", ["RGBA", "LA", "P"])
+    def test_jpeg_flattens_transparency_to_white(self, tmp_path, mode):
+        """Test that transparent pixels become white, not black, in JPEG output."""
+        img = Image.new("RGBA", (8, 8), (0, 0, 0, 0))
+        if mode == "LA":
+            img = img.convert("LA")
+        elif mode == "P":
+            img = Image.new("P", (8, 8), 0)
+            img.info["transparency"] = 0
+
+        output = tmp_path / "flat.jpg"
+        ImageConverter._convert_pillow(img, output, "jpg", 95, None)
+
+        with Image.open(output) as saved:
+            assert saved.mode == "RGB"
+            assert min(saved.getpixel((4, 4))) > 245
+
+    def test_resize_skipped_when_size_unchanged(self, tmp_path):
+        """Test that resizing to the current size does not resample."""
+        output = tmp_path / "same.png"
+
+        with Image.new("RGB", (16, 16), "blue") as img:
+            with patch.object(Image.Image, "resize") as mock_resize:
+                ImageConverter._convert_pillow(img, output, "png", 85, (16, 16))
+
+        mock_resize.assert_not_called()
+        assert output.exists()
+
+    def test_large_downscale_uses_reducing_gap(self, tmp_path):
+        """Test that large downscales resize in two stages."""
+        output = tmp_path / "small.png"
+
+        with Image.new("RGB", (400, 300), "blue") as img:
+            with patch.object(Image.Image, "resize", wraps=img.resize) as mock_resize:
+                ImageConverter._convert_pillow(img, output, "png", 85, (40, 30))
+
+        assert mock_resize.call_args.kwargs["reducing_gap"] == 3.0
+        with Image.open(output) as saved:
+            assert saved.size == (40, 30)
+
+    @pytest.mark.parametrize(
+        "quality,expected",
+        [(60, {"compress_level": 3}), (85, {"compress_level": 6}), (95, {"optimize": True})],
+    )
+    def test_png_compression_follows_quality(self, tmp_path, quality, expected):
+        """Test that PNG compression effort scales with the quality preset."""
+        output = tmp_path / "out.png"
+
+        with Image.new("RGB", (8, 8), "green") as img:
+            with patch.object(Image.Image, "save") as mock_save:
+                ImageConverter._convert_pillow(img, output, "png", quality, None)
+
+        assert mock_save.call_args.kwargs == {"format": "PNG", **expected}
+
+    def test_jpeg_source_decoded_at_reduced_scale(self, tmp_path):
+        """Test that JPEG thumbnails are decoded with DCT scaling."""
+        source = tmp_path / "large.jpg"
+        Image.new("RGB", (800, 600), "red").save(source, format="JPEG")
+        output = tmp_path / "thumb.png"
+
+        with patch.object(Image.Image, "resize") as mock_resize:
+            ImageConverter._convert_pillow(source, output, "png", 85, (200, 150))
+
+        # 800x600 decodes at 1/4 scale, which is exactly the requested size
+        mock_resize.assert_not_called()
+        with Image.open(output) as saved:
+            assert saved.size == (200, 150)
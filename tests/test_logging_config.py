@@ -218,6 +218,29 @@ class TestProgressLogger:
         assert "Step 2" in caplog.text
         assert "✓ Conversion complete" in caplog.text
 
+    def test_progress_logger_info_disabled(self, caplog):
+        """Test progress logger still counts steps when INFO is disabled."""
+        logger = get_logger("progress_test")
+        progress_logger = ProgressLogger(logger, total_steps=3)
+
+        with caplog.at_level(logging.WARNING):
+            progress_logger.update("Step 1", 33.3)
+            progress_logger.update("Step 2", 66.7)
+
+        assert progress_logger.current_step == 2
+        assert caplog.records == []
+
+    def test_progress_logger_eta_from_elapsed_time(self, monkeypatch):
+        """Test ETA extrapolates the elapsed wall-clock time."""
+        progress_logger = ProgressLogger(get_logger("progress_test"))
+        monkeypatch.setattr(
+            "src.converter.logging_config.time.monotonic", lambda: progress_logger._started + 30
+        )
+
+        assert progress_logger._calculate_eta(25.0) == pytest.approx(90.0)
+        assert progress_logger._calculate_eta(0) is None
+        assert progress_logger._calculate_eta(100) == 0.0
+
     def test_progress_logger_message(self, caplog):
         """Test progress logger with message."""
         logger = get_logger("progress_test")
@@ -243,6 +266,14 @@ class TestLoggingHelpers:
         assert "input.pdf" in caplog.text
         assert "docx" in caplog.text
 
+    def test_log_conversion_start_info_disabled(self, caplog):
+        """Test log_conversion_start emits nothing when INFO is disabled."""
+        logger = get_logger("test_helper")
+        with caplog.at_level(logging.WARNING):
+            log_conversion_start(logger, "input.pdf", "docx", quality="high")
+
+        assert caplog.records == []
+
     def test_log_conversion_complete_success(self, caplog):
         """Test log_conversion_complete for success."""
         logger = get_logger("test_helper")
@@ -1,6 +1,7 @@
 """Tests for resource monitoring."""
 
 import pytest
+from unittest.mock import patch
 from pathlib import Path
 import tempfile
 
@@ -58,6 +59,24 @@ class TestResourceMonitor:
         assert "vms_mb" in usage
         assert "percent" in usage
         assert usage["rss_mb"] > 0
+        assert usage["percent"] == pytest.approx(mon._process.memory_percent(), rel=0.2)
+
+    def test_process_handle_reused(self):
+        """Test that memory sampling reuses one psutil.Process."""
+        mon = ResourceMonitor()
+        mon.get_memory_usage()
+
+        with patch("psutil.Process") as mock_process:
+            mon.get_memory_usage()
+            mon.get_memory_usage()
+
+        mock_process.assert_not_called()
+
+    def test_psutil_not_touched_on_init(self):
+        """Test that constructing a monitor does not create a process handle."""
+        mon = ResourceMonitor()
+
+        assert "_process" not in vars(mon)
 
     def test_get_cpu_usage(self):
         """Test getting CPU usage."""
@@ -91,6 +110,38 @@ class TestResourceMonitor:
 
             assert cleaned == 3
 
+    @pytest.mark.asyncio
+    async def test_cleanup_temp_files_mixed_entries(self, tmp_path):
+        """Test that matching dirs and symlinks are removed and others kept."""
+        mon = ResourceMonitor()
+
+        nested = tmp_path / "converter_dir"
+        (nested / "sub").mkdir(parents=True)
+        (nested / "sub" / "file.bin").touch()
+        target = tmp_path / "keep.txt"
+        target.touch()
+        (tmp_path / "converter_link").symlink_to(target)
+
+        cleaned = await mon.cleanup_temp_files(tmp_path)
+
+        assert cleaned == 2
+        assert not nested.exists()
+        assert not (tmp_path / "converter_link").is_symlink()
+        assert target.exists()
+
+    @pytest.mark.asyncio
+    async def test_cleanup_many_directories(self, tmp_path):
+        """Test that more trees than the parallelism limit are all removed."""
+        mon = ResourceMonitor()
+
+        for i in range(20):
+            (tmp_path / f"converter_{i}" / "inner").mkdir(parents=True)
+
+        cleaned = await mon.cleanup_temp_files(tmp_path)
+
+        assert cleaned == 20
+        assert not any(tmp_path.iterdir())
+
     @pytest.mark.asyncio
     async def test_cleanup_nonexistent_directory(self):
         """Test cleanup of nonexistent directory."""
@@ -5,6 +5,7 @@ Tests ProgressReporter, ProgressTracker, and related utilities.
 """
 
 import asyncio
+import gc
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 import time
@@ -16,6 +17,7 @@ from src.converter.progress import (
     ProgressTracker,
     create_progress_callback,
     get_progress_reporter,
+    scoped_progress_reporter,
     set_progress_reporter,
 )
 
@@ -121,6 +123,21 @@ class TestProgressInfo:
         assert "elapsed_seconds" in d
         assert d["metadata"] == {}
 
+    def test_to_dict_tracks_field_changes(self):
+        """Test that cached serialization is rebuilt when fields change."""
+        info = ProgressInfo(job_id="test", start_time=10.0)
+
+        first = info.to_dict(now=12.5)
+        info.progress = 40.0
+        info.stage = ProgressStage.PROCESSING
+        second = info.to_dict(now=15.0)
+
+        assert first["elapsed_seconds"] == 2.5
+        assert first["stage"] == "init"
+        assert second["elapsed_seconds"] == 5.0
+        assert second["stage"] == "processing"
+        assert second["percent_complete"] == 40.0
+
 
 class TestProgressReporter:
     """Test cases for ProgressReporter."""
@@ -232,6 +249,20 @@ class TestProgressReporter:
         info = reporter.get_job("unknown")
         assert info is None
 
+    @pytest.mark.asyncio
+    async def test_completed_job_retained_while_referenced(self, reporter):
+        """Test that finished jobs stay retrievable only while still referenced."""
+        await reporter.start_job("job-1")
+        final = await reporter.complete_job("job-1")
+
+        assert reporter.get_job("job-1") is None
+        assert reporter.get_completed_job("job-1") is final
+
+        del final
+        gc.collect()
+
+        assert reporter.get_completed_job("job-1") is None
+
     @pytest.mark.asyncio
     async def test_get_all_jobs(self, reporter):
         """Test getting all active jobs."""
@@ -271,6 +302,21 @@ class TestProgressReporter:
 
         assert "job-1" in call_log
 
+    @pytest.mark.asyncio
+    async def test_async_callable_object(self):
+        """Test that a callable object with an async __call__ is awaited."""
+        call_log = []
+
+        class Recorder:
+            async def __call__(self, info):
+                call_log.append(info.job_id)
+
+        reporter = ProgressReporter(callback=Recorder())
+        await reporter.start_job("job-1")
+        await reporter.complete_job("job-1")
+
+        assert call_log == ["job-1"]
+
     @pytest.mark.asyncio
     async def test_mcp_context_integration(self):
         """Test integration with MCP context."""
@@ -283,6 +329,75 @@ class TestProgressReporter:
         # MCP context report_progress should be called
         assert mock_context.report_progress.call_count >= 1
 
+    @pytest.mark.asyncio
+    async def test_young_job_updates_skip_notify(self):
+        """Test that updates before the reporting threshold never reach _notify."""
+        reporter = ProgressReporter(callback=MagicMock())
+        await reporter.start_job("job-1")
+
+        with patch.object(reporter, "_notify") as mock_notify:
+            info = await reporter.update_progress("job-1", progress=10.0, message="early")
+
+        mock_notify.assert_not_called()
+        assert info.progress == 10.0
+        assert info.message == "early"
+
+    @pytest.mark.asyncio
+    async def test_rapid_updates_coalesced(self):
+        """Test that bursts of updates within one stage are flushed as the latest state."""
+        seen = []
+        reporter = ProgressReporter(callback=lambda info: seen.append(info.progress))
+        info = await reporter.start_job("job-1")
+        info.start_time -= ProgressReporter.MIN_PROGRESS_THRESHOLD
+
+        for step in range(1, 51):
+            await reporter.update_progress("job-1", progress=float(step))
+
+        assert seen == [1.0]
+
+        await asyncio.sleep(ProgressReporter.MIN_UPDATE_INTERVAL * 2)
+        assert seen == [1.0, 50.0]
+
+    @pytest.mark.asyncio
+    async def test_flush_reports_jobs_concurrently(self):
+        """Test that one flush tick sends every pending job without waiting on each."""
+        in_flight = 0
+        peak = 0
+
+        async def report_progress(progress, total):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+        context = AsyncMock()
+        context.report_progress.side_effect = report_progress
+        reporter = ProgressReporter(mcp_context=context)
+        for job_id in ("job-1", "job-2", "job-3"):
+            info = await reporter.start_job(job_id)
+            info.start_time -= ProgressReporter.MIN_PROGRESS_THRESHOLD
+            await reporter.update_progress(job_id, progress=1.0)
+            await reporter.update_progress(job_id, progress=2.0)
+
+        await asyncio.sleep(ProgressReporter.MIN_UPDATE_INTERVAL * 2)
+
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    async def test_stage_change_not_coalesced(self):
+        """Test that stage transitions and completion are delivered immediately."""
+        seen = []
+        reporter = ProgressReporter(callback=lambda info: seen.append(info.stage))
+        info = await reporter.start_job("job-1")
+        info.start_time -= ProgressReporter.MIN_PROGRESS_THRESHOLD
+
+        await reporter.update_progress("job-1", progress=10.0)
+        await reporter.update_progress("job-1", progress=20.0, stage=ProgressStage.PROCESSING)
+        await reporter.complete_job("job-1")
+
+        assert seen == [ProgressStage.INIT, ProgressStage.PROCESSING, ProgressStage.COMPLETE]
+
     @pytest.mark.asyncio
     async def test_callback_error_handling(self):
         """Test that callback errors don't break reporting."""
@@ -401,6 +516,20 @@ class TestProgressUtilities:
         # Reset to default
         set_progress_reporter(None)
 
+    @pytest.mark.asyncio
+    async def test_scoped_progress_reporter(self):
+        """Test that a scoped reporter is only visible in its own context."""
+        shared = get_progress_reporter()
+        scoped = ProgressReporter()
+
+        async def in_task():
+            with scoped_progress_reporter(scoped):
+                await asyncio.sleep(0)
+                return get_progress_reporter()
+
+        assert await asyncio.create_task(in_task()) is scoped
+        assert get_progress_reporter() is shared
+
 
 class TestConcurrentProgress:
     """Test concurrent progress reporting."""
@@ -427,6 +556,29 @@ class TestConcurrentProgress:
         assert reporter.get_job("job-2").progress == 60.0
         assert reporter.get_job("job-3").progress == 90.0
 
+    @pytest.mark.asyncio
+    async def test_slow_callback_does_not_block_other_jobs(self):
+        """Test that one job's pending notification does not hold up another job."""
+        release = asyncio.Event()
+
+        async def callback(info):
+            if info.job_id == "job-1":
+                await release.wait()
+
+        reporter = ProgressReporter(callback=callback)
+        await reporter.start_job("job-1")
+        await reporter.start_job("job-2")
+
+        blocked = asyncio.create_task(reporter.complete_job("job-1"))
+        await asyncio.sleep(0)
+
+        final = await asyncio.wait_for(reporter.complete_job("job-2"), timeout=1.0)
+        assert final.stage == ProgressStage.COMPLETE
+
+        release.set()
+        await blocked
+        assert reporter.get_all_jobs() == {}
+
     @pytest.mark.asyncio
     async def test_job_isolation(self):
         """Test that job progress doesn't interfere."""
@@ -9,7 +9,7 @@ from src.converter.queue import (
     ConversionQueue,
     ConversionJob,
     JobStatus,
-    queue,
+    get_queue,
 )
 
 
@@ -49,6 +49,22 @@ class TestConversionJob:
         assert data["quality"] == "high"
         assert "created_at" in data
 
+    def test_job_to_dict_timestamps(self):
+        """Test that timestamps serialize as ISO 8601 UTC."""
+        job = ConversionJob(
+            id="test-789",
+            source=Path("/tmp/test.mp4"),
+            target_format="webm",
+            output_path=None,
+            quality="low",
+            created_at=0.0,
+        )
+
+        data = job.to_dict()
+
+        assert data["created_at"] == "1970-01-01T00:00:00+00:00"
+        assert data["started_at"] is None
+
     def test_job_status_values(self):
         """Test job status enum values."""
         assert JobStatus.QUEUED.value == "queued"
@@ -111,6 +127,34 @@ class TestConversionQueue:
 
         assert len(jobs) == 2
 
+    @pytest.mark.asyncio
+    async def test_get_jobs_by_status(self):
+        """Test that status indices follow job status changes."""
+        q = ConversionQueue()
+
+        first = await q.submit(Path("/tmp/a.jpg"), "png")
+        second = await q.submit(Path("/tmp/b.jpg"), "gif")
+        q.get_job(first).status = JobStatus.RUNNING
+
+        assert [job.id for job in q.get_jobs_by_status(JobStatus.RUNNING)] == [first]
+        assert [job.id for job in q.get_jobs_by_status(JobStatus.QUEUED)] == [second]
+
+        await q.cancel(second)
+
+        assert q.get_jobs_by_status(JobStatus.QUEUED) == []
+        assert [job.id for job in q.get_jobs_by_status(JobStatus.CANCELLED)] == [second]
+
+    @pytest.mark.asyncio
+    async def test_submit_does_not_wait_for_lock(self):
+        """Test that submit proceeds while the status-transition lock is held."""
+        q = ConversionQueue()
+
+        async with q._get_lock():
+            job_id = await asyncio.wait_for(q.submit(Path("/tmp/a.jpg"), "png"), timeout=1)
+
+        assert q._queue.qsize() == 1
+        assert q.get_job(job_id).status == JobStatus.QUEUED
+
     @pytest.mark.asyncio
     async def test_cancel_queued_job(self):
         """Test cancelling a queued job."""
@@ -139,9 +183,9 @@ class TestConversionQueue:
         assert q.get_active_count() == 0
 
     def test_global_queue_instance(self):
-        """Test global queue instance exists."""
-        assert queue is not None
-        assert isinstance(queue, ConversionQueue)
+        """Test the shared queue is created once and reused."""
+        assert isinstance(get_queue(), ConversionQueue)
+        assert get_queue() is get_queue()
 
 
 class TestJobStatusTransitions:
@@ -175,3 +219,28 @@ class TestJobStatusTransitions:
         result = await q.wait_for_job(job_id, timeout=1.0)
 
         assert result.status == JobStatus.COMPLETED
+
+    @pytest.mark.asyncio
+    async def test_wait_wakes_on_status_change(self):
+        """Test that a waiter returns as soon as the job finishes."""
+        q = ConversionQueue()
+
+        job_id = await q.submit(Path("/tmp/test.jpg"), "png")
+        waiter = asyncio.create_task(q.wait_for_job(job_id, timeout=5.0))
+        await asyncio.sleep(0)
+        assert not waiter.done()
+
+        q.get_job(job_id).status = JobStatus.FAILED
+
+        result = await asyncio.wait_for(waiter, timeout=0.05)
+        assert result.status == JobStatus.FAILED
+
+    @pytest.mark.asyncio
+    async def test_wait_timeout(self):
+        """Test that waiting on an unfinished job times out."""
+        q = ConversionQueue()
+
+        job_id = await q.submit(Path("/tmp/test.jpg"), "png")
+
+        with pytest.raises(asyncio.TimeoutError):
+            await q.wait_for_job(job_id, timeout=0.01)
@@ -39,6 +39,11 @@ class TestConverterRouter:
         assert ConverterRouter.get_converter_type("epub", "pdf") == "ebook"
         assert ConverterRouter.get_converter_type("mobi", "epub") == "ebook"
 
+    def test_get_converter_type_case_insensitive(self):
+        """Test format lookup ignores case."""
+        assert ConverterRouter.get_converter_type("JPG", "Png") == "image"
+        assert ConverterRouter.get_converter_type("MP4", "MP3") == "video"
+
     def test_get_converter_type_unsupported(self):
         """Test unsupported conversion raises error."""
         with pytest.raises(Exception) as exc_info:
@@ -77,3 +82,47 @@ class TestConverterRouter:
         """Test global router instance."""
         assert router is not None
         assert isinstance(router, ConverterRouter)
+
+    @pytest.mark.asyncio
+    async def test_convert_batch_images(self):
+        """Test that all-image batches use the image converter's batch path."""
+        router = ConverterRouter()
+
+        with patch.object(
+            router.image, "convert_batch", new_callable=AsyncMock, return_value=[Path("a.png")]
+        ) as mock_batch:
+            result = await router.convert_batch(["a.jpg"], "png")
+
+        assert result == [Path("a.png")]
+        mock_batch.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_convert_batch_mixed(self, tmp_path):
+        """Test that mixed batches are converted file by file."""
+        router = ConverterRouter()
+        sources = [tmp_path / "a.wav", tmp_path / "b.mp4"]
+        for source in sources:
+            source.write_bytes(b"data")
+
+        with patch.object(
+            router, "convert", new_callable=AsyncMock, side_effect=lambda p, *a, **k: p
+        ) as mock_convert:
+            result = await router.convert_batch(sources, "mp3")
+
+        assert result == sources
+        assert mock_convert.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_convert_batch_same_stem_gets_distinct_outputs(self, tmp_path):
+        """Test that same-stem sources in a mixed batch never share an output path."""
+        router = ConverterRouter()
+        sources = [tmp_path / "a.wav", tmp_path / "a.flac", tmp_path / "a.mp4"]
+        for source in sources:
+            source.write_bytes(b"data")
+
+        with patch.object(
+            router, "convert", new_callable=AsyncMock, side_effect=lambda p, t, out, **k: out
+        ):
+            result = await router.convert_batch(sources, "mp3")
+
+        assert result == [tmp_path / "a.mp3", tmp_path / "a_1.mp3", tmp_path / "a_2.mp3"]
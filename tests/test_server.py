@@ -64,6 +64,25 @@ class TestGracefulShutdown:
         await shutdown.wait_for_tasks(timeout=0.1)
         task.cancel()
 
+    @pytest.mark.asyncio
+    async def test_register_task_sweeps_finished_tasks(self):
+        """Finished tasks are dropped in bulk every TASK_SWEEP_INTERVAL registrations."""
+        shutdown = GracefulShutdown()
+
+        async def noop():
+            pass
+
+        tasks = [asyncio.create_task(noop()) for _ in range(shutdown.TASK_SWEEP_INTERVAL - 1)]
+        await asyncio.gather(*tasks)
+        for task in tasks:
+            shutdown.register_task(task)
+        assert len(shutdown._tasks) == shutdown.TASK_SWEEP_INTERVAL - 1
+
+        pending = asyncio.create_task(asyncio.sleep(10))
+        shutdown.register_task(pending)
+        assert shutdown._tasks == [pending]
+        pending.cancel()
+
 
 class TestMCPTools:
     """Test MCP tool registration and functionality."""
@@ -213,6 +232,32 @@ class TestMCPTools:
 
         assert parsed["supported"] is True
 
+    def test_conversion_info_is_cached(self):
+        """Repeated lookups for the same format pair reuse the cached response."""
+        from src.converter.server import _conversion_info, _supported_formats
+
+        _conversion_info.cache_clear()
+        assert _conversion_info("jpg", "png") is _conversion_info("jpg", "png")
+        assert _conversion_info.cache_info().hits == 1
+        assert _supported_formats() is _supported_formats()
+
+    @pytest.mark.asyncio
+    async def test_cached_responses_are_not_shared(self):
+        """Mutating a returned response does not leak into later responses."""
+        from src.converter.server import get_conversion_info, list_supported_formats
+
+        formats = await list_supported_formats()
+        formats["image"].clear()
+        info = await get_conversion_info("jpg", "png")
+        info["quality_options"].append("ultra")
+
+        assert (await list_supported_formats())["image"]
+        assert (await get_conversion_info("jpg", "png"))["quality_options"] == [
+            "low",
+            "medium",
+            "high",
+        ]
+
 
 class TestServerLifecycle:
     """Test server lifecycle and configuration."""
@@ -252,6 +297,31 @@ class TestServerLifecycle:
 
             assert shutdown_handler.is_shutting_down()
 
+    def test_remove_temp_dir(self, tmp_path):
+        """Temp dirs are removed and missing dirs are tolerated."""
+        from src.converter.server import _remove_temp_dir
+
+        temp_dir = tmp_path / "work"
+        (temp_dir / "nested").mkdir(parents=True)
+        (temp_dir / "nested" / "frame.png").write_bytes(b"x")
+
+        _remove_temp_dir(temp_dir)
+        assert not temp_dir.exists()
+        _remove_temp_dir(temp_dir)
+
+    def test_main_selects_uvloop_when_available(self):
+        """Test that main asks anyio for uvloop only when it is installed."""
+        from src.converter.server import main
+
+        for available in (True, False):
+            with (
+                patch("src.converter.server._HAS_UVLOOP", available),
+                patch("src.converter.server.anyio.run") as mock_run,
+            ):
+                main()
+
+            assert mock_run.call_args.kwargs["backend_options"] == {"use_uvloop": available}
+
     @pytest.mark.asyncio
     async def test_setup_signal_handlers(self):
         """Test signal handler setup."""
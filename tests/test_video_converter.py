@@ -2,6 +2,9 @@
 Tests for video converter.
 """
 
+import asyncio
+import sys
+
 import pytest
 from pathlib import Path
 from unittest.mock import patch, AsyncMock
@@ -10,7 +13,11 @@ from src.converter.converters.video import (
     VideoConverter,
     SUPPORTED_INPUT_FORMATS,
     SUPPORTED_OUTPUT_FORMATS,
+    _encoder_args,
+    _get_ffmpeg_encoders,
+    _probe_duration,
 )
+from src.converter.logging_config import ConversionError
 
 
 class TestVideoConverter:
@@ -44,11 +51,117 @@ class TestVideoConverter:
             {"crf": "28", "preset": "faster"},
         )
 
-        assert "ffmpeg" in cmd
+        assert Path(cmd[0]).name == "ffmpeg"
         assert "-i" in cmd
         assert "/tmp/test.mp4" in cmd
         assert "/tmp/test.webm" in cmd
 
+    def test_build_ffmpeg_command_with_progress(self):
+        """Test that progress mode routes FFmpeg progress to stdout."""
+        converter = VideoConverter()
+        cmd = converter._build_ffmpeg_command(
+            Path("/tmp/test.mp4"),
+            Path("/tmp/test.webm"),
+            "libvpx-vp9",
+            "libopus",
+            {"crf": "28", "preset": "faster"},
+            progress=True,
+        )
+
+        assert cmd[cmd.index("-progress") + 1] == "pipe:1"
+        assert "-nostats" in cmd
+        assert cmd.index("-progress") < cmd.index("-i")
+
+    @pytest.mark.asyncio
+    async def test_run_with_progress_streams_updates(self):
+        """Test that progress is reported while the process is still running."""
+        script = (
+            "import sys, time\n"
+            "sys.stderr.write('Input #0, mov,mp4\\n')\n"
+            "sys.stderr.flush()\n"
+            "for us in ('N/A', 2500000, 5000000, 10000000):\n"
+            "    print(f'out_time_us={us}', flush=True)\n"
+            "    time.sleep(0.01)\n"
+            "print('progress=end', flush=True)\n"
+        )
+        percents = []
+
+        converter = VideoConverter()
+        returncode, stdout, stderr = await converter._run_with_progress(
+            [sys.executable, "-c", script],
+            progress_callback=percents.append,
+            total_duration=10.0,
+        )
+
+        assert returncode == 0
+        assert percents == [25.0, 50.0, 100.0]
+        assert "Input #0" in stderr
+
+    @pytest.mark.asyncio
+    async def test_run_with_progress_timeout_kills_process(self):
+        """Test that a stalled FFmpeg is killed on timeout."""
+        converter = VideoConverter()
+
+        with pytest.raises(asyncio.TimeoutError):
+            await converter._run_with_progress(
+                [sys.executable, "-c", "import time; time.sleep(30)"],
+                progress_callback=lambda p: None,
+                timeout=0.2,
+            )
+
+    @pytest.mark.asyncio
+    async def test_run_with_progress_timeout_terminates_first(self, tmp_path):
+        """Test that FFmpeg gets SIGTERM, so it can finalize, before SIGKILL."""
+        marker = tmp_path / "terminated"
+        script = (
+            "import signal, sys, time\n"
+            "def stop(*_):\n"
+            f"    open({str(marker)!r}, 'w').close()\n"
+            "    sys.exit(255)\n"
+            "signal.signal(signal.SIGTERM, stop)\n"
+            "print('ready', flush=True)\n"
+            "time.sleep(30)\n"
+        )
+        converter = VideoConverter()
+
+        with pytest.raises(asyncio.TimeoutError):
+            await converter._run_with_progress(
+                [sys.executable, "-c", script],
+                progress_callback=lambda p: None,
+                timeout=0.5,
+            )
+
+        assert marker.exists()
+
+    @pytest.mark.asyncio
+    async def test_probe_duration_is_cached(self, tmp_path):
+        """Test that ffprobe runs once per source file version."""
+        source = tmp_path / "clip.mp4"
+        source.write_bytes(b"fake")
+
+        with patch(
+            "src.converter.converters.video.safe_subprocess",
+            new_callable=AsyncMock,
+            return_value=(0, b"12.5\n", b""),
+        ) as mock_run:
+            assert await _probe_duration(source) == 12.5
+            assert await _probe_duration(source) == 12.5
+
+        mock_run.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_probe_duration_unknown(self, tmp_path):
+        """Test that an unknown duration is reported as None."""
+        source = tmp_path / "stream.mkv"
+        source.write_bytes(b"fake")
+
+        with patch(
+            "src.converter.converters.video.safe_subprocess",
+            new_callable=AsyncMock,
+            return_value=(0, b"N/A\n", b""),
+        ):
+            assert await _probe_duration(source) is None
+
     @pytest.mark.asyncio
     async def test_convert_unsupported_format(self):
         """Test conversion with unsupported format raises error."""
@@ -58,3 +171,130 @@ class TestVideoConverter:
             await converter.convert("test.mp4", "rm")
 
         assert "not supported" in str(exc_info.value).lower()
+
+
+class TestHardwareEncoding:
+    """Tests for hardware encoder selection."""
+
+    PRESET = {"crf": "23", "preset": "medium"}
+
+    def test_encoder_args(self):
+        """Test that quality presets map to each encoder's rate control."""
+        assert _encoder_args("libx264", self.PRESET) == ["-crf", "23", "-preset", "medium"]
+        assert _encoder_args("h264_nvenc", self.PRESET) == [
+            "-rc",
+            "vbr",
+            "-cq",
+            "23",
+            "-b:v",
+            "0",
+            "-preset",
+            "p4",
+        ]
+        assert _encoder_args("h264_vaapi", self.PRESET)[-2:] == ["-qp", "23"]
+        assert _encoder_args("h264_videotoolbox", self.PRESET) == ["-q:v", "64"]
+
+    def test_software_encoder_args(self):
+        """Test VP9 threading and SVT-AV1 preset mapping."""
+        vp9 = _encoder_args("libvpx-vp9", self.PRESET)
+        assert vp9[vp9.index("-b:v") + 1] == "0"
+        assert vp9[vp9.index("-row-mt") + 1] == "1"
+        assert "-preset" not in vp9
+        assert _encoder_args("libsvtav1", self.PRESET) == ["-crf", "23", "-preset", "8"]
+
+    def test_build_command_vaapi_device(self):
+        """Test that VAAPI encoding opens the render device before the input."""
+        converter = VideoConverter()
+        cmd = converter._build_ffmpeg_command(
+            Path("/tmp/in.mp4"), Path("/tmp/out.mp4"), "h264_vaapi", "aac", self.PRESET
+        )
+
+        assert cmd.index("-vaapi_device") < cmd.index("-i")
+        assert "-crf" not in cmd
+
+    @pytest.mark.asyncio
+    async def test_get_ffmpeg_encoders(self, monkeypatch):
+        """Test parsing of ffmpeg -encoders output."""
+        listing = (
+            "Encoders:\n"
+            " V..... = Video\n"
+            " ------\n"
+            " V....D libx264              libx264 H.264 / AVC\n"
+            " V....D h264_nvenc           NVIDIA NVENC H.264 encoder\n"
+            " A....D aac                  AAC (Advanced Audio Coding)\n"
+        )
+        monkeypatch.setattr("src.converter.converters.video._ffmpeg_encoders", None)
+
+        with patch(
+            "src.converter.converters.video.safe_subprocess",
+            new_callable=AsyncMock,
+            return_value=(0, listing, ""),
+        ):
+            encoders = await _get_ffmpeg_encoders()
+
+        assert {"libx264", "h264_nvenc", "aac"} <= encoders
+        assert "------" not in encoders
+
+    @pytest.mark.asyncio
+    async def test_convert_falls_back_to_software(self, tmp_path):
+        """Test that a failing hardware encoder is retried in software."""
+        converter = VideoConverter()
+        output = tmp_path / "out.mp4"
+
+        with patch(
+            "src.converter.converters.video._select_hw_encoder",
+            new_callable=AsyncMock,
+            return_value="h264_nvenc",
+        ):
+            with patch.object(
+                converter,
+                "_run_ffmpeg",
+                new_callable=AsyncMock,
+                side_effect=[(1, "[h264_nvenc] No capable devices found"), (0, "")],
+            ) as mock_run:
+                await converter.convert(tmp_path / "in.mp4", "mp4", output_path=output)
+
+        first_cmd, second_cmd = (c.args[0] for c in mock_run.await_args_list)
+        assert "h264_nvenc" in first_cmd
+        assert "libx264" in second_cmd
+
+    @pytest.mark.asyncio
+    async def test_convert_input_error_not_retried(self, tmp_path):
+        """Test that an input error under a hardware encoder is not re-run in software."""
+        converter = VideoConverter()
+
+        with patch(
+            "src.converter.converters.video._select_hw_encoder",
+            new_callable=AsyncMock,
+            return_value="h264_nvenc",
+        ):
+            with patch.object(
+                converter,
+                "_run_ffmpeg",
+                new_callable=AsyncMock,
+                return_value=(1, "in.mp4: Invalid data found when processing input"),
+            ) as mock_run:
+                with pytest.raises(ConversionError, match="FFmpeg conversion failed"):
+                    await converter.convert(
+                        tmp_path / "in.mp4", "mp4", output_path=tmp_path / "out.mp4"
+                    )
+
+        assert mock_run.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_convert_software_only(self, tmp_path):
+        """Test that hw=False skips hardware encoder selection."""
+        converter = VideoConverter()
+
+        with patch(
+            "src.converter.converters.video._select_hw_encoder", new_callable=AsyncMock
+        ) as mock_select:
+            with patch.object(
+                converter, "_run_ffmpeg", new_callable=AsyncMock, return_value=(0, "")
+            ) as mock_run:
+                await converter.convert(
+                    tmp_path / "in.mp4", "mp4", output_path=tmp_path / "out.mp4", hw=False
+                )
+
+        mock_select.assert_not_called()
+        assert "libx264" in mock_run.await_args.args[0]